@@ -0,0 +1,57 @@
+import argparse
+import sys
+from core.batch_runner import BatchRunner
+from utils.logger import logger
+from utils.tracing import tracer
+
+
+def main():
+    """
+    Lote de búsquedas con checkpoints: si se interrumpe, volver a ejecutar
+    el mismo comando continúa desde la última página guardada.
+
+    Uso:
+        python batch.py busquedas.txt                # una búsqueda por línea
+        python batch.py busquedas.json --max-pages 5
+        python batch.py busquedas.txt --reset        # ignora el progreso guardado
+    """
+    parser = argparse.ArgumentParser(description="Lote de búsquedas de LinkedIn Jobs")
+    parser.add_argument("specs_file", help="Archivo de búsquedas (.json, JSON lines o texto)")
+    parser.add_argument("--journal", default=None, help="Journal de progreso (BATCH_JOURNAL_FILE)")
+    parser.add_argument("--max-results", type=int, default=None)
+    parser.add_argument("--max-pages", type=int, default=None)
+    parser.add_argument("--reset", action="store_true", help="Empieza el lote de cero")
+    args = parser.parse_args()
+
+    runner = BatchRunner(
+        BatchRunner.load_specs(args.specs_file),
+        journal_file=args.journal,
+        max_results=args.max_results,
+        max_pages=args.max_pages,
+    )
+    if args.reset:
+        runner.journal.reset()
+
+    logger.raw("\n" + "=" * 80)
+    logger.raw(f"🚀 LINKEDIN JOBS - LOTE DE {len(runner.specs)} BÚSQUEDAS")
+    logger.raw("=" * 80 + "\n")
+
+    try:
+        summary = runner.run()
+    except KeyboardInterrupt:
+        logger.error("\n⚠️  Lote interrumpido - el progreso quedó guardado")
+        return 1
+    finally:
+        tracer.finish(logger)
+
+    logger.raw("\n" + "=" * 80)
+    logger.info(
+        f"📦 {summary['done']} completadas, {summary['skipped']} ya hechas, "
+        f"{summary['failed']} fallidas - {summary['new_jobs']} empleos nuevos"
+    )
+    logger.raw("=" * 80 + "\n")
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
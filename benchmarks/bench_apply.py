@@ -0,0 +1,123 @@
+"""
+Benchmark: postulaciones con EasyApplyEngine contra el modal de Easy Apply
+del sitio local.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_apply --jobs 6
+
+Levanta el sitio local (vista /jobs/view/<id>/ con un modal de tres pasos
+que, como React, solo acepta valores que llegan con eventos input/change)
+y, en un Chrome headless, postula a los empleos con Easy Apply usando un
+AnswerCache temporal. Las preguntas guardadas difieren de las del
+formulario solo en mayúsculas y signos (misma pregunta normalizada); con
+--unknown, el período de preaviso se guarda con otra redacción (solo una
+sugerencia) y el empleo debe ir a la cola de revisión sin enviarse.
+
+Reporta segundos por postulación y llamadas al navegador por paso, y
+verifica que el servidor recibió exactamente las respuestas esperadas
+(código 1 si no). El regulador de ritmo se desactiva.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from config.settings import settings
+from core.answer_cache import AnswerCache
+from core.easy_apply import EasyApplyEngine
+from core.review_queue import ReviewQueue
+from utils.rate_governor import rate_governor
+from utils.web_driver import WebDriverManager
+
+
+# Mismas preguntas que el formulario, escritas con otras mayúsculas y signos
+ANSWERS = {
+    "mobile phone number": "600 000 000",
+    "How many years of work experience do you have with Python": "5",
+    "ARE YOU LEGALLY AUTHORIZED TO WORK IN SPAIN": "yes",
+    "What is your notice period? *": "1 month",
+}
+EXPECTED = {"phone": "600 000 000", "years": "5", "authorized": "Yes", "notice": "1 month"}
+
+
+class CountingDriver:
+    """Cuenta execute_script / execute_async_script del driver envuelto"""
+
+    def __init__(self, driver):
+        self._driver = driver
+        self.scripts = 0
+
+    def execute_script(self, *args):
+        self.scripts += 1
+        return self._driver.execute_script(*args)
+
+    def execute_async_script(self, *args):
+        self.scripts += 1
+        return self._driver.execute_async_script(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=6, help="empleos con Easy Apply")
+    parser.add_argument("--render-ms", type=int, default=100, help="demora de cada paso del modal")
+    parser.add_argument("--unknown", action="store_true", help="omite una respuesta (cola de revisión)")
+    args = parser.parse_args()
+
+    # En el sitio local uno de cada tres empleos tiene Easy Apply
+    job_ids = [str(4000000000 - index * 3) for index in range(args.jobs)]
+    answers = dict(ANSWERS)
+    if args.unknown:
+        answers["What was your notice period"] = answers.pop("What is your notice period? *")
+
+    server = FixtureServer(detail_ms=50, detail_render_ms=50, apply_render_ms=args.render_ms)
+    manager = WebDriverManager(headless=True)
+    with server, tempfile.TemporaryDirectory() as directory:
+        settings.BASE_URL = server.base_url
+        rate_governor.disable()
+        answers_file = os.path.join(directory, "answers.json")
+        with open(answers_file, "w", encoding="utf-8") as file:
+            json.dump(answers, file)
+
+        driver = CountingDriver(manager.setup_driver())
+        try:
+            engine = EasyApplyEngine(driver, AnswerCache(answers_file),
+                                     ReviewQueue(os.path.join(directory, "review.jsonl")), dry_run=False)
+            reports = []
+            started_at = time.perf_counter()
+            for job_id in job_ids:
+                reports.append(engine.apply(job_id))
+            elapsed = time.perf_counter() - started_at
+            queued = engine.review_queue.pending_questions(AnswerCache.normalize)
+        finally:
+            manager.teardown_driver()
+
+    print(f"\n{'empleo':<12} {'resultado':<10} {'pasos':>6} {'segundos':>9}")
+    print("─" * 40)
+    for report in reports:
+        print(f"{report.job_id:<12} {report.outcome:<10} {report.steps:>6} {report.elapsed:>9.2f}")
+
+    steps = sum(report.steps for report in reports) or 1
+    print(f"\n{elapsed / max(1, len(reports)):.2f} s/postulación, {driver.scripts / steps:.1f} scripts/paso, "
+          f"{len(queued)} preguntas en revisión")
+
+    sent = {application["jobId"]: application["answers"] for application in server.applications}
+    ok = True
+    for report in reports:
+        if args.unknown:
+            ok = ok and report.outcome == EasyApplyEngine.REVIEW
+        else:
+            received = sent.get(report.job_id, {})
+            ok = ok and report.outcome == EasyApplyEngine.APPLIED and all(
+                received.get(name) == value for name, value in EXPECTED.items())
+    print("✓ respuestas correctas" if ok else "✗ resultados inesperados")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
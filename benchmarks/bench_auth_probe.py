@@ -0,0 +1,62 @@
+"""
+Benchmark: sondeo de sesión (SessionManager.probe_auth) contra el sitio local.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_auth_probe --runs 20
+
+Casos: sesión válida, token rechazado por el servidor (redirección a
+/login), cookie de auth vencida y sin cookies. Para cada caso muestra el
+resultado del sondeo y su tiempo medio; no abre ningún navegador.
+El regulador de ritmo se desactiva: se mide el sondeo, no las pausas.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from config.settings import settings
+from core.session_manager import SessionManager
+from utils.rate_governor import rate_governor
+
+
+def build_session(directory, name, token, expires):
+    manager = SessionManager(os.path.join(directory, f"{name}.json"))
+    cookies = []
+    if token is not None:
+        cookies.append({"name": settings.AUTH_COOKIE_NAME, "value": token,
+                        "domain": "127.0.0.1", "path": "/", "expires": expires})
+    manager._write(cookies)
+    return manager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with FixtureServer() as server, tempfile.TemporaryDirectory() as directory:
+        settings.AUTH_PROBE_URL = server.url("/feed/")
+        rate_governor.disable()
+        future = time.time() + 3600
+        cases = {
+            "sesión válida": build_session(directory, "valid", server.valid_token, future),
+            "token rechazado": build_session(directory, "rejected", "stale-token", future),
+            "cookie vencida": build_session(directory, "expired", server.valid_token, time.time() - 60),
+            "sin cookies": build_session(directory, "missing", None, None),
+        }
+
+        print(f"\n{'caso':<18} {'resultado':<12} {'fuente':<8} {'media':>9} {'max':>9}")
+        print("─" * 60)
+        for name, manager in cases.items():
+            timings = []
+            for _ in range(args.runs):
+                result = manager.probe_auth(http_check=True)
+                timings.append(manager.last_probe["elapsed_ms"])
+            print(f"{name:<18} {result:<12} {manager.last_probe['source']:<8} "
+                  f"{statistics.mean(timings):>7.1f}ms {max(timings):>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark: tarjetas de resultados desde el DOM vs desde la API (NetworkCapture),
+sobre el FakeDriver (sin navegador, con reloj virtual).
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_capture --results 100 --iterations 50
+
+Los resultados guionados traen las tarjetas con carga diferida (como
+LinkedIn) y, además, la respuesta JSON de la API de tarjetas en el mismo
+formato que sirve benchmarks/fixture_server.py. Se recorre la búsqueda
+con JobsPage.iter_results en dos modos:
+
+- dom: extracción + scroll de la lista hasta el fondo en cada página
+- api: tarjetas decodificadas de las respuestas capturadas
+
+Reporta µs reales, ms virtuales (esperas que habría en un navegador) y
+viajes al navegador por recorrido, y el costo de decodificar una página
+de JSON. Ambos modos deben producir exactamente las mismas JobCard que
+el sitio; si no, el comando termina con código 1.
+
+Con Chrome, el mismo camino se mide contra el sitio local con
+python -m benchmarks.bench_flow (y --no-capture para el DOM).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.fake_driver import FakeDriver, FakeElement, FakePage, FakeSite
+from benchmarks.fixture_server import FixtureServer
+from config.settings import settings
+from core.network_capture import NetworkCapture
+from core.search_spec import SearchSpec
+from pages.job_card import JobCard
+from pages.jobs_page import JobsPage
+from utils.clock import VirtualClock
+from utils.log_sinks import ConsoleSink
+from utils.logger import logger
+from utils.rate_governor import rate_governor
+from utils.selector_registry import selector_registry
+
+
+def build_site(fixture, keywords, lazy_chunk, lazy_delay):
+    """Resultados paginados: tarjetas en el DOM y la respuesta de la API de cada página"""
+    page_size = fixture.PAGE_SIZE
+
+    def results(driver, url):
+        query = dict(part.split("=", 1) for part in url.split("?", 1)[-1].split("&") if "=" in part)
+        start = int(query.get("start", 0))
+        jobs, total = fixture.search_jobs(keywords, start)
+        cards = [[job["id"], job["title"], job["company"], job["location"], job["posted"], job["easy_apply"]]
+                 for job in jobs]
+        pages = (total + page_size - 1) // page_size
+        base = url.split("&start=")[0]
+        api = f"/voyager/api/voyagerJobsDashJobCards?q=jobSearch&count={page_size}&start={start}"
+        return FakePage(
+            [FakeElement(".jobs-search-results-list")],
+            cards=cards, lazy_chunk=lazy_chunk, lazy_delay=lazy_delay,
+            pagination={page: f"{base}&start={(page - 1) * page_size}" for page in range(2, pages + 1)},
+            load_time=0.2, title="Search",
+            responses=[(api, fixture.voyager_job_cards(keywords, start))],
+        )
+
+    return FakeSite().route("/jobs/search/", results)
+
+
+def crawl(page, spec, max_results, capture):
+    if capture:
+        capture.reset()
+    if not page.open_search(spec):
+        return []
+    return list(page.iter_results(max_results, 0, capture=capture))
+
+
+def measure(name, iterations, clock, driver, operation, check):
+    """Ejecuta operation() N veces; retorna la fila de la tabla y si el resultado fue el esperado"""
+    trips_before = driver.round_trips()
+    virtual_before = clock.now()
+    started_at = time.perf_counter()
+    ok = True
+    for _ in range(iterations):
+        ok = check(operation()) and ok
+    real = time.perf_counter() - started_at
+    return {
+        "name": name,
+        "us": real / iterations * 1_000_000,
+        "virtual_ms": (clock.now() - virtual_before) / iterations * 1000,
+        "trips": (driver.round_trips() - trips_before) / iterations,
+        "ok": ok,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--results", type=int, default=100, help="empleos de la búsqueda")
+    parser.add_argument("--lazy-chunk", type=int, default=7)
+    parser.add_argument("--lazy-delay", type=float, default=0.15)
+    args = parser.parse_args()
+
+    clock = VirtualClock()
+    settings.WAIT_POLICY.clock = clock
+    rate_governor.disable(clock=clock)
+    logger.sinks = [ConsoleSink(stream=open(os.devnull, "w"))]
+    selector_registry.stats_file = os.path.join(tempfile.mkdtemp(), "selector_stats.json")
+    selector_registry.reset()
+
+    keywords = "Python Developer"
+    fixture = FixtureServer(total_results=args.results)
+    expected = [JobCard.from_row([job["id"], job["title"], job["company"], job["location"],
+                                  job["posted"], job["easy_apply"]])
+                for start in range(0, args.results, fixture.PAGE_SIZE)
+                for job in fixture.search_jobs(keywords, start)[0]]
+
+    driver = FakeDriver(build_site(fixture, keywords, args.lazy_chunk, args.lazy_delay), clock)
+    page = JobsPage(driver)
+    spec = SearchSpec(keywords)
+    payload = fixture.voyager_job_cards(keywords, 0)
+    posting = fixture.voyager_job_posting(expected[0].job_id)
+    decode_iterations = args.iterations * 20
+
+    rows = [
+        measure(f"dom ({args.results} empleos)", args.iterations, clock, driver,
+                lambda: crawl(page, spec, args.results, None), lambda cards: cards == expected),
+    ]
+    # La captura se suscribe recién ahora: el modo dom no paga su costo
+    capture = NetworkCapture(driver, clock)
+    rows += [
+        measure(f"api ({args.results} empleos)", args.iterations, clock, driver,
+                lambda: crawl(page, spec, args.results, capture), lambda cards: cards == expected),
+        measure("decodificar página (25)", decode_iterations, clock, driver,
+                lambda: NetworkCapture.decode_job_cards(payload),
+                lambda cards: cards == expected[:fixture.PAGE_SIZE]),
+        measure("decodificar detalle", decode_iterations, clock, driver,
+                lambda: NetworkCapture.decode_job_posting(posting),
+                lambda detail: detail is not None and detail.description
+                and detail.company == fixture.job_posting(expected[0].job_id)["company"]),
+    ]
+
+    print(f"\n{'caso':<26} {'µs/op':>10} {'ms virt.':>10} {'viajes':>8}  ok")
+    print("─" * 62)
+    for row in rows:
+        print(f"{row['name']:<26} {row['us']:>10.1f} {row['virtual_ms']:>10.1f} "
+              f"{row['trips']:>8.1f}  {'✓' if row['ok'] else '✗'}")
+    print(f"\ncapturadas: {capture.stats['cards']} tarjetas, {capture.stats['errors']} errores")
+    return 0 if all(row["ok"] for row in rows) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+Benchmark: lectura del detalle de empleos con DetailFetcher y N pestañas.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_details --jobs 24 --concurrency 1,2,4,6
+
+Levanta el sitio local (vista /jobs/view/<id>/ con demora del servidor y
+descripción hidratada en el cliente) y, en un Chrome headless, lee los
+mismos empleos con cada nivel de concurrencia. Reporta empleos por
+segundo, milisegundos por empleo, fallos y la aceleración respecto de
+una sola pestaña. El regulador de ritmo se desactiva.
+"""
+import argparse
+
+from benchmarks.fixture_server import FixtureServer
+from config.settings import settings
+from core.detail_fetcher import DetailFetcher
+from utils.rate_governor import rate_governor
+from utils.web_driver import WebDriverManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=24)
+    parser.add_argument("--concurrency", default="1,2,4,6", help="niveles separados por coma")
+    parser.add_argument("--detail-ms", type=int, default=300, help="demora del servidor por detalle")
+    parser.add_argument("--render-ms", type=int, default=200, help="demora de la hidratación en el cliente")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+    job_ids = [str(4000000000 - index) for index in range(args.jobs)]
+
+    server = FixtureServer(detail_ms=args.detail_ms, detail_render_ms=args.render_ms)
+    manager = WebDriverManager(headless=True)
+    with server:
+        settings.BASE_URL = server.base_url
+        rate_governor.disable()
+        driver = manager.setup_driver()
+        try:
+            driver.get(server.url("/feed/"))
+            print(f"\n{'pestañas':>8} {'empleos/s':>10} {'ms/empleo':>10} {'fallos':>7} {'aceleración':>12}")
+            print("─" * 52)
+            base = None
+            for level in levels:
+                fetcher = DetailFetcher(driver, concurrency=level)
+                details = list(fetcher.fetch(job_ids))
+                complete = sum(1 for detail in details if detail.description)
+                stats = fetcher.stats()
+                base = base or stats["per_second"]
+                speedup = stats["per_second"] / base if base else 0.0
+                print(f"{level:>8} {stats['per_second']:>10.2f} "
+                      f"{stats['elapsed'] * 1000 / max(1, len(job_ids)):>10.0f} "
+                      f"{len(job_ids) - complete:>7} {speedup:>11.2f}x")
+        finally:
+            manager.teardown_driver()
+
+
+if __name__ == "__main__":
+    main()
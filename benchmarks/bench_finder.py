@@ -0,0 +1,168 @@
+"""
+Microbenchmark: ElementFinder, BasePage y JobsPage sobre el FakeDriver
+(sin navegador, con reloj virtual).
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_finder --iterations 2000
+
+Cada caso se repite N veces y reporta el costo en Python por operación
+(µs reales), el tiempo simulado que habría esperado en un navegador
+(ms virtuales) y los viajes al navegador por operación. Como el DOM es
+guionado, cada caso verifica además su resultado: un cambio que rompa
+la lógica (no solo la haga más lenta) termina con código 1.
+
+Los logs se escriben a /dev/null: se mide su costo, no la terminal.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.fake_driver import FakeDriver, FakeElement, FakePage, FakeSite
+from config.settings import settings
+from core.search_spec import SearchSpec
+from pages.jobs_page import JobsPage
+from utils.clock import VirtualClock
+from utils.log_sinks import ConsoleSink
+from utils.logger import logger
+from utils.rate_governor import rate_governor
+from utils.selector_registry import selector_registry
+
+
+AUTH_COOKIE = "li_at"
+
+
+def build_site(total_results, lazy_chunk, lazy_delay):
+    """LinkedIn guionado: /jobs/ (login o buscador), /feed/ y resultados paginados"""
+    page_size = 25
+
+    def login(driver, element):
+        driver.add_cookie({"name": AUTH_COOKIE, "value": "fake-session"})
+        driver.get("/feed/")
+
+    def jobs(driver, url):
+        if AUTH_COOKIE in driver.cookies:
+            return FakePage([FakeElement('[placeholder="Title, skill or Company"]', tag_name="input")],
+                            title="Jobs")
+        return FakePage([
+            FakeElement('form[data-id="sign-in-form"]', tag_name="form"),
+            FakeElement('[name="session_key"]', tag_name="input"),
+            FakeElement('[name="session_password"]', tag_name="input"),
+            FakeElement('[data-id="sign-in-form__submit-btn"][type="submit"]', tag_name="button",
+                        on_click=login),
+        ], title="Login")
+
+    def results(driver, url):
+        if AUTH_COOKIE not in driver.cookies:
+            return FakePage(redirect="/login")
+        query = dict(part.split("=", 1) for part in url.split("?", 1)[-1].split("&") if "=" in part)
+        start = int(query.get("start", 0))
+        cards = [[str(4000000000 - index), f"Job #{index + 1}", f"Empresa {index % 7}", "Madrid",
+                  "2024-01-01", index % 3 == 0]
+                 for index in range(start, min(total_results, start + page_size))]
+        pages = (total_results + page_size - 1) // page_size
+        base = url.split("&start=")[0]
+        return FakePage(
+            [FakeElement(".jobs-search-results-list")],
+            cards=cards, lazy_chunk=lazy_chunk, lazy_delay=lazy_delay,
+            pagination={page: f"{base}&start={(page - 1) * page_size}" for page in range(2, pages + 1)},
+            load_time=0.2, title="Search",
+        )
+
+    return (FakeSite()
+            .route("/jobs/", jobs)
+            .route("/jobs/search/", results)
+            .route("/feed/", FakePage(title="Feed"))
+            .route("/login", jobs))
+
+
+def measure(name, iterations, clock, driver, operation, check):
+    """Ejecuta operation() N veces; retorna la fila de la tabla y si el resultado fue el esperado"""
+    trips_before = driver.round_trips()
+    virtual_before = clock.now()
+    started_at = time.perf_counter()
+    ok = True
+    for _ in range(iterations):
+        ok = check(operation()) and ok
+    real = time.perf_counter() - started_at
+    return {
+        "name": name,
+        "us": real / iterations * 1_000_000,
+        "virtual_ms": (clock.now() - virtual_before) / iterations * 1000,
+        "trips": (driver.round_trips() - trips_before) / iterations,
+        "ok": ok,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--results", type=int, default=100, help="empleos del recorrido de resultados")
+    parser.add_argument("--lazy-chunk", type=int, default=7)
+    parser.add_argument("--lazy-delay", type=float, default=0.15)
+    args = parser.parse_args()
+
+    clock = VirtualClock()
+    settings.WAIT_POLICY.clock = clock
+    rate_governor.disable(clock=clock)
+    devnull = open(os.devnull, "w")
+    logger.sinks = [ConsoleSink(stream=devnull)]
+    # Estadísticas de selectores en un directorio temporal (no tocar data/)
+    selector_registry.stats_file = os.path.join(tempfile.mkdtemp(), "selector_stats.json")
+    selector_registry.reset()
+    selector_registry.register("dead_first", [".selector-muerto", '[name="session_key"]'])
+
+    driver = FakeDriver(build_site(args.results, args.lazy_chunk, args.lazy_delay), clock)
+    page = JobsPage(driver)
+    finder = page.finder
+    spec = SearchSpec("Python Developer")
+    many = max(1, args.iterations // 20)
+
+    driver.get("/jobs/")
+    rows = [
+        measure("find_element (existe)", args.iterations, clock, driver,
+                lambda: finder.find_element(page.EMAIL_SELECTOR), lambda element: element is not None),
+        measure("find_element (no existe, 1s)", many, clock, driver,
+                lambda: finder.find_element(".no-existe", timeout=1), lambda element: element is None),
+        measure("find_element (registro)", args.iterations, clock, driver,
+                lambda: finder.find_element("email_field"), lambda element: element is not None),
+        measure("registro, 1er candidato muerto", args.iterations, clock, driver,
+                lambda: finder.find_element("dead_first"),
+                lambda element: element is not None
+                and selector_registry.candidates("dead_first")[0] == '[name="session_key"]'),
+        measure("probe (4 selectores)", args.iterations, clock, driver,
+                lambda: finder.probe([page.LOGIN_FORM_SELECTOR, page.EMAIL_SELECTOR,
+                                      page.PASSWORD_SELECTOR, page.JOBS_INDICATOR]),
+                lambda result: result[page.LOGIN_FORM_SELECTOR]),
+        measure("is_login_form_present", args.iterations, clock, driver,
+                page.is_login_form_present, lambda present: present is True),
+        measure("navigate_to_jobs", many, clock, driver,
+                page.navigate_to_jobs, lambda result: page.last_readiness.ready),
+    ]
+
+    page.perform_login("user@example.com", "password")
+    rows += [
+        measure("open_search", many, clock, driver,
+                lambda: page.open_search(spec), lambda success: success is True),
+        measure(f"iter_results ({args.results} empleos)", max(1, many // 10), clock, driver,
+                lambda: page.open_search(spec) and list(page.iter_results(args.results, 0)),
+                lambda cards: len(cards or []) == args.results),
+    ]
+    logger.flush()
+
+    print(f"\n{'caso':<32} {'µs/op':>10} {'ms virt/op':>11} {'viajes/op':>10} {'resultado':>10}")
+    print("─" * 78)
+    for row in rows:
+        print(f"{row['name']:<32} {row['us']:>10.1f} {row['virtual_ms']:>11.1f} {row['trips']:>10.1f} "
+              f"{'ok' if row['ok'] else 'FALLO':>10}")
+
+    failed = [row["name"] for row in rows if not row["ok"]]
+    if failed:
+        print(f"\nResultados inesperados: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
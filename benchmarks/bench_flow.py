@@ -0,0 +1,192 @@
+"""
+Benchmark: flujo completo de NavigationManager contra el LinkedIn simulado.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_flow --runs 3
+    python -m benchmarks.bench_flow --runs 5 --update-baseline
+
+Levanta el sitio local (benchmarks/fixture_server.py) con login, /jobs/ y
+resultados con carga diferida, apunta la configuración a él y ejecuta en
+Chrome headless dos escenarios:
+
+- login: sin cookies (pasos 1-6 y recorrido de resultados)
+- cookies: con la sesión guardada por el escenario anterior
+
+Reporta la mediana del tiempo real de cada paso (spans "step" del
+trazador) y la compara con la línea base JSON (--baseline). Un paso más
+lento que la base en más de --tolerance (y de --min-delta ms) cuenta como
+regresión y el comando termina con código 1. La línea base solo se
+escribe con --update-baseline, con las medidas de esta máquina; sin ella
+(y sin --update-baseline) el comando falla antes de abrir Chrome.
+
+El regulador de ritmo se desactiva: se mide el flujo, no las pausas.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from config.settings import settings
+from core.job_store import JobStore
+from core.navigation_manager import NavigationManager
+from core.search_spec import SearchSpec
+from core.session_manager import SessionManager
+from utils.rate_governor import rate_governor
+from utils.selector_registry import selector_registry
+from utils.tracing import tracer
+from utils.web_driver import WebDriverManager
+
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baselines", "flow.json")
+
+
+def configure(server, directory):
+    """Apunta la configuración al sitio local"""
+    settings.BASE_URL = server.base_url
+    settings.JOBS_URL = server.url("/jobs/")
+    settings.LOGIN_URL = server.url("/login")
+    settings.AUTH_PROBE_URL = server.url("/feed/")
+    settings.COOKIE_DOMAIN = server.host
+    settings.EMAIL = server.email
+    settings.PASSWORD = server.password
+    settings.COOKIES_FILE = os.path.join(directory, "session.json")
+    selector_registry.stats_file = os.path.join(directory, "selector_stats.json")
+
+    # Sin pausas entre acciones
+    rate_governor.disable()
+    tracer.enabled = True
+
+
+def run_flow(directory, spec, max_results, run):
+    """Una ejecución del flujo: tiempos por paso (ms) y empleos guardados"""
+    tracer.reset()
+    manager = WebDriverManager(headless=True)
+    started_at = time.perf_counter()
+    driver = manager.setup_driver()
+    timings = {"arranque": (time.perf_counter() - started_at) * 1000}
+
+    job_store = JobStore(os.path.join(directory, f"jobs_{run}.db"))
+    try:
+        navigation = NavigationManager(driver, SessionManager(), job_store)
+        started_at = time.perf_counter()
+        success = navigation.go_to_jobs_and_search(spec)
+        if success:
+            navigation.crawl_results(max_results=max_results)
+        timings["total"] = (time.perf_counter() - started_at) * 1000
+        stored = job_store.count()
+    finally:
+        job_store.close()
+        manager.teardown_driver()
+
+    for span in tracer.spans:
+        if span.category in ("step", "results"):
+            timings[span.name] = timings.get(span.name, 0) + span.duration * 1000
+    return success, timings, stored
+
+
+def run_scenario(name, directory, spec, args):
+    """Mediana por paso de varias ejecuciones de un escenario"""
+    samples, stored, failures = {}, 0, 0
+    for run in range(args.runs):
+        if name == "login" and os.path.exists(settings.COOKIES_FILE):
+            os.remove(settings.COOKIES_FILE)
+        success, timings, stored = run_flow(directory, spec, args.max_results, f"{name}_{run}")
+        failures += not success
+        for step, value in timings.items():
+            samples.setdefault(step, []).append(value)
+    medians = {step: statistics.median(values) for step, values in samples.items()}
+    return medians, stored, failures
+
+
+def compare(results, baseline, tolerance, min_delta):
+    """Imprime la tabla y retorna la cantidad de regresiones"""
+    regressions = 0
+    print(f"\n{'escenario':<10} {'paso':<16} {'mediana':>10} {'base':>10} {'Δ':>8}")
+    print("─" * 60)
+    for scenario, steps in results.items():
+        base_steps = baseline.get(scenario, {})
+        for step, value in steps.items():
+            base = base_steps.get(step)
+            if base is None:
+                print(f"{scenario:<10} {step:<16} {value:>8.0f}ms {'-':>10} {'':>8}")
+                continue
+            delta = (value - base) / base if base else 0.0
+            regressed = delta > tolerance and value - base > min_delta
+            regressions += regressed
+            flag = "  ⚠️  regresión" if regressed else ""
+            print(f"{scenario:<10} {step:<16} {value:>8.0f}ms {base:>8.0f}ms {delta:>+7.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--query", default="Python Developer")
+    parser.add_argument("--results", type=int, default=60, help="empleos que devuelve el sitio local")
+    parser.add_argument("--max-results", type=int, default=50)
+    parser.add_argument("--latency", type=int, default=20, help="latencia por petición (ms)")
+    parser.add_argument("--lazy-ms", type=int, default=150, help="demora de la carga diferida (ms)")
+    parser.add_argument("--no-capture", action="store_true", help="tarjetas solo desde el DOM (sin NetworkCapture)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="regresión relativa tolerada (0.2 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=50, help="diferencia mínima (ms) para contar regresión")
+    args = parser.parse_args()
+
+    # Sin línea base no hay comparación: fallar antes de gastar minutos en Chrome
+    if not args.update_baseline and not os.path.exists(args.baseline):
+        print(f"❌ Sin línea base en {args.baseline}: crearla con --update-baseline "
+              f"(medidas de esta máquina) o indicar otra con --baseline", file=sys.stderr)
+        return 1
+
+    server = FixtureServer(latency_ms=args.latency, total_results=args.results, lazy_ms=args.lazy_ms)
+    with server, tempfile.TemporaryDirectory() as directory:
+        configure(server, directory)
+        settings.NETWORK_CAPTURE = not args.no_capture
+        spec = SearchSpec(args.query)
+
+        results, summary = {}, []
+        for scenario in ("login", "cookies"):
+            medians, stored, failures = run_scenario(scenario, directory, spec, args)
+            results[scenario] = medians
+            summary.append(f"{scenario}: {stored} empleos guardados, {failures} ejecuciones fallidas")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file).get("scenarios", {})
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta)
+    print("\n" + "\n".join(summary))
+
+    if args.update_baseline:
+        directory = os.path.dirname(args.baseline)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump({
+                "runs": args.runs,
+                "latency_ms": args.latency,
+                "lazy_ms": args.lazy_ms,
+                "scenarios": {scenario: {step: round(value, 1) for step, value in steps.items()}
+                              for scenario, steps in results.items()},
+            }, file, indent=2, ensure_ascii=False)
+        print(f"Línea base actualizada: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"❌ La línea base {args.baseline} no tiene escenarios (regenerarla con --update-baseline)",
+              file=sys.stderr)
+        return 1
+    if regressions:
+        print(f"{regressions} pasos con regresión (tolerancia {args.tolerance:.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark: simulación del RateGovernor con reloj virtual (sin navegador).
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_governor --actions 2000 --per-hour 240 --per-day 1500
+
+1. Agenda: ejecuta N acciones seguidas y reporta cuántas caben en la
+   primera hora y el primer día, el tiempo simulado total y el tiempo
+   real que tardó la simulación.
+2. Prioridades: varios hilos esperan a la vez con prioridades distintas;
+   muestra en qué orden obtuvieron turno.
+"""
+import argparse
+import random
+import threading
+import time
+
+from utils.clock import VirtualClock
+from utils.rate_governor import RateGovernor
+
+
+def max_in_window(times, period):
+    """Máximo de acciones en cualquier ventana de period segundos"""
+    best, start = 0, 0
+    for end, moment in enumerate(times):
+        while times[start] <= moment - period:
+            start += 1
+        best = max(best, end - start + 1)
+    return best
+
+
+def simulate_schedule(args):
+    clock = VirtualClock()
+    governor = RateGovernor(args.per_hour, args.per_day, args.min_interval, args.jitter, args.burst,
+                            clock=clock, rng=random.Random(args.seed))
+    started_at = time.perf_counter()
+    times = []
+    for _ in range(args.actions):
+        governor.acquire("navigate")
+        times.append(clock.now())
+    real_ms = (time.perf_counter() - started_at) * 1000
+
+    print(f"\nAgenda de {args.actions} acciones "
+          f"({args.per_hour}/h, {args.per_day}/día, separación {args.min_interval}s + jitter {args.jitter}s)")
+    print("─" * 60)
+    print(f"{'primera hora':<28} {sum(1 for t in times if t < 3600):>10} acciones")
+    print(f"{'primer día':<28} {sum(1 for t in times if t < 86400):>10} acciones")
+    print(f"{'máximo en una hora':<28} {max_in_window(times, 3600):>10} acciones")
+    print(f"{'máximo en 24 h':<28} {max_in_window(times, 86400):>10} acciones")
+    print(f"{'tiempo simulado':<28} {times[-1] / 3600:>10.2f} h")
+    print(f"{'tiempo real':<28} {real_ms:>10.1f} ms")
+
+
+def simulate_priorities(args):
+    clock = VirtualClock(settle=0.002)
+    governor = RateGovernor(per_hour=0, per_day=0, min_interval=1.0, jitter=0, clock=clock)
+    order = []
+    lock = threading.Lock()
+
+    # Una acción en curso obliga a las demás a encolarse
+    governor.acquire("busy")
+
+    def worker(name, priority):
+        governor.acquire(name, priority)
+        with lock:
+            order.append(name)
+
+    workers = [("paginar", RateGovernor.PRIORITY_LOW)] * 4 + [("buscar", RateGovernor.PRIORITY_NORMAL)] * 3
+    workers += [("postular", RateGovernor.PRIORITY_HIGH)] * 2
+    threads = [threading.Thread(target=worker, args=item) for item in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print("\nOrden de turnos con cola de prioridad")
+    print("─" * 60)
+    print(" → ".join(order))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actions", type=int, default=2000)
+    parser.add_argument("--per-hour", type=int, default=240)
+    parser.add_argument("--per-day", type=int, default=1500)
+    parser.add_argument("--min-interval", type=float, default=1.0)
+    parser.add_argument("--jitter", type=float, default=1.5)
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    simulate_schedule(args)
+    simulate_priorities(args)
+
+
+if __name__ == "__main__":
+    main()
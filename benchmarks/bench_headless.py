@@ -0,0 +1,119 @@
+"""
+Benchmark: memoria y CPU de Chrome en modo con ventana vs headless.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_headless --loads 5
+
+Para cada modo abre un Chrome, carga la página /resources del sitio local
+varias veces y mide el árbol de procesos de Chrome: RSS total (MB) y
+tiempo de CPU (s). Usa psutil si está instalado; si no, lee /proc (Linux).
+El modo con ventana necesita pantalla; sin ella se reporta como no disponible.
+"""
+import argparse
+import os
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from utils.page_readiness import ReadinessEngine
+from utils.web_driver import WebDriverManager
+
+
+def _children_proc(pid):
+    """Descendientes de un proceso leyendo /proc (Linux)"""
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as file:
+                # El nombre va entre paréntesis y puede tener espacios
+                fields = file.read().rsplit(")", 1)[1].split()
+            parents.setdefault(int(fields[1]), []).append(int(entry))
+        except (OSError, IndexError):
+            continue
+
+    found, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        for child in parents.get(current, []):
+            found.append(child)
+            pending.append(child)
+    return found
+
+
+def _stats_proc(pids):
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    ticks = os.sysconf("SC_CLK_TCK")
+    rss = cpu = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/statm") as file:
+                rss += int(file.read().split()[1]) * page_size
+            with open(f"/proc/{pid}/stat") as file:
+                fields = file.read().rsplit(")", 1)[1].split()
+                cpu += (int(fields[11]) + int(fields[12])) / ticks
+        except (OSError, IndexError, ValueError):
+            continue
+    return rss, cpu
+
+
+def process_tree_stats(root_pid):
+    """(RSS en bytes, CPU en segundos) de todos los procesos bajo root_pid"""
+    try:
+        import psutil
+    except ImportError:
+        return _stats_proc(_children_proc(root_pid))
+
+    rss = cpu = 0
+    for process in psutil.Process(root_pid).children(recursive=True):
+        try:
+            rss += process.memory_info().rss
+            times = process.cpu_times()
+            cpu += times.user + times.system
+        except psutil.Error:
+            continue
+    return rss, cpu
+
+
+def measure(headless, url, loads):
+    manager = WebDriverManager(headless=headless)
+    started_at = time.monotonic()
+    driver = manager.setup_driver()
+    try:
+        engine = ReadinessEngine(driver)
+        for _ in range(loads):
+            engine.begin_navigation()
+            driver.get(url)
+            engine.wait()
+        wall = time.monotonic() - started_at
+        rss, cpu = process_tree_stats(driver.service.process.pid)
+        return {"rss_mb": rss / (1024 * 1024), "cpu_s": cpu, "wall_s": wall}
+    finally:
+        manager.teardown_driver()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--loads", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    with FixtureServer() as server:
+        url = server.url("/resources?images=20&size=50000&asset_delay=50")
+        for name, headless in (("con ventana", False), ("headless", True)):
+            try:
+                results[name] = measure(headless, url, args.loads)
+            except Exception as e:
+                results[name] = {"error": str(e).splitlines()[0] if str(e) else type(e).__name__}
+
+    print(f"\n{'modo':<12} {'RSS (MB)':>10} {'CPU (s)':>9} {'total (s)':>10}")
+    print("─" * 45)
+    for name, data in results.items():
+        if "error" in data:
+            print(f"{name:<12} no disponible: {data['error']}")
+        else:
+            print(f"{name:<12} {data['rss_mb']:>10.1f} {data['cpu_s']:>9.2f} {data['wall_s']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: espera fija (load + sleep 2s) vs motor de página lista.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_readiness --runs 5 --asset-delay 300 --late-ms 800
+
+Para cada estrategia reporta el tiempo de espera tras driver.get() y si el
+contenido tardío (#late-content) ya estaba en el DOM al terminar la espera.
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from utils.page_readiness import ReadinessEngine
+from utils.web_driver import WebDriverManager
+
+LATE_SELECTOR = "#late-content"
+
+
+def legacy_wait(driver):
+    """Réplica de la espera anterior de BasePage.wait_for_dom_ready"""
+    driver.execute_script("""
+        return new Promise(resolve => {
+            if (document.readyState === 'complete') {
+                resolve(true);
+            } else {
+                window.addEventListener('load', () => resolve(true));
+            }
+        });
+    """)
+    time.sleep(2)
+
+
+def run_strategy(driver, engine, url, strategy):
+    engine.begin_navigation()
+    driver.get(url)
+    start = time.monotonic()
+
+    if strategy == "legacy-sleep":
+        legacy_wait(driver)
+    elif strategy == "engine-predicate":
+        engine.wait([LATE_SELECTOR])
+    else:
+        engine.wait()
+
+    elapsed = time.monotonic() - start
+    has_late = driver.execute_script("return !!document.querySelector(arguments[0])", LATE_SELECTOR)
+    return elapsed, has_late
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--assets", type=int, default=4)
+    parser.add_argument("--asset-delay", type=int, default=300)
+    parser.add_argument("--late-ms", type=int, default=800)
+    args = parser.parse_args()
+
+    strategies = ["legacy-sleep", "engine-quiet", "engine-predicate"]
+    results = {name: [] for name in strategies}
+
+    with FixtureServer() as server:
+        url = server.url(
+            f"/readiness?assets={args.assets}&asset_delay={args.asset_delay}&late_ms={args.late_ms}"
+        )
+        manager = WebDriverManager()
+        driver = manager.setup_driver()
+        engine = ReadinessEngine(driver)
+        try:
+            for _ in range(args.runs):
+                for name in strategies:
+                    results[name].append(run_strategy(driver, engine, url, name))
+        finally:
+            manager.teardown_driver()
+
+    print(f"\n{'estrategia':<18} {'media':>8} {'min':>8} {'max':>8} {'contenido tardío':>17}")
+    print("─" * 63)
+    for name in strategies:
+        times = [elapsed for elapsed, _ in results[name]]
+        complete = sum(1 for _, has_late in results[name] if has_late)
+        print(f"{name:<18} {statistics.mean(times):>7.3f}s {min(times):>7.3f}s "
+              f"{max(times):>7.3f}s {complete:>10}/{len(times)}")
+
+
+if __name__ == "__main__":
+    main()
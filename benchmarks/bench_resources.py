@@ -0,0 +1,88 @@
+"""
+Benchmark: perfiles de recursos (full / lean / minimal) en el sitio local.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_resources --runs 3 --images 20 --size 80000
+
+Para cada perfil abre un Chrome nuevo, carga /resources y reporta los
+bytes transferidos (CDP Network.loadingFinished.encodedDataLength), las
+peticiones bloqueadas y el tiempo hasta página lista (ReadinessEngine).
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.fixture_server import FixtureServer
+from utils.cdp_events import CDPEventBus
+from utils.page_readiness import ReadinessEngine
+from utils.resource_policy import ResourcePolicy
+from utils.web_driver import WebDriverManager
+
+
+class TransferMeter:
+    """Suma bytes y peticiones a partir de los eventos Network.*"""
+
+    def __init__(self, bus):
+        self.bytes = 0
+        self.finished = 0
+        self.blocked = 0
+        bus.subscribe(self._on_event, "Network.loading")
+
+    def reset(self):
+        self.bytes = self.finished = self.blocked = 0
+
+    def _on_event(self, method, params):
+        if method == "Network.loadingFinished":
+            self.bytes += params.get("encodedDataLength", 0)
+            self.finished += 1
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            self.blocked += 1
+
+
+def measure_profile(profile, url, runs):
+    manager = WebDriverManager(resource_profile=profile)
+    driver = manager.setup_driver()
+    bus = CDPEventBus.for_driver(driver)
+    engine = ReadinessEngine(driver)
+    meter = TransferMeter(bus)
+    samples = []
+    try:
+        for _ in range(runs):
+            ResourcePolicy.for_driver(driver).apply(driver)
+            engine.begin_navigation()
+            meter.reset()
+            start = time.monotonic()
+            driver.get(url)
+            engine.wait()
+            elapsed = time.monotonic() - start
+            bus.poll()
+            samples.append((elapsed, meter.bytes, meter.finished, meter.blocked))
+    finally:
+        manager.teardown_driver()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--images", type=int, default=20)
+    parser.add_argument("--size", type=int, default=80000)
+    parser.add_argument("--asset-delay", type=int, default=100)
+    args = parser.parse_args()
+
+    with FixtureServer() as server:
+        url = server.url(f"/resources?images={args.images}&size={args.size}&asset_delay={args.asset_delay}")
+        results = {profile: measure_profile(profile, url, args.runs) for profile in ResourcePolicy.PROFILES}
+
+    print(f"\n{'perfil':<10} {'lista (media)':>14} {'KB transferidos':>16} {'peticiones':>11} {'bloqueadas':>11}")
+    print("─" * 66)
+    for profile, samples in results.items():
+        print(f"{profile:<10} "
+              f"{statistics.mean(s[0] for s in samples):>13.3f}s "
+              f"{statistics.mean(s[1] for s in samples) / 1024:>16.1f} "
+              f"{statistics.mean(s[2] for s in samples):>11.1f} "
+              f"{statistics.mean(s[3] for s in samples):>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
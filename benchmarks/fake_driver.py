@@ -0,0 +1,450 @@
+"""
+WebDriver simulado en el mismo proceso, para medir ElementFinder, BasePage
+y las páginas sin Chrome.
+
+Implementa el subconjunto de la API de Selenium que usa el proyecto
+(get, find_element(s), execute_script, execute_async_script,
+execute_cdp_cmd, current_url, cookies, get_log...) sobre un DOM guionado:
+
+- FakeSite: rutas (prefijo de path → FakePage o callable(driver, url))
+- FakePage: elementos, tarjetas de empleo, carga diferida, paginación,
+  redirección y código de estado
+- FakeElement: un elemento que coincide con una lista de selectores
+  simples (no hay motor CSS: "a, b" coincide si el elemento declara a o b)
+
+Los scripts del proyecto se reconocen por su texto (los atributos de
+clase PROBE_SCRIPT, POLL_SCRIPT, EXTRACT_CARDS_SCRIPT...) y se resuelven
+en Python; register_script() agrega otros. El tiempo es el del reloj
+inyectado: con un VirtualClock las esperas de la política y las
+apariciones diferidas (appears_after, lazy_delay) no duermen de verdad.
+
+Cada navegación emite eventos CDP (Network.*, Page.frameNavigated) en el
+log "performance", igual que ChromeDriver con goog:loggingPrefs.
+"""
+import json
+from urllib.parse import urljoin, urlparse
+
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    NoSuchElementException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from utils.clock import VirtualClock
+
+
+def _selector_parts(selector):
+    return [part.strip() for part in selector.split(",") if part.strip()]
+
+
+class FakeElement:
+    """
+    Elemento guionado.
+
+    selectors: selectores simples con los que coincide
+    appears_after: segundos (del reloj del driver) desde la carga de la
+    página hasta que el elemento existe en el DOM
+    on_click / on_submit: callable(driver, element) (ej. navegar tras el login)
+    """
+
+    def __init__(self, selectors, text="", attributes=None, displayed=True, enabled=True,
+                 appears_after=0.0, on_click=None, on_submit=None, tag_name="div"):
+        self.selectors = [selectors] if isinstance(selectors, str) else list(selectors)
+        self.text = text
+        self.attributes = dict(attributes or {})
+        self.displayed = displayed
+        self.enabled = enabled
+        self.appears_after = appears_after
+        self.on_click = on_click
+        self.on_submit = on_submit
+        self.tag_name = tag_name
+        self.driver = None
+
+    def matches(self, selector):
+        return any(part in self.selectors for part in _selector_parts(selector))
+
+    # ==================== API DE WebElement ====================
+
+    def click(self):
+        self.driver._count("click")
+        if self.on_click:
+            self.on_click(self.driver, self)
+
+    def clear(self):
+        self.driver._count("clear")
+        self.attributes["value"] = ""
+
+    def send_keys(self, *values):
+        self.driver._count("send_keys")
+        text = "".join(str(value) for value in values)
+        if Keys.RETURN in text or Keys.ENTER in text:
+            text = text.replace(Keys.RETURN, "").replace(Keys.ENTER, "")
+            self.attributes["value"] = self.attributes.get("value", "") + text
+            self.submit()
+            return
+        self.attributes["value"] = self.attributes.get("value", "") + text
+
+    def submit(self):
+        self.driver._count("submit")
+        if self.on_submit:
+            self.on_submit(self.driver, self)
+
+    def get_attribute(self, name):
+        return self.attributes.get(name)
+
+    def is_displayed(self):
+        return self.displayed
+
+    def is_enabled(self):
+        return self.enabled
+
+
+class FakePage:
+    """
+    Página guionada.
+
+    - elements: FakeElement del documento
+    - cards: filas de tarjetas [id, título, empresa, ubicación, fecha, easy_apply]
+      (el formato de JobsPage.EXTRACT_CARDS_SCRIPT)
+    - lazy_chunk / lazy_delay: tarjetas renderizadas al inicio y por cada
+      scroll, y segundos que tarda cada tanda (0 = todas desde el inicio)
+    - pagination: {número de página: URL} para los botones numerados
+    - load_time: segundos hasta document.readyState == 'complete'
+    - redirect: URL a la que redirige (302) en lugar de mostrarse
+    - responses: [(URL, payload)] respuestas JSON que la página pide a la
+      API al cargar (eventos Network.* y Network.getResponseBody)
+    """
+
+    def __init__(self, elements=(), cards=(), lazy_chunk=0, lazy_delay=0.0, pagination=None,
+                 load_time=0.0, title="", status=200, redirect=None, responses=()):
+        self.elements = list(elements)
+        self.cards = list(cards)
+        self.lazy_chunk = lazy_chunk
+        self.lazy_delay = lazy_delay
+        self.pagination = dict(pagination or {})
+        self.load_time = load_time
+        self.title = title
+        self.status = status
+        self.redirect = redirect
+        self.responses = list(responses)
+
+
+class FakeSite:
+    """Rutas del sitio: el prefijo de path más largo que coincide gana"""
+
+    def __init__(self, routes=None, not_found=None):
+        self.routes = dict(routes or {})
+        self.not_found = not_found or FakePage(title="404", status=404)
+
+    def route(self, prefix, page):
+        """page: FakePage o callable(driver, url) que retorna una FakePage"""
+        self.routes[prefix] = page
+        return self
+
+    def resolve(self, driver, url):
+        path = urlparse(url).path or "/"
+        best = None
+        for prefix in self.routes:
+            if path.startswith(prefix) and (best is None or len(prefix) > len(best)):
+                best = prefix
+        page = self.routes[best] if best is not None else self.not_found
+        return page(driver, url) if callable(page) else page
+
+
+class FakeDriver:
+    """
+    WebDriver simulado sobre un FakeSite.
+
+    calls: contador de viajes al "navegador" por método (get,
+    find_element, execute_script...), para comparar implementaciones
+    por número de idas y vueltas además de por tiempo.
+    """
+
+    MAX_REDIRECTS = 10
+
+    def __init__(self, site, clock=None, base_url="https://www.linkedin.com"):
+        self.site = site
+        self.clock = clock or VirtualClock()
+        self.base_url = base_url.rstrip("/")
+        self.current_url = "about:blank"
+        self.page = FakePage(title="about:blank")
+        self.loaded_at = self.clock.now()
+        self.last_mutation = self.loaded_at
+        self.visible_cards = 0
+        self.cookies = {}
+        self.cdp_commands = []
+        self.calls = {}
+        self._performance_log = []
+        self._request_ids = 0
+        self._response_bodies = {}
+        self._scripts = {}
+        self._register_project_scripts()
+
+    # ==================== NAVEGACIÓN ====================
+
+    @property
+    def title(self):
+        return self.page.title
+
+    def get(self, url):
+        self._count("get")
+        self._load(url)
+
+    def refresh(self):
+        self._count("refresh")
+        self._load(self.current_url)
+
+    def _load(self, url):
+        url = urljoin(self.current_url if self.current_url.startswith("http") else self.base_url + "/", url)
+        for _ in range(self.MAX_REDIRECTS):
+            page = self.site.resolve(self, url)
+            request_id = self._request(url, 302 if page.redirect else page.status)
+            if not page.redirect:
+                break
+            url = urljoin(url, page.redirect)
+        else:
+            raise WebDriverException(f"Demasiadas redirecciones: {url}")
+
+        self.current_url = url
+        self.page = page
+        self.loaded_at = self.clock.now()
+        self.last_mutation = self.loaded_at + page.load_time
+        self.visible_cards = page.lazy_chunk or len(page.cards)
+        for element in page.elements:
+            element.driver = self
+        self.emit_event("Page.frameNavigated", {"frame": {"id": "main", "url": url}})
+        self.emit_event("Network.loadingFinished", {"requestId": request_id})
+
+        # Peticiones de la página a la API (los cuerpos viven hasta la próxima navegación)
+        self._response_bodies = {}
+        for api_url, payload in page.responses:
+            api_id = self._request(urljoin(url, api_url), 200, "XHR", "application/json")
+            self._response_bodies[api_id] = json.dumps(payload)
+            self.emit_event("Network.loadingFinished", {"requestId": api_id})
+
+    def _request(self, url, status, resource_type="Document", mime_type="text/html"):
+        self._request_ids += 1
+        request_id = f"fake.{self._request_ids}"
+        self.emit_event("Network.requestWillBeSent", {
+            "requestId": request_id, "type": resource_type, "request": {"url": url, "method": "GET"},
+        })
+        self.emit_event("Network.responseReceived", {
+            "requestId": request_id, "type": resource_type,
+            "response": {"url": url, "status": status, "mimeType": mime_type},
+        })
+        return request_id
+
+    # ==================== ELEMENTOS ====================
+
+    def _present(self, selector):
+        elapsed = self.clock.now() - self.loaded_at
+        return [element for element in self.page.elements
+                if element.appears_after <= elapsed and element.matches(selector)]
+
+    def _next_appearance(self, selectors):
+        """Segundos hasta que aparezca algún elemento de selectors (None si nunca)"""
+        elapsed = self.clock.now() - self.loaded_at
+        pending = [element.appears_after - elapsed for element in self.page.elements
+                   if element.appears_after > elapsed and any(element.matches(s) for s in selectors)]
+        return min(pending) if pending else None
+
+    def find_element(self, by=By.ID, value=None):
+        self._count("find_element")
+        if by != By.CSS_SELECTOR:
+            raise InvalidSelectorException(f"FakeDriver solo admite CSS: {by}")
+        elements = self._present(value)
+        if not elements:
+            raise NoSuchElementException(value)
+        return elements[0]
+
+    def find_elements(self, by=By.ID, value=None):
+        self._count("find_elements")
+        if by != By.CSS_SELECTOR:
+            raise InvalidSelectorException(f"FakeDriver solo admite CSS: {by}")
+        return self._present(value)
+
+    # ==================== SCRIPTS ====================
+
+    def register_script(self, script, handler):
+        """handler(driver, *args) resuelve el script (por texto exacto)"""
+        self._scripts[script] = handler
+
+    def execute_script(self, script, *args):
+        self._count("execute_script")
+        return self._run_script(script, args)
+
+    def execute_async_script(self, script, *args):
+        self._count("execute_async_script")
+        return self._run_script(script, args)
+
+    def _run_script(self, script, args):
+        handler = self._scripts.get(script)
+        if handler is None:
+            return None
+        return handler(self, *args)
+
+    def _register_project_scripts(self):
+        # Importación diferida: las páginas importan este módulo solo en benchmarks
+        from core.login_watcher import LoginWatcher
+        from pages.jobs_page import JobsPage
+        from pages.results_paginator import ResultsPaginator
+        from utils.element_finder import ElementFinder
+        from utils.page_readiness import ReadinessEngine
+
+        self.register_script("return 1", lambda driver: 1)
+        self.register_script(ElementFinder.PROBE_SCRIPT, FakeDriver._probe)
+        self.register_script(ElementFinder.PROBE_WAIT_SCRIPT, FakeDriver._probe_wait)
+        self.register_script(ElementFinder.FIND_FIRST_SCRIPT, FakeDriver._find_first)
+        self.register_script(ReadinessEngine.POLL_SCRIPT, FakeDriver._readiness_poll)
+        self.register_script(JobsPage.EXTRACT_CARDS_SCRIPT, FakeDriver._extract_cards)
+        self.register_script(ResultsPaginator.SCROLL_SCRIPT, FakeDriver._scroll)
+        self.register_script(ResultsPaginator.NEXT_PAGE_SCRIPT, FakeDriver._next_page)
+        self.register_script(LoginWatcher.CHECK_SCRIPT, FakeDriver._login_state)
+
+    def _probe(self, selectors):
+        return [selector for selector in selectors if self._present(selector)]
+
+    def _probe_wait(self, selectors, decisive, timeout_ms):
+        matched = self._probe(selectors)
+        if any(selector in decisive for selector in matched):
+            return matched
+        wait = self._next_appearance(decisive)
+        timeout = timeout_ms / 1000
+        self.clock.sleep(wait if wait is not None and wait <= timeout else timeout)
+        return self._probe(selectors)
+
+    def _find_first(self, candidates, timeout_ms):
+        matched = self._probe(candidates)
+        if not matched and timeout_ms:
+            wait = self._next_appearance(candidates)
+            timeout = timeout_ms / 1000
+            self.clock.sleep(wait if wait is not None and wait <= timeout else timeout)
+            matched = self._probe(candidates)
+        if not matched:
+            return None
+        return {"matched": matched, "element": self._present(matched[0])[0]}
+
+    def _login_state(self):
+        return {
+            "url": self.current_url,
+            "error": bool(self._present("#error-for-password, #error-for-username, .form__label--error")),
+            "challenge": bool(self._present("#captcha-internal")),
+        }
+
+    def _readiness_poll(self, selectors):
+        now = self.clock.now()
+        elapsed = now - self.loaded_at
+        complete = elapsed >= self.page.load_time
+        appeared = [self.loaded_at + element.appears_after for element in self.page.elements
+                    if element.appears_after <= elapsed]
+        last = max([self.last_mutation] + appeared)
+        matched = next((selector for selector in selectors if self._present(selector)), None)
+        return {
+            "state": "complete" if complete else "interactive",
+            "quiet": max(0.0, (now - last) * 1000),
+            "mutations": len(appeared),
+            "matched": matched,
+        }
+
+    def _extract_cards(self, card_selector, start, limit):
+        rows = self.page.cards[:self.visible_cards]
+        end = min(len(rows), start + limit) if limit else len(rows)
+        return {"total": len(rows), "rows": [list(row) for row in rows[start:end]]}
+
+    def _scroll(self, selector, timeout_ms):
+        if not self._present(selector):
+            return None
+        if self.visible_cards >= len(self.page.cards):
+            return {"changed": False, "moved": False, "atBottom": True}
+        if self.page.lazy_delay * 1000 > timeout_ms:
+            self.clock.sleep(timeout_ms / 1000)
+            return {"changed": False, "moved": True, "atBottom": False}
+        self.clock.sleep(self.page.lazy_delay)
+        self.visible_cards = min(len(self.page.cards), self.visible_cards + self.page.lazy_chunk)
+        self.last_mutation = self.clock.now()
+        return {"changed": True, "moved": True, "atBottom": self.visible_cards >= len(self.page.cards)}
+
+    def _next_page(self, page, selector, timeout_ms):
+        url = self.page.pagination.get(page)
+        if not url:
+            return False
+        self._load(url)
+        return True
+
+    # ==================== CDP Y LOGS ====================
+
+    def emit_event(self, method, params=None):
+        """Encola un evento CDP en el log "performance" (lo lee CDPEventBus)"""
+        self._performance_log.append({
+            "level": "INFO",
+            "timestamp": int(self.clock.now() * 1000),
+            "message": json.dumps({"message": {"method": method, "params": params or {}}}),
+        })
+
+    def get_log(self, log_type):
+        self._count("get_log")
+        if log_type != "performance":
+            return []
+        entries, self._performance_log = self._performance_log, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self._count("execute_cdp_cmd")
+        self.cdp_commands.append((cmd, cmd_args))
+        if cmd == "Network.getAllCookies":
+            return {"cookies": self.get_cookies()}
+        if cmd == "Network.setCookies":
+            for cookie in cmd_args.get("cookies", []):
+                self.add_cookie(cookie)
+        if cmd == "Network.getResponseBody":
+            body = self._response_bodies.get(cmd_args.get("requestId"))
+            if body is None:
+                raise WebDriverException("No resource with given identifier found")
+            return {"body": body, "base64Encoded": False}
+        return {}
+
+    # ==================== COOKIES ====================
+
+    def get_cookies(self):
+        self._count("get_cookies")
+        return [dict(cookie) for cookie in self.cookies.values()]
+
+    def get_cookie(self, name):
+        cookie = self.cookies.get(name)
+        return dict(cookie) if cookie else None
+
+    def add_cookie(self, cookie):
+        self._count("add_cookie")
+        cookie = dict(cookie)
+        cookie.setdefault("domain", urlparse(self.base_url).hostname)
+        cookie.setdefault("path", "/")
+        self.cookies[cookie["name"]] = cookie
+
+    def delete_cookie(self, name):
+        self.cookies.pop(name, None)
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    # ==================== CONFIGURACIÓN ====================
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def quit(self):
+        self._count("quit")
+
+    def _count(self, method):
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    def round_trips(self):
+        """Total de llamadas al navegador simulado"""
+        return sum(self.calls.values())
@@ -0,0 +1,805 @@
+import base64
+import calendar
+import datetime
+import html as html_lib
+import json
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, quote
+
+# PNG transparente de 1x1
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+PIXEL_PNG_ASSET = ("image/png", PIXEL_PNG)
+
+# Extensión → (Content-Type, cuerpo mínimo)
+ASSETS = {
+    ".css": ("text/css", b"body { margin: 0; }"),
+    ".js": ("application/javascript", b"/* fixture */"),
+    ".jpg": ("image/jpeg", b""),
+    ".woff2": ("font/woff2", b""),
+    ".mp4": ("video/mp4", b""),
+}
+
+
+# Modal de Easy Apply de la vista de detalle. Como el formulario de LinkedIn
+# (React), solo registra lo que llega con eventos input/change: un valor
+# escrito en .value sin eventos no cuenta y el paso no valida.
+EASY_APPLY_MODAL_JS = """
+(function() {
+  var config = window.__fixtureEasyApply, answers = {}, step = 0, modal = null;
+
+  function escape(text) {
+    var div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+  }
+  function field(item, error) {
+    var id = 'fixture-' + item.id, html;
+    if (item.type === 'radio') {
+      html = '<fieldset data-test-form-element data-field="' + item.id + '"><legend>'
+        + '<span aria-hidden="true">' + escape(item.label) + '</span>'
+        + '<span class="visually-hidden">' + escape(item.label) + '</span></legend>'
+        + item.options.map(function(option, index) {
+            return '<input type="radio" name="' + id + '" id="' + id + '-' + index + '" value="' + escape(option) + '"'
+              + (item.required ? ' required' : '') + (answers[item.id] === option ? ' checked' : '') + '>'
+              + '<label for="' + id + '-' + index + '">' + escape(option) + '</label>';
+          }).join('');
+    } else if (item.type === 'select') {
+      html = '<div data-test-form-element data-field="' + item.id + '"><label for="' + id + '">' + escape(item.label) + '</label>'
+        + '<select id="' + id + '"' + (item.required ? ' required' : '') + '><option value="">Select an option</option>'
+        + item.options.map(function(option, index) {
+            return '<option value="' + index + '"' + (answers[item.id] === option ? ' selected' : '') + '>' + escape(option) + '</option>';
+          }).join('') + '</select>';
+    } else {
+      var value = answers[item.id] || '';
+      html = '<div data-test-form-element data-field="' + item.id + '"><label for="' + id + '">' + escape(item.label) + '</label>'
+        + '<input id="' + id + '" type="' + item.type + '"' + (item.required ? ' required' : '')
+        + (item.type === 'checkbox' ? (value === 'true' ? ' checked' : '') : ' value="' + escape(value) + '"') + '>';
+    }
+    if (error) html += '<div class="artdeco-inline-feedback artdeco-inline-feedback--error">' + escape(error) + '</div>';
+    return html + (item.type === 'radio' ? '</fieldset>' : '</div>');
+  }
+  function render(errors) {
+    var current = config.steps[step];
+    modal.innerHTML = '<button class="artdeco-modal__dismiss" aria-label="Dismiss">×</button>'
+      + '<h2>Apply to ' + escape(config.company) + '</h2>'
+      + '<progress value="' + (step + 1) + '" max="' + config.steps.length + '"></progress>'
+      + '<form>' + current.fields.map(function(item) { return field(item, errors[item.id]); }).join('') + '</form>'
+      + '<footer><button class="artdeco-button artdeco-button--primary" type="button" aria-label="'
+      + current.button[0] + '">' + current.button[1] + '</button></footer>';
+  }
+  function validate() {
+    var errors = {}, count = 0;
+    config.steps[step].fields.forEach(function(item) {
+      var value = answers[item.id];
+      if (item.required && !value) errors[item.id] = 'Please enter a valid answer';
+      else if (value && item.type === 'number' && !/^\\d{1,2}$/.test(value)) errors[item.id] = 'Enter a whole number between 0 and 99';
+      else return;
+      count++;
+    });
+    return count ? errors : null;
+  }
+  function close() {
+    if (modal) modal.remove();
+    modal = null;
+  }
+  function submitted() {
+    modal.className = 'artdeco-modal';
+    modal.setAttribute('data-test-modal-id', 'post-apply-modal');
+    modal.innerHTML = '<button class="artdeco-modal__dismiss" aria-label="Dismiss">×</button>'
+      + '<h2>Your application was sent to ' + escape(config.company) + '</h2>';
+  }
+  function onEvent(event) {
+    var group = event.target.closest && event.target.closest('[data-field]');
+    if (!group) return;
+    var name = group.getAttribute('data-field'), target = event.target;
+    var item = config.steps[step].fields.filter(function(candidate) { return candidate.id === name; })[0];
+    if (target.type === 'checkbox') answers[name] = target.checked ? 'true' : '';
+    else if (target.type === 'radio') answers[name] = target.checked ? target.value : answers[name];
+    else if (target.tagName === 'SELECT') answers[name] = target.value === '' ? '' : item.options[+target.value];
+    else answers[name] = target.value;
+  }
+
+  document.addEventListener('click', function(event) {
+    var target = event.target;
+    if (target.closest('.jobs-apply-button') && !modal) {
+      step = 0;
+      answers = JSON.parse(JSON.stringify(config.prefilled));
+      modal = document.createElement('div');
+      modal.className = 'jobs-easy-apply-modal artdeco-modal';
+      modal.setAttribute('role', 'dialog');
+      modal.setAttribute('data-test-modal', '');
+      document.body.appendChild(modal);
+      setTimeout(function() { render({}); }, config.render_ms);
+      return;
+    }
+    if (!modal) return;
+    if (target.closest('.artdeco-modal__dismiss')) {
+      if (modal.getAttribute('data-test-modal-id') === 'post-apply-modal') return close();
+      var confirm = document.createElement('div');
+      confirm.setAttribute('role', 'alertdialog');
+      confirm.innerHTML = '<button data-control-name="discard_application_confirm_btn">Discard</button>';
+      document.body.appendChild(confirm);
+      return;
+    }
+    if (target.closest('[data-control-name="discard_application_confirm_btn"]')) {
+      target.closest('[role="alertdialog"]').remove();
+      return close();
+    }
+    var button = target.closest('footer .artdeco-button--primary');
+    if (!button) return;
+    var errors = validate();
+    if (errors) return render(errors);
+    if (step < config.steps.length - 1) {
+      step++;
+      return setTimeout(function() { render({}); }, config.render_ms);
+    }
+    fetch('/voyager/api/jobs/easyApply', {
+      method: 'POST', headers: {'Content-Type': 'application/json'},
+      body: JSON.stringify({jobId: config.job_id, answers: answers})
+    }).then(function() { submitted(); });
+  });
+  document.addEventListener('input', onEvent, true);
+  document.addEventListener('change', onEvent, true);
+})();
+"""
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handler del sitio de pruebas local.
+    Cada ruta se resuelve con un método route_<nombre> (ver ROUTES).
+    Parámetros comunes en la query string:
+    - delay: milisegundos de latencia extra para esa petición
+
+    Además del sitio sintético, emula las páginas de LinkedIn que usa el
+    flujo (con los mismos selectores que JobsPage): /jobs/ con el
+    formulario de login o el buscador, el envío del login y los
+    resultados de búsqueda con carga diferida y paginación sin recarga.
+    Como la SPA de LinkedIn, los resultados y el detalle se pintan desde
+    JSON de la API (/voyager/api/...), en el mismo formato normalizado
+    que decodifica NetworkCapture.
+    """
+
+    ROUTES = [
+        ("/readiness", "route_readiness"),
+        ("/resources", "route_resources"),
+        ("/asset/", "route_asset"),
+        ("/feed", "route_feed"),
+        ("/voyager/api/voyagerJobsDashJobCards", "route_voyager_job_cards"),
+        ("/voyager/api/jobs/jobPostings/", "route_voyager_job_posting"),
+        ("/jobs/search", "route_search"),
+        ("/jobs/view/", "route_job_view"),
+        ("/jobs", "route_jobs"),
+        ("/checkpoint", "route_checkpoint"),
+        ("/redirect", "route_redirect"),
+        ("/login", "route_login"),
+    ]
+
+    POST_ROUTES = [
+        ("/login-submit", "route_login_submit"),
+        ("/voyager/api/jobs/easyApply", "route_easy_apply_submit"),
+    ]
+
+    def do_GET(self):
+        self._dispatch(self.ROUTES)
+
+    def do_POST(self):
+        self._dispatch(self.POST_ROUTES)
+
+    def _dispatch(self, routes):
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+
+        self._apply_latency(query)
+
+        for prefix, handler_name in routes:
+            if parsed.path.startswith(prefix):
+                return getattr(self, handler_name)(parsed.path, query)
+
+        self._send(404, "text/plain", b"not found")
+
+    # ==================== RUTAS ====================
+
+    def route_readiness(self, path, query):
+        """
+        Página con recursos lentos y contenido tardío:
+        - assets: número de imágenes (cada una tarda asset_delay ms)
+        - asset_delay: latencia de cada recurso
+        - late_ms: ms tras 'load' hasta insertar #late-content vía JS
+        """
+        assets = int(query.get("assets", 4))
+        asset_delay = int(query.get("asset_delay", 300))
+        late_ms = int(query.get("late_ms", 800))
+
+        images = "\n".join(
+            f'<img src="/asset/img{i}.png?delay={asset_delay}" width="10" height="10">'
+            for i in range(assets)
+        )
+        html = f"""<!DOCTYPE html>
+<html>
+<head>
+  <title>Readiness fixture</title>
+  <link rel="stylesheet" href="/asset/style.css?delay={asset_delay}">
+</head>
+<body>
+  <main id="app">{images}</main>
+  <script>
+    window.addEventListener('load', function() {{
+      setTimeout(function() {{
+        var late = document.createElement('div');
+        late.id = 'late-content';
+        late.textContent = 'late content';
+        document.getElementById('app').appendChild(late);
+      }}, {late_ms});
+    }});
+  </script>
+</body>
+</html>"""
+        self._send(200, "text/html; charset=utf-8", html.encode("utf-8"))
+
+    def route_resources(self, path, query):
+        """
+        Página "pesada" para comparar perfiles de recursos: imágenes, hoja
+        de estilos, fuente web, vídeo y un tracker de terceros.
+        - images: número de imágenes
+        - size: bytes de cada recurso
+        - asset_delay: latencia de cada recurso
+        """
+        images = int(query.get("images", 10))
+        size = int(query.get("size", 50000))
+        delay = int(query.get("asset_delay", 100))
+        params = f"size={size}&delay={delay}"
+
+        tags = "\n".join(
+            f'<img src="/asset/photo{i}.jpg?{params}" width="40" height="40">' for i in range(images)
+        )
+        html = f"""<!DOCTYPE html>
+<html>
+<head>
+  <title>Resources fixture</title>
+  <link rel="stylesheet" href="/asset/site.css?{params}">
+  <style>
+    @font-face {{ font-family: Fixture; src: url('/asset/font.woff2?{params}'); }}
+    body {{ font-family: Fixture, sans-serif; }}
+  </style>
+  <script async src="/asset/tracker/google-analytics.com/analytics.js?{params}"></script>
+</head>
+<body>
+  <main id="content">{tags}</main>
+  <video src="/asset/clip.mp4?{params}" preload="auto" muted></video>
+</body>
+</html>"""
+        self._send(200, "text/html; charset=utf-8", html.encode("utf-8"))
+
+    def route_asset(self, path, query):
+        """
+        Recurso estático; el tipo se deduce de la extensión.
+        - size: bytes de relleno del cuerpo (para medir transferencia)
+        """
+        content_type, body = PIXEL_PNG_ASSET
+        for extension, asset in ASSETS.items():
+            if path.endswith(extension):
+                content_type, body = asset
+                break
+
+        size = int(query.get("size", 0))
+        if size > len(body):
+            body = body + b" " * (size - len(body))
+        self._send(200, content_type, body)
+
+    def route_feed(self, path, query):
+        """
+        Página ligera que emula la de LinkedIn: 200 con sesión válida
+        (cookie de auth == server.valid_token), 302 a /login sin ella.
+        """
+        if self._has_session():
+            self._send(200, "text/html; charset=utf-8", b"<html><body>feed</body></html>")
+        else:
+            self._send(302, "text/plain", b"", {"Location": "/login?session_redirect=%2Ffeed%2F"})
+
+    def route_login(self, path, query):
+        """Página de login (el mismo formulario que /jobs/ sin sesión)"""
+        target = query.get("session_redirect", "/jobs/")
+        self._send_html(self._page("Login", self._login_form(target)))
+
+    def route_login_submit(self, path, query):
+        """
+        Envío del formulario de login:
+        - credenciales correctas → cookie de sesión y 302 a server.login_redirect
+          (o al desafío /checkpoint/challenge/ si server.login_checkpoint)
+        - incorrectas → 200 con el formulario y un error (la URL sigue siendo de login)
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        form = {key: values[-1] for key, values in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+        fixture = self.server.fixture
+
+        if form.get("session_key") != fixture.email or form.get("session_password") != fixture.password:
+            error = '<div id="error-for-password" class="form__label--error">Wrong email or password.</div>'
+            return self._send_html(self._page("Login", self._login_form(form.get("redirect", "/jobs/"), error)))
+
+        cookie = f"{fixture.auth_cookie_name}={fixture.valid_token}; Path=/; Max-Age=86400"
+        if fixture.login_checkpoint:
+            return self._send(302, "text/plain", b"", {"Location": "/checkpoint/challenge/", "Set-Cookie": cookie})
+        location = fixture.login_redirect or form.get("redirect") or "/jobs/"
+        self._send(302, "text/plain", b"", {"Location": location, "Set-Cookie": cookie})
+
+    def route_checkpoint(self, path, query):
+        self._send_html(self._page("Security Verification",
+                                   '<main id="app__container"><h1>Let\'s do a quick security check</h1></main>'))
+
+    def route_redirect(self, path, query):
+        """Cadena de redirecciones: hops saltos antes de llegar a to"""
+        hops = int(query.get("hops", 1))
+        target = query.get("to", "/jobs/")
+        if hops <= 0:
+            return self._send(302, "text/plain", b"", {"Location": target})
+        location = f"/redirect?hops={hops - 1}&to={quote(target, safe='')}"
+        self._send(302, "text/plain", b"", {"Location": location})
+
+    def route_jobs(self, path, query):
+        """/jobs/: buscador de empleos con sesión, formulario de login sin ella"""
+        if not self._has_session():
+            return self._send_html(self._page("LinkedIn Jobs", self._login_form("/jobs/")))
+        self._send_html(self._page("LinkedIn Jobs", self._search_box("") + "<main><h2>Recommended jobs</h2></main>"))
+
+    def route_search(self, path, query):
+        """
+        Resultados de búsqueda (mismo marcado que LinkedIn):
+        - server.total_results empleos, 25 por página (parámetro start)
+        - solo las primeras server.lazy_chunk tarjetas vienen renderizadas;
+          el resto aparece al hacer scroll en la lista, tras server.lazy_ms
+        - cada página (también la primera) se pide a la API de tarjetas
+          (/voyager/api/voyagerJobsDashJobCards) y se pinta en el cliente;
+          la paginación reemplaza la lista sin recargar
+        """
+        if not self._has_session():
+            target = quote(self.path, safe="")
+            return self._send(302, "text/plain", b"", {"Location": f"/login?session_redirect={target}"})
+
+        fixture = self.server.fixture
+        keywords = query.get("keywords", "")
+        total = fixture.search_jobs(keywords, 0, query.get("f_AL") == "true")[1]
+
+        if not total:
+            body = self._search_box(keywords) + (
+                '<main><div class="jobs-search-no-results-banner">No matching jobs found.</div></main>'
+            )
+            return self._send_html(self._page("Jobs search", body))
+
+        pages = (total + fixture.PAGE_SIZE - 1) // fixture.PAGE_SIZE
+        buttons = "".join(
+            f'<li data-test-pagination-page-btn="{page}"><button aria-label="Page {page}">{page}</button></li>'
+            for page in range(1, pages + 1)
+        )
+        body = self._search_box(keywords) + f"""
+<main class="scaffold-layout__list-container">
+  <div class="jobs-search-results-list" style="height: 600px; overflow-y: auto;">
+    <ul class="scaffold-layout__list-items"></ul>
+  </div>
+  <ul class="artdeco-pagination__pages">{buttons}</ul>
+</main>
+<script>
+  (function() {{
+    var chunk = {fixture.lazy_chunk}, lazyMs = {fixture.lazy_ms}, pageSize = {fixture.PAGE_SIZE};
+    var list = document.querySelector('.jobs-search-results-list');
+    var items = list.querySelector('ul');
+    var jobs = [], pending = false;
+
+    function escape(text) {{
+      var div = document.createElement('div');
+      div.textContent = text;
+      return div.innerHTML;
+    }}
+    function card(job) {{
+      return '<div class="job-card-container" data-job-id="' + job.id + '">'
+        + '<a class="job-card-list__title" href="/jobs/view/' + job.id + '/">' + escape(job.title) + '</a>'
+        + '<div class="artdeco-entity-lockup__subtitle">' + escape(job.company) + '</div>'
+        + '<ul><li class="job-card-container__metadata-item">' + escape(job.location) + '</li></ul>'
+        + '<time datetime="' + job.posted + '">' + job.posted + '</time>'
+        + '<div class="job-card-container__footer-wrapper">' + (job.easy_apply ? 'Easy Apply' : 'Promoted') + '</div>'
+        + '</div>';
+    }}
+    function decode(payload) {{
+      var entities = {{}};
+      (payload.included || []).forEach(function(entity) {{
+        if ((entity.$type || '').indexOf('JobPostingCard') !== -1) entities[entity.entityUrn] = entity;
+      }});
+      return payload.data['*elements'].map(function(urn) {{
+        var entity = entities[urn], job = {{
+          id: entity.jobPostingUrn.split(':').pop(),
+          title: entity.jobPostingTitle,
+          company: entity.primaryDescription.text,
+          location: entity.secondaryDescription.text,
+          posted: null,
+          easy_apply: false
+        }};
+        entity.footerItems.forEach(function(item) {{
+          if (item.type === 'LISTED_DATE') job.posted = new Date(item.timeAt).toISOString().slice(0, 10);
+          if (item.type === 'EASY_APPLY_TEXT') job.easy_apply = true;
+        }});
+        return job;
+      }});
+    }}
+    function load(params, push) {{
+      var api = new URLSearchParams({{q: 'jobSearch', count: String(pageSize)}});
+      ['keywords', 'start', 'f_AL'].forEach(function(name) {{
+        if (params.has(name)) api.set(name, params.get(name));
+      }});
+      fetch('/voyager/api/voyagerJobsDashJobCards?' + api.toString()).then(function(response) {{
+        return response.json();
+      }}).then(function(payload) {{
+        if (push) history.pushState(null, '', '/jobs/search/?' + params.toString());
+        render(decode(payload));
+      }});
+    }}
+    function render(page) {{
+      jobs = page;
+      items.innerHTML = jobs.map(function(job, index) {{
+        return '<li data-occludable-job-id="' + job.id + '" style="height: 120px;">'
+          + (index < chunk ? card(job) : '') + '</li>';
+      }}).join('');
+      list.scrollTop = 0;
+    }}
+    function renderVisible() {{
+      var limit = list.scrollTop + list.clientHeight * 1.5;
+      var nodes = items.children;
+      for (var i = 0; i < nodes.length; i++) {{
+        if (!nodes[i].firstChild && nodes[i].offsetTop < limit) nodes[i].innerHTML = card(jobs[i]);
+      }}
+    }}
+    list.addEventListener('scroll', function() {{
+      if (pending) return;
+      pending = true;
+      setTimeout(function() {{ pending = false; renderVisible(); }}, lazyMs);
+    }});
+    document.querySelectorAll('[data-test-pagination-page-btn] button').forEach(function(button) {{
+      button.addEventListener('click', function() {{
+        var page = parseInt(button.parentNode.getAttribute('data-test-pagination-page-btn'), 10);
+        var params = new URLSearchParams(location.search);
+        params.set('start', String((page - 1) * pageSize));
+        load(params, true);
+      }});
+    }});
+    load(new URLSearchParams(location.search), false);
+  }})();
+</script>"""
+        self._send_html(self._page("Jobs search", body))
+
+    def route_job_view(self, path, query):
+        """
+        Vista de detalle /jobs/view/<id>/: el servidor tarda server.detail_ms
+        y la descripción se hidrata en el cliente con la API de detalle
+        (/voyager/api/jobs/jobPostings/<id>, que tarda server.detail_render_ms),
+        como la SPA de LinkedIn. No requiere sesión.
+        """
+        fixture = self.server.fixture
+        job_id = path.rstrip("/").rsplit("/", 1)[-1]
+        if not job_id.isdigit():
+            return self._send(404, "text/plain", b"not found")
+        time.sleep(fixture.detail_ms / 1000)
+
+        job = fixture.job_posting(job_id)
+        insights = "".join(
+            f'<li class="job-details-jobs-unified-top-card__job-insight">{html_lib.escape(insight)}</li>'
+            for insight in job["insights"]
+        )
+        body = f"""
+<main class="jobs-details">
+  <h1 class="job-details-jobs-unified-top-card__job-title">{html_lib.escape(job["title"])}</h1>
+  <div class="job-details-jobs-unified-top-card__company-name"><a href="#">{html_lib.escape(job["company"])}</a></div>
+  <div class="job-details-jobs-unified-top-card__primary-description-container">
+    {html_lib.escape(job["location"])}<br><span>{html_lib.escape(job["age"])}</span>
+  </div>
+  <ul>{insights}</ul>
+  <button class="jobs-apply-button">{"Easy Apply" if job["easy_apply"] else "Apply"}</button>
+  <article class="jobs-description__container"><div id="job-details"></div></article>
+</main>
+<script>
+  fetch('/voyager/api/jobs/jobPostings/{job_id}').then(function(response) {{
+    return response.json();
+  }}).then(function(payload) {{
+    document.getElementById('job-details').textContent = payload.data.description.text;
+  }});
+</script>"""
+        if job["easy_apply"]:
+            config = {
+                "job_id": job_id,
+                "company": job["company"],
+                "steps": fixture.easy_apply_steps(),
+                "prefilled": {"email": fixture.email},
+                "render_ms": fixture.apply_render_ms,
+            }
+            body += f"<script>window.__fixtureEasyApply = {json.dumps(config)};</script>"
+            body += f"<script>{EASY_APPLY_MODAL_JS}</script>"
+        self._send_html(self._page(f"Job {job_id}", body))
+
+    def route_voyager_job_cards(self, path, query):
+        """API de tarjetas de resultados (JSON normalizado, ver FixtureServer.voyager_job_cards)"""
+        if not self._has_session():
+            return self._send(401, "application/json", b'{"status": 401}')
+        fixture = self.server.fixture
+        time.sleep(fixture.api_latency_ms / 1000)
+        payload = fixture.voyager_job_cards(query.get("keywords", ""), int(query.get("start", 0)),
+                                            query.get("f_AL") == "true")
+        self._send(200, "application/json", json.dumps(payload).encode("utf-8"))
+
+    def route_voyager_job_posting(self, path, query):
+        """API de detalle de un empleo (JSON, ver FixtureServer.voyager_job_posting)"""
+        job_id = path.rstrip("/").rsplit("/", 1)[-1]
+        if not job_id.isdigit():
+            return self._send(404, "application/json", b'{"status": 404}')
+        time.sleep(self.server.fixture.detail_render_ms / 1000)
+        payload = self.server.fixture.voyager_job_posting(job_id)
+        self._send(200, "application/json", json.dumps(payload).encode("utf-8"))
+
+    def route_easy_apply_submit(self, path, query):
+        """Envío de Easy Apply: guarda {jobId, answers} en server.applications"""
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            application = json.loads(self.rfile.read(length).decode("utf-8"))
+        except ValueError:
+            return self._send(400, "application/json", b'{"status": 400}')
+        self.server.fixture.applications.append(application)
+        self._send(200, "application/json", b'{"status": "ok"}')
+
+    # ==================== AUXILIARES ====================
+
+    @staticmethod
+    def _page(title, body):
+        return f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>{body}</body>
+</html>"""
+
+    @staticmethod
+    def _login_form(redirect, error=""):
+        return f"""
+<main class="login__main">
+  <form data-id="sign-in-form" method="post" action="/login-submit">
+    <input name="session_key" type="text" autocomplete="username">
+    <input name="session_password" type="password" autocomplete="current-password">
+    <input name="redirect" type="hidden" value="{html_lib.escape(redirect)}">
+    {error}
+    <button data-id="sign-in-form__submit-btn" type="submit">Sign in</button>
+  </form>
+</main>"""
+
+    @staticmethod
+    def _search_box(keywords):
+        return f"""
+<header class="jobs-search-box">
+  <form method="get" action="/jobs/search/">
+    <input class="jobs-search-box__text-input" name="keywords" placeholder="Title, skill or Company"
+           value="{html_lib.escape(keywords)}">
+    <button class="jobs-search-box__submit-button" type="submit">Search</button>
+  </form>
+</header>"""
+
+    def _send_html(self, html):
+        self._send(200, "text/html; charset=utf-8", html.encode("utf-8"))
+
+    def _has_session(self):
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        fixture = self.server.fixture
+        morsel = cookies.get(fixture.auth_cookie_name)
+        return morsel is not None and morsel.value == fixture.valid_token
+
+    def _apply_latency(self, query):
+        delay_ms = int(query.get("delay", 0)) + self.server.fixture.latency_ms
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silencioso - el servidor de fixtures no genera logs"""
+        pass
+
+
+class FixtureServer:
+    """
+    Servidor HTTP local (stdlib) para benchmarks sin red.
+
+    Uso:
+        with FixtureServer(latency_ms=50) as server:
+            driver.get(server.url("/readiness?asset_delay=300"))
+
+    Emulación de LinkedIn:
+    - email / password: credenciales aceptadas por /login-submit
+    - login_redirect: destino tras un login correcto (None = la página pedida)
+    - login_checkpoint: el login correcto termina en /checkpoint/challenge/
+    - total_results: empleos por búsqueda; lazy_chunk / lazy_ms: carga diferida
+    - api_latency_ms: latencia de la API de tarjetas de resultados
+    - detail_ms / detail_render_ms: demora del servidor y de la API de
+      detalle que hidrata la vista /jobs/view/<id>/
+    - apply_render_ms: demora de cada paso del modal de Easy Apply; las
+      postulaciones enviadas quedan en applications
+    """
+
+    # Pasos del modal de Easy Apply (el email viene relleno con server.email)
+    EASY_APPLY_STEPS = [
+        {"button": ["Continue to next step", "Next"], "fields": [
+            {"id": "email", "label": "Email address", "type": "select", "required": True},
+            {"id": "phone", "label": "Mobile phone number", "type": "text", "required": True},
+        ]},
+        {"button": ["Review your application", "Review"], "fields": [
+            {"id": "years", "label": "How many years of work experience do you have with Python?",
+             "type": "number", "required": True},
+            {"id": "authorized", "label": "Are you legally authorized to work in Spain?",
+             "type": "radio", "options": ["Yes", "No"], "required": True},
+            {"id": "notice", "label": "What is your notice period?",
+             "type": "select", "options": ["Immediately", "1 month", "3 months"], "required": True},
+        ]},
+        {"button": ["Submit application", "Submit application"], "fields": [
+            {"id": "follow", "label": "Follow company to stay up to date with their page.",
+             "type": "checkbox", "required": False},
+        ]},
+    ]
+
+    PAGE_SIZE = 25
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0,
+                 auth_cookie_name="li_at", valid_token="fixture-session",
+                 email="user@example.com", password="fixture-password",
+                 login_redirect="/feed/", login_checkpoint=False,
+                 total_results=60, lazy_chunk=7, lazy_ms=150, api_latency_ms=100,
+                 detail_ms=300, detail_render_ms=200, apply_render_ms=100):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.auth_cookie_name = auth_cookie_name
+        self.valid_token = valid_token
+        self.email = email
+        self.password = password
+        self.login_redirect = login_redirect
+        self.login_checkpoint = login_checkpoint
+        self.total_results = total_results
+        self.lazy_chunk = lazy_chunk
+        self.lazy_ms = lazy_ms
+        self.api_latency_ms = api_latency_ms
+        self.detail_ms = detail_ms
+        self.detail_render_ms = detail_render_ms
+        self.apply_render_ms = apply_render_ms
+        self.applications = []
+        self.httpd = None
+        self.thread = None
+
+    def search_jobs(self, keywords, start=0, easy_apply_only=False):
+        """
+        Empleos deterministas de una búsqueda: (página desde start, total).
+        Los ids bajan con el índice (el primero es el más reciente).
+        """
+        today = datetime.date.today()
+        jobs = []
+        for index in range(self.total_results):
+            job = {
+                "id": str(4000000000 - index),
+                "title": f"{keywords or 'Job'} #{index + 1}",
+                "company": f"Empresa {index % 7}",
+                "location": ("Madrid", "Remote", "Barcelona")[index % 3],
+                "posted": (today - datetime.timedelta(days=index // 5)).isoformat(),
+                "easy_apply": index % 3 == 0,
+            }
+            if easy_apply_only and not job["easy_apply"]:
+                continue
+            jobs.append(job)
+        return jobs[start:start + self.PAGE_SIZE], len(jobs)
+
+    def job_posting(self, job_id):
+        """Detalle determinista de un empleo (el índice sale del id)"""
+        index = 4000000000 - int(job_id)
+        return {
+            "id": str(job_id),
+            "title": f"Job #{index + 1}",
+            "company": f"Empresa {index % 7}",
+            "location": ("Madrid", "Remote", "Barcelona")[index % 3],
+            "age": f"hace {index // 5} días",
+            "insights": ["Remoto · Jornada completa", "Nivel intermedio"],
+            "description": " ".join(
+                f"Responsabilidad {n + 1} del empleo {job_id}: desarrollar, revisar y desplegar servicios."
+                for n in range(12)
+            ),
+            "easy_apply": index % 3 == 0,
+        }
+
+    def easy_apply_steps(self):
+        """Pasos del modal; la única opción del select de email es server.email"""
+        steps = json.loads(json.dumps(self.EASY_APPLY_STEPS))
+        steps[0]["fields"][0]["options"] = [self.email]
+        return steps
+
+    # ==================== API (formato normalizado de LinkedIn) ====================
+
+    def voyager_job_cards(self, keywords, start=0, easy_apply_only=False):
+        """
+        Respuesta de /voyager/api/voyagerJobsDashJobCards: el orden de la
+        página en data["*elements"] y las entidades JobPostingCard en included.
+        """
+        jobs, total = self.search_jobs(keywords, start, easy_apply_only)
+        elements, included = [], []
+        for job in jobs:
+            urn = f"urn:li:fsd_jobPostingCard:({job['id']},JOBS_SEARCH)"
+            posted = datetime.date.fromisoformat(job["posted"])
+            footer = [{"type": "LISTED_DATE", "timeAt": calendar.timegm(posted.timetuple()) * 1000}]
+            if job["easy_apply"]:
+                footer.append({"type": "EASY_APPLY_TEXT", "text": {"text": "Easy Apply"}})
+            elements.append(urn)
+            included.append({
+                "$type": "com.linkedin.voyager.dash.jobs.JobPostingCard",
+                "entityUrn": urn,
+                "jobPostingUrn": f"urn:li:fsd_jobPosting:{job['id']}",
+                "jobPostingTitle": job["title"],
+                "title": {"text": job["title"]},
+                "primaryDescription": {"text": job["company"]},
+                "secondaryDescription": {"text": job["location"]},
+                "footerItems": footer,
+            })
+        return {
+            "data": {"paging": {"start": start, "count": self.PAGE_SIZE, "total": total}, "*elements": elements},
+            "included": included,
+        }
+
+    def voyager_job_posting(self, job_id):
+        """Respuesta de /voyager/api/jobs/jobPostings/<id>"""
+        job = self.job_posting(job_id)
+        apply_type = "ComplexOnsiteApply" if job["easy_apply"] else "OffsiteApply"
+        return {
+            "data": {
+                "entityUrn": f"urn:li:fs_normalized_jobPosting:{job_id}",
+                "jobPostingId": int(job_id),
+                "title": job["title"],
+                "formattedLocation": job["location"],
+                "companyDetails": {
+                    "com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany": {
+                        "companyResolutionResult": {"name": job["company"]},
+                    },
+                },
+                "description": {"text": job["description"]},
+                "formattedEmploymentStatus": job["insights"][0],
+                "formattedExperienceLevel": job["insights"][1],
+                "applyMethod": {"$type": f"com.linkedin.voyager.jobs.{apply_type}"},
+            },
+            "included": [],
+        }
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer((self.host, self.port), FixtureRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fixture = self
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, path="/"):
+        return f"{self.base_url}{path}"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -1,24 +1,127 @@
 import os
 from dotenv import load_dotenv
+from config.wait_policy import WaitPolicy
 
 load_dotenv()
 
 class Settings:
     # URLs
-    JOBS_URL = "https://www.linkedin.com/jobs/"
-    LOGIN_URL = "https://www.linkedin.com/login"
-    COOKIES_FILE = "cookies/linkedin_cookies.pkl"
+    BASE_URL = os.getenv("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+    JOBS_URL = f"{BASE_URL}/jobs/"
+    LOGIN_URL = f"{BASE_URL}/login"
+    # Página ligera para el sondeo de sesión (redirige al login si no hay sesión)
+    AUTH_PROBE_URL = os.getenv("AUTH_PROBE_URL", f"{BASE_URL}/feed/")
+    AUTH_PROBE_HTTP = os.getenv("AUTH_PROBE_HTTP", "True").lower() == "true"
+    USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+    COOKIES_FILE = os.getenv("COOKIES_FILE", "cookies/linkedin_session.json")
+    LEGACY_COOKIES_FILE = "cookies/linkedin_cookies.pkl"
+    COOKIE_DOMAIN = os.getenv("COOKIE_DOMAIN", "linkedin.com")
+    AUTH_COOKIE_NAME = os.getenv("AUTH_COOKIE_NAME", "li_at")
+    DRIVER_CACHE_FILE = os.getenv("DRIVER_CACHE_FILE", "drivers/chromedriver.json")
+    JOB_STORE_FILE = os.getenv("JOB_STORE_FILE", "data/jobs.db")
+    SELECTOR_STATS_FILE = os.getenv("SELECTOR_STATS_FILE", "data/selector_stats.json")
     CLOSE_BROWSER = os.getenv("CLOSE_BROWSER", "True").lower() == "true"
+    
+    # Modo servidor: headless con viewport fijo y salida sin input()
+    HEADLESS = os.getenv("HEADLESS", "False").lower() == "true"
+    WINDOW_WIDTH = int(os.getenv("WINDOW_WIDTH", "1920"))
+    WINDOW_HEIGHT = int(os.getenv("WINDOW_HEIGHT", "1080"))
+    INTERACTIVE = os.getenv("INTERACTIVE", "True").lower() == "true" and not HEADLESS
     EMAIL = os.getenv("LINKEDIN_EMAIL")
     PASSWORD = os.getenv("LINKEDIN_PASSWORD")
     
     # Nueva configuración de búsqueda de trabajo
     JOB_SEARCH_QUERY = os.getenv("JOB_SEARCH_QUERY", "Python Developer")
+    # Varias búsquedas separadas por ";" (si no se define, solo JOB_SEARCH_QUERY)
+    JOB_SEARCH_QUERIES = [
+        query.strip()
+        for query in os.getenv("JOB_SEARCH_QUERIES", JOB_SEARCH_QUERY).split(";")
+        if query.strip()
+    ]
+    # Filtros por defecto de las búsquedas (ver core/search_spec.py)
+    JOB_SEARCH_LOCATION = os.getenv("JOB_SEARCH_LOCATION", "")
+    JOB_SEARCH_GEO_ID = os.getenv("JOB_SEARCH_GEO_ID", "")
+    JOB_SEARCH_REMOTE = os.getenv("JOB_SEARCH_REMOTE", "")
+    JOB_SEARCH_DATE_POSTED = os.getenv("JOB_SEARCH_DATE_POSTED", "")
+    JOB_SEARCH_EXPERIENCE = os.getenv("JOB_SEARCH_EXPERIENCE", "")
+    JOB_SEARCH_EASY_APPLY = os.getenv("JOB_SEARCH_EASY_APPLY", "False").lower() == "true"
+    JOB_SEARCH_SORT = os.getenv("JOB_SEARCH_SORT", "relevance").lower()
+    
+    # Recorrido de resultados (0 = sin límite)
+    MAX_RESULTS = int(os.getenv("MAX_RESULTS", "100"))
+    MAX_RESULT_PAGES = int(os.getenv("MAX_RESULT_PAGES", "10"))
+    
+    # Detalle de cada empleo nuevo (varias pestañas en el mismo navegador)
+    FETCH_DETAILS = os.getenv("FETCH_DETAILS", "False").lower() == "true"
+    DETAIL_CONCURRENCY = int(os.getenv("DETAIL_CONCURRENCY", "3"))
+    DETAIL_TIMEOUT = float(os.getenv("DETAIL_TIMEOUT", "15"))
+    
+    # Datos de empleos desde las respuestas JSON de la API (el DOM queda de respaldo)
+    NETWORK_CAPTURE = os.getenv("NETWORK_CAPTURE", "True").lower() == "true"
+    
+    # Postulación con Easy Apply a los empleos nuevos (ver review.py)
+    EASY_APPLY = os.getenv("EASY_APPLY", "False").lower() == "true"
+    APPLY_DRY_RUN = os.getenv("APPLY_DRY_RUN", "False").lower() == "true"
+    APPLY_MAX_PER_RUN = int(os.getenv("APPLY_MAX_PER_RUN", "10"))
+    APPLY_MAX_STEPS = int(os.getenv("APPLY_MAX_STEPS", "8"))
+    ANSWERS_FILE = os.getenv("ANSWERS_FILE", "data/answers.json")
+    ANSWER_MATCH_CUTOFF = float(os.getenv("ANSWER_MATCH_CUTOFF", "0.85"))
+    REVIEW_QUEUE_FILE = os.getenv("REVIEW_QUEUE_FILE", "data/review_queue.jsonl")
+    
+    # Lotes de búsquedas con checkpoints (ver batch.py)
+    BATCH_JOURNAL_FILE = os.getenv("BATCH_JOURNAL_FILE", "data/batch_journal.jsonl")
+    BATCH_MAX_ATTEMPTS = int(os.getenv("BATCH_MAX_ATTEMPTS", "3"))
+    
+    # Ritmo de acciones (ver utils/rate_governor.py; 0 = sin límite)
+    RATE_PER_HOUR = int(os.getenv("RATE_PER_HOUR", "240"))
+    RATE_PER_DAY = int(os.getenv("RATE_PER_DAY", "1500"))
+    RATE_MIN_INTERVAL = float(os.getenv("RATE_MIN_INTERVAL", "1.0"))
+    RATE_JITTER = float(os.getenv("RATE_JITTER", "1.5"))
+    RATE_BURST = int(os.getenv("RATE_BURST", "10"))
+    
+    # Pool de navegadores (búsquedas en paralelo)
+    POOL_SIZE = int(os.getenv("POOL_SIZE", "1"))
+    POOL_QUEUE_SIZE = int(os.getenv("POOL_QUEUE_SIZE", "100"))
+    PROFILES_DIR = os.getenv("PROFILES_DIR", "profiles")
+    
+    # Daemon (navegadores autenticados de larga duración)
+    DAEMON_HOST = os.getenv("DAEMON_HOST", "127.0.0.1")
+    DAEMON_PORT = int(os.getenv("DAEMON_PORT", "8765"))
+    DAEMON_IDLE_TIMEOUT = float(os.getenv("DAEMON_IDLE_TIMEOUT", "900"))
     
     # Logger settings
     LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG").upper()
     LOG_SHOW_TIME = os.getenv("LOG_SHOW_TIME", "True").lower() == "true"
     LOG_SHOW_DAY = os.getenv("LOG_SHOW_DAY", "False").lower() == "true"
     LOG_SHOW_DATE = os.getenv("LOG_SHOW_DATE", "False").lower() == "true"
+    # Sinks: console, json, file (separados por coma); escritura en segundo plano
+    LOG_SINKS = [name.strip() for name in os.getenv("LOG_SINKS", "console").split(",") if name.strip()]
+    LOG_ASYNC = os.getenv("LOG_ASYNC", "True").lower() == "true"
+    LOG_JSON_FILE = os.getenv("LOG_JSON_FILE", "logs/linkedin_jobs.jsonl")
+    LOG_FILE = os.getenv("LOG_FILE", "logs/linkedin_jobs.log")
+    LOG_FILE_MAX_BYTES = int(os.getenv("LOG_FILE_MAX_BYTES", str(5 * 1024 * 1024)))
+    LOG_FILE_BACKUPS = int(os.getenv("LOG_FILE_BACKUPS", "3"))
+    # Registros DEBUG descartados que se vuelcan a disco solo ante un error
+    LOG_DEBUG_BUFFER = int(os.getenv("LOG_DEBUG_BUFFER", "500"))
+    LOG_DEBUG_DUMP_FILE = os.getenv("LOG_DEBUG_DUMP_FILE", "logs/debug_dump.log")
+    
+    # Trazado de spans (formato Chrome Trace Event); TRACE_FILE vacío = desactivado
+    TRACE_FILE = os.getenv("TRACE_FILE", "")
+    TRACE_ENABLED = bool(TRACE_FILE) or os.getenv("TRACE", "False").lower() == "true"
+    TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "100000"))
+    
+    # Detección de página lista (sin esperas fijas)
+    READY_QUIET_MS = float(os.getenv("READY_QUIET_MS", "300"))
+    NETWORK_IDLE_MS = float(os.getenv("NETWORK_IDLE_MS", "500"))
+    
+    # Perfil de carga de recursos: full, lean o minimal
+    RESOURCE_PROFILE = os.getenv("RESOURCE_PROFILE", "full").lower()
+    
+    # Política de esperas única (timeouts por operación y plazo por paso)
+    WAIT_POLICY = WaitPolicy.from_env()
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,165 @@
+import os
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from utils.clock import system_clock
+
+
+class Deadline:
+    """
+    Plazo absoluto para un paso del flujo.
+    Todas las esperas dentro del paso se recortan al tiempo restante.
+    """
+
+    def __init__(self, budget, label="", clock=system_clock):
+        self.label = label
+        self.budget = budget
+        self.clock = clock
+        self.started_at = clock.now()
+        self.expires_at = self.started_at + budget
+
+    def remaining(self):
+        return max(0.0, self.expires_at - self.clock.now())
+
+    def elapsed(self):
+        return self.clock.now() - self.started_at
+
+    def expired(self):
+        return self.clock.now() >= self.expires_at
+
+
+class WaitPolicy:
+    """
+    Política de esperas única para driver, ElementFinder y páginas.
+
+    - Sin espera implícita (implicit_wait=0): combinarla con esperas
+      explícitas multiplica la latencia de cada búsqueda fallida.
+    - Presupuestos por operación (find, clickable, presence, probe, ready...)
+    - apply_timeout: cada transición del modal de Easy Apply (abrir,
+      siguiente paso, envío); el envío puede tardar bastante más que
+      la aparición de un elemento
+    - Plazo total por paso del flujo: dentro de `with policy.step(...)`
+      ninguna espera puede superar lo que le queda al paso.
+    - Reloj inyectable (clock): con un VirtualClock plazos y esperas se
+      simulan sin dormir de verdad.
+    """
+
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, find_timeout=3, clickable_timeout=5, presence_timeout=2,
+                 probe_timeout=2, ready_timeout=10, login_timeout=10, apply_timeout=15,
+                 page_load_timeout=30, script_timeout=30, implicit_wait=0,
+                 poll_frequency=0.1, ready_poll_interval=0.05, step_deadline=20, clock=None):
+        # Presupuestos por operación (segundos)
+        self.find_timeout = find_timeout
+        self.clickable_timeout = clickable_timeout
+        self.presence_timeout = presence_timeout
+        self.probe_timeout = probe_timeout
+        self.ready_timeout = ready_timeout
+        self.login_timeout = login_timeout
+        self.apply_timeout = apply_timeout
+
+        # Timeouts del driver
+        self.page_load_timeout = page_load_timeout
+        self.script_timeout = script_timeout
+        self.implicit_wait = implicit_wait
+
+        # Intervalos de sondeo
+        self.poll_frequency = poll_frequency
+        self.ready_poll_interval = ready_poll_interval
+
+        # Plazo total por paso de NavigationManager
+        self.step_deadline = step_deadline
+
+        self.clock = clock or system_clock
+        self._local = threading.local()
+
+    @classmethod
+    def from_env(cls):
+        """Construye la política desde variables de entorno (.env)"""
+        def env_float(name, default):
+            return float(os.getenv(name, str(default)))
+
+        return cls(
+            find_timeout=env_float("FIND_TIMEOUT", 3),
+            clickable_timeout=env_float("CLICKABLE_TIMEOUT", 5),
+            presence_timeout=env_float("PRESENCE_TIMEOUT", 2),
+            probe_timeout=env_float("PROBE_TIMEOUT", 2),
+            ready_timeout=env_float("READY_TIMEOUT", 10),
+            login_timeout=env_float("LOGIN_TIMEOUT", 10),
+            apply_timeout=env_float("APPLY_TIMEOUT", 15),
+            page_load_timeout=env_float("PAGE_LOAD_TIMEOUT", 30),
+            script_timeout=env_float("SCRIPT_TIMEOUT", 30),
+            poll_frequency=env_float("WAIT_POLL_FREQUENCY", 0.1),
+            ready_poll_interval=env_float("READY_POLL_INTERVAL", 0.05),
+            step_deadline=env_float("STEP_DEADLINE", 20),
+        )
+
+    # ==================== DRIVER ====================
+
+    def apply_to_driver(self, driver):
+        """Aplica los timeouts del driver (espera implícita siempre 0)"""
+        driver.implicitly_wait(self.implicit_wait)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        driver.set_script_timeout(self.script_timeout)
+
+    # ==================== PLAZOS POR PASO ====================
+
+    def _deadlines(self):
+        if not hasattr(self._local, "deadlines"):
+            self._local.deadlines = []
+        return self._local.deadlines
+
+    @contextmanager
+    def step(self, label="", budget=None):
+        """
+        Abre un plazo total para un paso del flujo.
+        Los plazos se anidan: manda siempre el más restrictivo.
+        """
+        deadline = Deadline(self.step_deadline if budget is None else budget, label, self.clock)
+        deadlines = self._deadlines()
+        deadlines.append(deadline)
+        try:
+            yield deadline
+        finally:
+            deadlines.remove(deadline)
+
+    def current_deadline(self):
+        """Plazo más restrictivo activo en este hilo (o None)"""
+        deadlines = self._deadlines()
+        if not deadlines:
+            return None
+        return min(deadlines, key=lambda deadline: deadline.remaining())
+
+    def budget(self, timeout):
+        """Recorta un timeout de operación al tiempo restante del paso actual"""
+        deadline = self.current_deadline()
+        if deadline is None:
+            return timeout
+        return min(timeout, deadline.remaining())
+
+    # ==================== ESPERA EXPLÍCITA ====================
+
+    def until(self, driver, condition, timeout, message=""):
+        """
+        Equivalente a WebDriverWait(driver, timeout).until(condition) pero
+        respetando el plazo del paso y el intervalo de sondeo de la política.
+        Lanza TimeoutException si la condición no se cumple a tiempo.
+        """
+        end_time = self.clock.now() + self.budget(timeout)
+        while True:
+            try:
+                value = condition(driver)
+                if value:
+                    return value
+            except self.IGNORED_EXCEPTIONS:
+                pass
+
+            remaining = end_time - self.clock.now()
+            if remaining <= 0:
+                raise TimeoutException(message)
+            self.clock.sleep(min(self.poll_frequency, remaining))
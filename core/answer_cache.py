@@ -0,0 +1,141 @@
+import difflib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from config.settings import settings
+
+
+class AnswerCache:
+    """
+    Respuestas del formulario de Easy Apply por pregunta (JSON en ANSWERS_FILE).
+
+    Las preguntas se guardan normalizadas (minúsculas, sin acentos ni
+    signos, sin "required"/"*"), así que "Years of experience with Python? *"
+    y "years of experience with python" son la misma. Solo se responde con
+    una coincidencia exacta de la pregunta normalizada: "...with Python" y
+    "...with Java", o "work in the US" y "work in the UK", se parecen más
+    de un 85 % y un "yes" guardado no puede llegar a otra pregunta legal.
+    La pregunta guardada más parecida (difflib, parecido mínimo de
+    ANSWER_MATCH_CUTOFF) es solo una sugerencia (suggest) para la cola de
+    revisión; nunca se envía.
+
+    Con opciones (select, radio) la respuesta se traduce a la opción igual
+    una vez normalizada; si ninguna encaja, la pregunta cuenta como sin
+    respuesta.
+
+    El archivo puede editarse a mano: acepta {"pregunta": "respuesta"} o
+    {"pregunta normalizada": {"question": ..., "answer": ...}}.
+    Operación silenciosa - no genera logs.
+    """
+
+    # Sufijos que LinkedIn agrega a la etiqueta y no cambian la pregunta
+    NOISE = re.compile(r"\b(required|requerido|obligatorio)\b")
+
+    def __init__(self, answers_file=None, cutoff=None):
+        self.answers_file = answers_file or settings.ANSWERS_FILE
+        self.cutoff = settings.ANSWER_MATCH_CUTOFF if cutoff is None else cutoff
+        self.answers = None
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._load())
+
+    @classmethod
+    def normalize(cls, text):
+        """Texto comparable de una pregunta u opción"""
+        text = unicodedata.normalize("NFKD", str(text or ""))
+        text = "".join(char for char in text if not unicodedata.combining(char)).lower()
+        text = re.sub(r"[^\w\s]", " ", text)
+        text = cls.NOISE.sub(" ", text)
+        return " ".join(text.split())
+
+    # ==================== CONSULTA ====================
+
+    def lookup(self, question, options=None):
+        """
+        Respuesta guardada para exactamente esta pregunta (normalizada) o
+        None. Con options, retorna la opción que corresponde a la respuesta.
+        """
+        key = self.normalize(question)
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                return None
+            answer = entry.get("answer")
+
+        if options:
+            return self.match_option(answer, options)
+        return answer
+
+    def suggest(self, question):
+        """
+        Pregunta guardada más parecida a question (sin ser la misma):
+        {"question", "answer", "score"} o None. Solo orienta a quien revisa.
+        """
+        key = self.normalize(question)
+        with self._lock:
+            answers = self._load()
+            candidates = [saved for saved in answers if saved != key]
+            close = difflib.get_close_matches(key, candidates, n=1, cutoff=self.cutoff)
+            if not close:
+                return None
+            entry = answers[close[0]]
+        score = difflib.SequenceMatcher(None, key, close[0]).ratio()
+        return {"question": entry.get("question") or close[0], "answer": entry.get("answer"),
+                "score": round(score, 2)}
+
+    def match_option(self, answer, options):
+        """La opción igual a answer una vez normalizadas (o None)"""
+        normalized = {self.normalize(option): option for option in options}
+        return normalized.get(self.normalize(answer))
+
+    # ==================== ESCRITURA ====================
+
+    def store(self, question, answer):
+        """Guarda (o reemplaza) la respuesta de una pregunta"""
+        key = self.normalize(question)
+        if not key:
+            return
+        with self._lock:
+            self._load()[key] = {"question": question, "answer": answer, "updated": round(time.time())}
+            self.dirty = True
+
+    def _load(self):
+        if self.answers is None:
+            self.answers = {}
+            try:
+                with open(self.answers_file, encoding="utf-8") as file:
+                    data = json.load(file)
+            except (OSError, ValueError):
+                data = {}
+            if isinstance(data, dict):
+                for question, entry in data.items():
+                    if not isinstance(entry, dict):
+                        entry = {"question": question, "answer": entry}
+                    if entry.get("answer") is not None and self.normalize(question):
+                        self.answers[self.normalize(question)] = entry
+        return self.answers
+
+    def save(self):
+        """Escribe las respuestas a disco (solo si cambiaron)"""
+        with self._lock:
+            if not self.dirty or self.answers is None:
+                return False
+            data = json.dumps(self.answers, indent=2, ensure_ascii=False)
+            self.dirty = False
+        try:
+            directory = os.path.dirname(self.answers_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temporary = f"{self.answers_file}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.write(data)
+            os.replace(temporary, self.answers_file)
+            return True
+        except OSError:
+            return False
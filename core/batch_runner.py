@@ -0,0 +1,202 @@
+import json
+import os
+import time
+from core.navigation_manager import NavigationManager
+from core.search_spec import SearchSpec
+from config.settings import settings
+from utils.logger import logger
+from utils.web_driver import WebDriverManager
+
+
+class BatchJournal:
+    """
+    Journal de progreso de un lote (JSON lines, solo se agregan líneas).
+    NO genera logs - operaciones internas silenciosas.
+
+    Cada evento se escribe con flush + fsync antes de continuar, así que
+    tras un corte de luz o un Chrome caído el journal refleja exactamente
+    la última página terminada. Una última línea cortada se ignora al leer.
+
+        {"event": "page", "key": <url de la búsqueda>, "page": 3, "new": 12, "at": ...}
+        {"event": "done", "key": ..., "new": 40, "at": ...}
+        {"event": "failed", "key": ..., "error": "...", "at": ...}
+    """
+
+    EVENT_PAGE = "page"
+    EVENT_DONE = "done"
+    EVENT_FAILED = "failed"
+
+    def __init__(self, journal_file=None):
+        self.journal_file = journal_file or settings.BATCH_JOURNAL_FILE
+        directory = os.path.dirname(self.journal_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def load(self):
+        """Estado por búsqueda: {key: {"page": última página, "done": bool, "new": empleos}}"""
+        state = {}
+        if not os.path.exists(self.journal_file):
+            return state
+
+        with open(self.journal_file, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                progress = state.setdefault(entry.get("key"), {"page": 0, "done": False, "new": 0})
+                if entry.get("event") == self.EVENT_PAGE:
+                    progress["page"] = max(progress["page"], entry.get("page", 0))
+                    progress["new"] += entry.get("new", 0)
+                elif entry.get("event") == self.EVENT_DONE:
+                    progress["done"] = True
+        return state
+
+    def record(self, event, key, **data):
+        entry = {"event": event, "key": key, **data, "at": time.time()}
+        with open(self.journal_file, "a", encoding="utf-8") as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def reset(self):
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+
+
+class BatchRunner:
+    """
+    Ejecuta una lista de búsquedas (SearchSpec) con un solo navegador,
+    guardando progreso tras cada página y cada búsqueda en un BatchJournal.
+
+    Al reiniciar, las búsquedas terminadas se omiten y la interrumpida
+    continúa desde la página siguiente a la última guardada. Si Chrome deja
+    de responder se abre uno nuevo y se reintenta (max_attempts). Cuando
+    todas las búsquedas terminan, el journal se borra: el próximo lote
+    empieza de cero.
+    """
+
+    def __init__(self, specs, journal_file=None, max_attempts=None, max_results=None, max_pages=None,
+                 driver_manager_factory=WebDriverManager):
+        self.specs = [SearchSpec.coerce(spec) for spec in specs]
+        self.journal = BatchJournal(journal_file)
+        self.max_attempts = max_attempts or settings.BATCH_MAX_ATTEMPTS
+        self.max_results = max_results
+        self.max_pages = max_pages
+        self.driver_manager_factory = driver_manager_factory
+        self.driver_manager = None
+        self.navigation = None
+
+    @staticmethod
+    def load_specs(specs_file):
+        """
+        Lee búsquedas de un archivo:
+        - .json: lista de textos o de objetos SearchSpec
+        - otro: una búsqueda por línea (texto o JSON); '#' comenta
+        """
+        with open(specs_file, encoding="utf-8") as file:
+            if specs_file.endswith(".json"):
+                return [SearchSpec.coerce(item) for item in json.load(file)]
+
+            specs = []
+            for line in file:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                specs.append(SearchSpec.coerce(json.loads(line) if line.startswith("{") else line))
+            return specs
+
+    def run(self):
+        """Ejecuta las búsquedas pendientes; retorna un resumen del lote"""
+        state = self.journal.load()
+        summary = {"total": len(self.specs), "skipped": 0, "done": 0, "failed": 0, "new_jobs": 0}
+
+        try:
+            for index, spec in enumerate(self.specs, 1):
+                progress = state.setdefault(spec.key(), {"page": 0, "done": False, "new": 0})
+                if progress["done"]:
+                    summary["skipped"] += 1
+                    continue
+
+                logger.section(f"📦 LOTE {index}/{len(self.specs)}: {spec}")
+                if progress["page"]:
+                    logger.info(f"⏩ Reanudando desde la página {progress['page'] + 1}")
+
+                if self._run_spec(spec, progress):
+                    summary["done"] += 1
+                    summary["new_jobs"] += progress["new"]
+                else:
+                    summary["failed"] += 1
+        finally:
+            self._teardown()
+
+        if summary["failed"] == 0:
+            self.journal.reset()
+        return summary
+
+    # ==================== MÉTODOS AUXILIARES ====================
+
+    def _run_spec(self, spec, progress):
+        key = spec.key()
+
+        def checkpoint(page, new_on_page):
+            progress["page"] = page
+            progress["new"] += new_on_page
+            self.journal.record(BatchJournal.EVENT_PAGE, key, page=page, new=new_on_page)
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                navigation = self._navigation()
+                if navigation.go_to_jobs_and_search(spec):
+                    navigation.crawl_results(
+                        max_results=self.max_results,
+                        max_pages=self.max_pages,
+                        start_page=progress["page"] + 1,
+                        on_page=checkpoint,
+                    )
+                    # Un recorrido cortado por un Chrome caído no es una búsqueda terminada
+                    if self._is_healthy():
+                        self.journal.record(BatchJournal.EVENT_DONE, key, new=progress["new"])
+                        progress["done"] = True
+                        return True
+                    error = "navegador sin respuesta durante el recorrido"
+                else:
+                    error = "búsqueda no completada"
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                error = str(e).splitlines()[0] if str(e) else type(e).__name__
+
+            # Con el navegador sano el fallo es de la búsqueda: no se reintenta
+            if self._is_healthy():
+                break
+            logger.info(f"♻️  Navegador sin respuesta (intento {attempt}/{self.max_attempts}) - reiniciando")
+            self._teardown()
+
+        logger.error(f"❌ Búsqueda fallida: {spec} - {error}")
+        self.journal.record(BatchJournal.EVENT_FAILED, key, error=error)
+        return False
+
+    def _navigation(self):
+        if self.navigation is None:
+            self.driver_manager = self.driver_manager_factory()
+            driver = self.driver_manager.setup_driver()
+            self.navigation = NavigationManager(driver)
+        return self.navigation
+
+    def _is_healthy(self):
+        if not self.navigation:
+            return False
+        try:
+            return self.navigation.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _teardown(self):
+        if self.driver_manager:
+            try:
+                self.driver_manager.teardown_driver()
+            except Exception:
+                pass
+        self.driver_manager = None
+        self.navigation = None
@@ -0,0 +1,191 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config.settings import settings
+from core.search_spec import SearchSpec
+from core.worker_pool import ApplyTask, BrowserPool, SearchTask
+from utils.logger import logger
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """
+    API HTTP local del daemon (JSON):
+
+    - GET  /status            → estado de los navegadores y la cola
+    - POST /search {"query", "filters"}  → ejecuta una búsqueda en un navegador ya autenticado
+      con el flujo completo (NavigationManager.run_search): guarda los empleos
+      nuevos en el JobStore y responde con ellos ("cards", "new_jobs")
+      (filters: campos opcionales de SearchSpec, ej. {"remote": "remote", "sort": "date"};
+      opcionales: "max_results", "fetch_details", "easy_apply")
+    - POST /apply {"job_ids", "review"}  → Easy Apply a empleos ya guardados (y, con
+      review, a los que quedaron en revisión con respuestas nuevas); un informe por empleo
+    - POST /shutdown          → apagado ordenado
+    """
+
+    # Opciones de run_search que acepta POST /search
+    SEARCH_OPTIONS = ("max_results", "fetch_details", "easy_apply")
+
+    def do_GET(self):
+        if self.path == "/status":
+            return self._send_json(200, self.server.browser_daemon.status())
+        self._send_json(404, {"error": "ruta desconocida"})
+
+    def do_POST(self):
+        try:
+            payload = self._read_json()
+        except ValueError:
+            return self._send_json(400, {"error": "JSON inválido"})
+
+        if self.path == "/search":
+            return self._handle_search(payload)
+        if self.path == "/apply":
+            return self._handle_apply(payload)
+        if self.path == "/shutdown":
+            self._send_json(200, {"ok": True})
+            threading.Thread(target=self.server.browser_daemon.stop, daemon=True).start()
+            return
+        self._send_json(404, {"error": "ruta desconocida"})
+
+    def _handle_search(self, payload):
+        query = payload.get("query")
+        if not query:
+            return self._send_json(400, {"error": "falta 'query'"})
+        try:
+            filters = payload.get("filters")
+            if filters:
+                spec = SearchSpec.from_dict({**filters, "keywords": query})
+            else:
+                spec = SearchSpec.from_settings(query)
+        except (TypeError, ValueError) as e:
+            return self._send_json(400, {"query": query, "error": str(e)})
+
+        options = {name: payload[name] for name in self.SEARCH_OPTIONS if payload.get(name) is not None}
+        # Los empleos en revisión se reintentan con POST /apply {"review": true}
+        self._run_task(SearchTask(spec, retry_review=False, **options), payload, {"query": query})
+
+    def _handle_apply(self, payload):
+        job_ids = payload.get("job_ids") or []
+        if not isinstance(job_ids, list) or not (job_ids or payload.get("review")):
+            return self._send_json(400, {"error": "falta 'job_ids' (lista) o 'review'"})
+        self._run_task(ApplyTask(job_ids, bool(payload.get("review")), payload.get("limit")), payload)
+
+    # ==================== AUXILIARES ====================
+
+    def _run_task(self, task, payload, context=None):
+        """Encola la tarea en el pool, espera su resumen y lo responde con el tiempo total"""
+        context = context or {}
+        started_at = time.monotonic()
+        try:
+            future = self.server.browser_daemon.pool.submit_task(task, timeout=payload.get("queue_timeout", 5))
+            result = future.result(timeout=payload.get("timeout"))
+        except Exception as e:
+            return self._send_json(500, {**context, "error": str(e) or type(e).__name__})
+
+        self._send_json(200, {**context, **result, "elapsed": round(time.monotonic() - started_at, 3)})
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode("utf-8"))
+
+    def _send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silencioso - el daemon registra sus propios logs"""
+        pass
+
+
+class BrowserDaemon:
+    """
+    Daemon de larga duración: mantiene navegadores autenticados vivos y
+    recibe trabajo por HTTP local (127.0.0.1).
+
+    Las búsquedas y postulaciones reutilizan NavigationManager/JobsPage en
+    navegadores ya abiertos y con sesión, sin pagar el arranque de Chrome
+    ni el login; los empleos van al JobStore compartido del pool.
+    Los navegadores inactivos más de idle_timeout se cierran y se
+    vuelven a abrir con la siguiente tarea.
+    """
+
+    def __init__(self, workers=None, host=None, port=None, idle_timeout=None):
+        self.host = host or settings.DAEMON_HOST
+        self.port = settings.DAEMON_PORT if port is None else port
+        self.pool = BrowserPool(
+            size=workers or settings.POOL_SIZE,
+            warm=True,
+            idle_timeout=settings.DAEMON_IDLE_TIMEOUT if idle_timeout is None else idle_timeout,
+        )
+        self.httpd = None
+        self.started_at = None
+
+    def serve_forever(self):
+        """Arranca los navegadores y atiende peticiones hasta stop()"""
+        self.httpd = ThreadingHTTPServer((self.host, self.port), DaemonRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.browser_daemon = self
+        self.port = self.httpd.server_address[1]
+        self.started_at = time.monotonic()
+
+        self.pool.start()
+        logger.success(f"🛰️  Daemon escuchando en http://{self.host}:{self.port}")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_pending=True)
+            self.httpd.server_close()
+            logger.info("🔚 Daemon detenido")
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+
+    def status(self):
+        return {
+            "uptime": round(time.monotonic() - self.started_at, 1) if self.started_at else 0,
+            "queued": self.pool.tasks.qsize(),
+            "workers": self.pool.health(),
+        }
+
+
+class DaemonClient:
+    """Cliente mínimo de la API del daemon"""
+
+    def __init__(self, host=None, port=None):
+        self.base_url = f"http://{host or settings.DAEMON_HOST}:{port or settings.DAEMON_PORT}"
+
+    def status(self):
+        return self._request("GET", "/status")
+
+    def search(self, query, timeout=None, filters=None, **options):
+        return self._request("POST", "/search", {"query": query, "timeout": timeout, "filters": filters, **options})
+
+    def apply(self, job_ids=None, review=False, timeout=None, limit=None):
+        return self._request("POST", "/apply", {"job_ids": list(job_ids or []), "review": review,
+                                                "timeout": timeout, "limit": limit})
+
+    def shutdown(self):
+        return self._request("POST", "/shutdown", {})
+
+    def _request(self, method, path, payload=None):
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            return json.loads(e.read().decode("utf-8") or "{}")
@@ -0,0 +1,232 @@
+from config.settings import settings
+from pages.job_detail import JobDetail
+from utils.rate_governor import RateGovernor, rate_governor
+from utils.selector_registry import selector_registry
+
+
+class DetailTab:
+    """Pestaña del fetcher: handle de ventana y empleo que está cargando"""
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.job_id = None
+        self.started_at = None
+        self.loaded = 0
+
+    @property
+    def busy(self):
+        return self.job_id is not None
+
+
+class DetailFetcher:
+    """
+    Lee el detalle de varios empleos con un número acotado de pestañas
+    dentro del MISMO navegador (misma sesión, sin login extra).
+
+    1. Abre hasta `concurrency` pestañas (se reutilizan: nunca una por empleo)
+    2. Cada pestaña libre recibe el siguiente empleo: la navegación se
+       inicia con location.href (no bloquea), así que todas las pestañas
+       cargan en paralelo mientras Python sigue repartiendo
+    3. Una ronda pasa por las pestañas ocupadas y ejecuta un único script
+       que retorna el detalle si la página ya está lista (o null); la
+       pestaña que termina recibe el siguiente empleo al instante
+    4. Al final cierra sus pestañas y vuelve a la ventana original
+
+    Con capture (NetworkCapture), si la pestaña ya recibió el detalle de
+    la API (/voyager/api/jobs/jobPostings/<id>) se usa ese JSON sin leer
+    el DOM ni esperar a que la página lo pinte.
+
+    fetch() es un generador de JobDetail en orden de llegada. Los
+    empleos que no cargan en DETAIL_TIMEOUT (o que piden login) quedan
+    en self.failed como (job_id, motivo).
+    El RateGovernor se consulta una vez por tanda de `concurrency`
+    navegaciones (una ficha "detail", prioridad baja), no por empleo: las
+    pestañas de una tanda arrancan juntas y el presupuesto cuenta tandas,
+    así la espera entre acciones no serializa la concurrencia.
+
+    Operación silenciosa - no genera logs.
+    """
+
+    # Marca el documento actual antes de navegar: mientras la marca exista,
+    # la pestaña todavía muestra la página anterior
+    NAVIGATE_SCRIPT = """
+        window.__ajaNavigating = true;
+        window.location.href = arguments[0];
+    """
+
+    # Detalle de la página si ya está lista, {error: ...} si no es la vista
+    # esperada, o null si todavía está cargando
+    EXTRACT_DETAIL_SCRIPT = """
+        var jobId = arguments[0], s = arguments[1];
+        if (window.__ajaNavigating || document.readyState === 'loading') return null;
+        if (document.querySelector(s.login)) return {error: 'login'};
+        if (location.pathname.indexOf('/jobs/view/' + jobId) === -1) {
+            return /\\/(authwall|checkpoint)/.test(location.pathname) ? {error: 'login'} : null;
+        }
+
+        function text(selector) {
+            var el = document.querySelector(selector);
+            return el ? (el.innerText || el.textContent || '').trim() : '';
+        }
+        var description = text(s.description);
+        if (!description) return null;
+
+        var insights = [];
+        var nodes = document.querySelectorAll(s.insights);
+        for (var i = 0; i < nodes.length; i++) {
+            var value = (nodes[i].innerText || nodes[i].textContent || '').trim();
+            if (value) insights.push(value.split('\\n')[0].trim());
+        }
+        return {
+            job_id: jobId,
+            title: text(s.title).split('\\n')[0],
+            company: text(s.company).split('\\n')[0],
+            location: text(s.location).split('\\n')[0],
+            description: description,
+            insights: insights,
+            easy_apply: /easy apply/i.test(text(s.apply_button))
+        };
+    """
+
+    def __init__(self, driver, concurrency=None, timeout=None, clock=None, capture=None):
+        self.driver = driver
+        self.capture = capture
+        self.policy = settings.WAIT_POLICY
+        self.clock = clock or self.policy.clock
+        self.concurrency = max(1, settings.DETAIL_CONCURRENCY if concurrency is None else concurrency)
+        self.timeout = settings.DETAIL_TIMEOUT if timeout is None else timeout
+        self.tabs = []
+        # Navegaciones que quedan en la tanda cubierta por la última ficha
+        self.batch_left = 0
+        self.failed = []
+        self.fetched = 0
+        self.elapsed = 0.0
+        self.original_handle = None
+        self.selectors = {
+            "login": selector_registry.group("login_form"),
+            "title": selector_registry.group("detail_title"),
+            "company": selector_registry.group("detail_company"),
+            "location": selector_registry.group("detail_location"),
+            "description": selector_registry.group("detail_description"),
+            "insights": selector_registry.group("detail_insights"),
+            "apply_button": selector_registry.group("detail_apply_button"),
+        }
+
+    # ==================== RECORRIDO ====================
+
+    def fetch(self, jobs):
+        """
+        Generador de JobDetail para jobs (JobCard, ids o dicts con job_id),
+        en el orden en que cada pestaña termina de cargar.
+        """
+        pending = [self._job_id(job) for job in jobs]
+        pending.reverse()
+        started_at = self.clock.now()
+        try:
+            self._open_tabs(min(self.concurrency, len(pending)))
+            while pending or any(tab.busy for tab in self.tabs):
+                for tab in self.tabs:
+                    if not tab.busy and pending:
+                        self._assign(tab, pending.pop())
+
+                progressed = False
+                for tab in self.tabs:
+                    if not tab.busy:
+                        continue
+                    detail = self._collect(tab)
+                    if detail is not None:
+                        progressed = True
+                        self.fetched += 1
+                        yield detail
+                    elif not tab.busy:
+                        progressed = True
+
+                if not progressed:
+                    self.clock.sleep(self.policy.ready_poll_interval)
+        finally:
+            self.elapsed = self.clock.now() - started_at
+            self.close()
+
+    def _assign(self, tab, job_id):
+        """Empieza a cargar job_id en la pestaña (sin esperar la carga)"""
+        if self.batch_left <= 0:
+            rate_governor.acquire("detail", RateGovernor.PRIORITY_LOW)
+            self.batch_left = self.concurrency
+        self.batch_left -= 1
+        try:
+            self.driver.switch_to.window(tab.handle)
+            self.driver.execute_script(self.NAVIGATE_SCRIPT, f"{settings.BASE_URL}/jobs/view/{job_id}/")
+        except Exception as e:
+            self.failed.append((job_id, type(e).__name__))
+            return
+        tab.job_id = job_id
+        tab.started_at = self.clock.now()
+
+    def _collect(self, tab):
+        """JobDetail si la pestaña terminó; libera la pestaña si terminó o falló"""
+        try:
+            self.driver.switch_to.window(tab.handle)
+            # El cuerpo de la respuesta se pide con la pestaña activa
+            captured = self.capture.pop_detail(tab.job_id) if self.capture else None
+            if captured:
+                self._release(tab)
+                return captured
+            data = self.driver.execute_script(self.EXTRACT_DETAIL_SCRIPT, tab.job_id, self.selectors)
+        except Exception as e:
+            data = {"error": type(e).__name__}
+
+        if data and not data.get("error"):
+            detail = JobDetail.from_dict(data)
+            self._release(tab)
+            return detail
+
+        if data and data.get("error"):
+            self.failed.append((tab.job_id, data["error"]))
+            self._release(tab)
+        elif self.clock.now() - tab.started_at >= self.timeout:
+            self.failed.append((tab.job_id, "timeout"))
+            self._release(tab)
+        return None
+
+    def _release(self, tab):
+        tab.job_id = None
+        tab.started_at = None
+        tab.loaded += 1
+
+    # ==================== PESTAÑAS ====================
+
+    def _open_tabs(self, count):
+        self.original_handle = self.driver.current_window_handle
+        for _ in range(count - len(self.tabs)):
+            self.driver.switch_to.new_window("tab")
+            self.tabs.append(DetailTab(self.driver.current_window_handle))
+
+    def close(self):
+        """Cierra las pestañas del fetcher y vuelve a la ventana original"""
+        for tab in self.tabs:
+            try:
+                self.driver.switch_to.window(tab.handle)
+                self.driver.close()
+            except Exception:
+                pass
+        self.tabs = []
+        if self.original_handle:
+            try:
+                self.driver.switch_to.window(self.original_handle)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _job_id(job):
+        if isinstance(job, dict):
+            return str(job["job_id"])
+        return str(getattr(job, "job_id", job))
+
+    def stats(self):
+        return {
+            "fetched": self.fetched,
+            "failed": len(self.failed),
+            "tabs": self.concurrency,
+            "elapsed": round(self.elapsed, 3),
+            "per_second": round(self.fetched / self.elapsed, 2) if self.elapsed else 0.0,
+        }
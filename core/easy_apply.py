@@ -0,0 +1,176 @@
+from config.settings import settings
+from core.answer_cache import AnswerCache
+from core.review_queue import ReviewQueue
+from pages.easy_apply_page import EasyApplyPage
+
+
+class ApplyReport:
+    """
+    Resultado de una postulación con Easy Apply.
+
+    - outcome: applied, review, ready (APPLY_DRY_RUN), unconfirmed (el envío
+      no respondió a tiempo: puede haberse enviado), skipped o failed
+    - steps: pasos del modal recorridos
+    - reason: motivo de skipped / failed
+    - unanswered: preguntas que quedaron en la cola de revisión
+    - elapsed: segundos desde que se abrió la vista del empleo
+    """
+
+    def __init__(self, job_id, outcome, steps=0, elapsed=0.0, reason=None, unanswered=None):
+        self.job_id = job_id
+        self.outcome = outcome
+        self.steps = steps
+        self.elapsed = elapsed
+        self.reason = reason
+        self.unanswered = unanswered or []
+
+    def as_dict(self):
+        """Resumen serializable (API del daemon)"""
+        return {
+            "job_id": self.job_id,
+            "outcome": self.outcome,
+            "steps": self.steps,
+            "elapsed": round(self.elapsed, 3),
+            "reason": self.reason,
+            "unanswered": [question.get("label") for question in self.unanswered],
+        }
+
+    def __repr__(self):
+        return (f"ApplyReport(job_id={self.job_id!r}, outcome={self.outcome!r}, steps={self.steps}, "
+                f"elapsed={self.elapsed:.3f}s, reason={self.reason!r})")
+
+
+class EasyApplyEngine:
+    """
+    Recorre el modal de Easy Apply de un empleo paso a paso:
+
+    1. EasyApplyPage.read_step(): todas las preguntas del paso de una vez
+    2. Cada pregunta sin valor se responde con el AnswerCache (misma
+       pregunta normalizada); los campos ya rellenos por LinkedIn (email,
+       teléfono, CV) se respetan
+    3. EasyApplyPage.fill(): todos los valores en un solo script
+    4. EasyApplyPage.advance(): siguiente paso, revisión o envío
+
+    Si una pregunta obligatoria no tiene respuesta (o LinkedIn la rechaza)
+    el empleo no bloquea la ejecución: sus preguntas van a la ReviewQueue,
+    el modal se descarta y se pasa al siguiente. Una pregunta que solo se
+    parece a una guardada también va a revisión, con la respuesta parecida
+    como sugerencia: nunca se rellena ni se envía.
+    Con dry_run (APPLY_DRY_RUN) todo se rellena pero no se envía.
+    Si el envío final no responde dentro de WAIT_POLICY.apply_timeout el
+    resultado es unconfirmed: el modal no se descarta (la postulación puede
+    haber salido) y el empleo no se marca como fallido.
+
+    Operación silenciosa - no genera logs.
+    """
+
+    APPLIED = "applied"
+    REVIEW = "review"
+    READY = "ready"
+    UNCONFIRMED = "unconfirmed"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+    def __init__(self, driver, answers=None, review_queue=None, max_steps=None, dry_run=None, clock=None):
+        self.driver = driver
+        self.page = EasyApplyPage(driver)
+        self.answers = answers or AnswerCache()
+        self.review_queue = review_queue or ReviewQueue()
+        self.max_steps = max_steps or settings.APPLY_MAX_STEPS
+        self.dry_run = settings.APPLY_DRY_RUN if dry_run is None else dry_run
+        self.clock = clock or settings.WAIT_POLICY.clock
+
+    def apply(self, job):
+        """Postula a job (JobCard, id o dict con job_id) y retorna un ApplyReport"""
+        job_id = self._job_id(job)
+        started_at = self.clock.now()
+
+        def report(outcome, steps=0, reason=None, unanswered=None):
+            return ApplyReport(job_id, outcome, steps, self.clock.now() - started_at, reason, unanswered)
+
+        error = self.page.open(job_id)
+        if error:
+            outcome = self.SKIPPED if error in ("not_easy_apply", "no_button") else self.FAILED
+            return report(outcome, reason=error)
+
+        for step in range(1, self.max_steps + 1):
+            state = self.page.read_step()
+            if not state:
+                return report(self.FAILED, step, "no_modal")
+
+            values, unanswered = self.answer(state["fields"])
+            failed = set(self.page.fill(values))
+            unanswered += [field for field in state["fields"] if field["key"] in failed]
+            if unanswered:
+                return self._to_review(job, report, step, unanswered, "unanswered")
+
+            if state["action"] == "submit" and self.dry_run:
+                self.page.dismiss()
+                return report(self.READY, step)
+
+            result = self.page.advance(state["signature"])
+            if result["state"] == "submitted":
+                self.page.dismiss()
+                return report(self.APPLIED, step)
+            if result["state"] == "error":
+                # LinkedIn rechazó alguna respuesta: esas preguntas van a revisión
+                state = self.page.read_step() or {"fields": []}
+                invalid = [field for field in state["fields"] if field.get("invalid")]
+                if not invalid:
+                    # Error sin pregunta señalada: nada que revisar
+                    self.page.dismiss()
+                    return report(self.FAILED, step, "invalid")
+                return self._to_review(job, report, step, invalid, "invalid")
+            if result["state"] == "stuck" and state["action"] == "submit":
+                # El envío no confirmó a tiempo: no se descarta nada
+                return report(self.UNCONFIRMED, step, "submit_unconfirmed")
+            if result["state"] != "next":
+                self.page.dismiss()
+                return report(self.FAILED, step, result["state"])
+
+        self.page.dismiss()
+        return report(self.FAILED, self.max_steps, "too_many_steps")
+
+    def answer(self, fields):
+        """
+        Valores para los campos de un paso: ([[clave, valor], ...], preguntas
+        para revisión). Van a revisión las obligatorias sin respuesta y las
+        que solo se parecen a una pregunta guardada (con "suggestion").
+        Los campos ya completos no se tocan.
+        """
+        values, unanswered = [], []
+        for field in fields:
+            if field["type"] == "file" or (field.get("value") and not field.get("invalid")):
+                continue
+            answer = self.answers.lookup(field["label"], field.get("options") or None)
+            if answer is not None and answer != "":
+                values.append([field["key"], answer])
+                continue
+            suggestion = self.answers.suggest(field["label"])
+            if suggestion:
+                unanswered.append(dict(field, suggestion=suggestion))
+            elif field.get("required"):
+                unanswered.append(field)
+        return values, unanswered
+
+    # ==================== AUXILIARES ====================
+
+    def _to_review(self, job, report, step, questions, reason):
+        self.review_queue.add(self._job_id(job), questions, self._job_field(job, "title"),
+                              self._job_field(job, "company"), reason)
+        self.page.dismiss()
+        return report(self.REVIEW, step, reason, questions)
+
+    @staticmethod
+    def _job_id(job):
+        if isinstance(job, dict):
+            return str(job["job_id"])
+        return str(getattr(job, "job_id", job))
+
+    @staticmethod
+    def _job_field(job, name):
+        if isinstance(job, dict):
+            return job.get(name)
+        if isinstance(job, (str, int)):
+            return None
+        return getattr(job, name, None)
@@ -0,0 +1,243 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from config.settings import settings
+from pages.job_card import JobCard
+
+
+class JobStore:
+    """
+    Almacén persistente de empleos descubiertos (SQLite en modo WAL).
+    NO genera logs - operaciones internas silenciosas.
+
+    Cada empleo guarda los datos de su JobCard, la búsqueda que lo encontró
+    y un estado (seen / applying / applied / review / unconfirmed / skipped / failed). Las inserciones se hacen
+    por lotes en una sola transacción (upsert_cards) y un upsert nunca pisa
+    el estado de un empleo ya conocido. El detalle de cada empleo (descripción
+    y datos destacados) va en una tabla aparte (upsert_details).
+    """
+
+    STATUS_SEEN = "seen"
+    # Reservado por un navegador que está postulando (claim)
+    STATUS_APPLYING = "applying"
+    STATUS_APPLIED = "applied"
+    # Easy Apply a medias: preguntas en la cola de revisión (review.py)
+    STATUS_REVIEW = "review"
+    # El envío no confirmó a tiempo: puede haberse enviado, no se reintenta
+    STATUS_UNCONFIRMED = "unconfirmed"
+    STATUS_SKIPPED = "skipped"
+    STATUS_FAILED = "failed"
+    STATUSES = (STATUS_SEEN, STATUS_APPLYING, STATUS_APPLIED, STATUS_REVIEW, STATUS_UNCONFIRMED,
+                STATUS_SKIPPED, STATUS_FAILED)
+    # Estados desde los que se puede reservar un empleo para postular
+    CLAIMABLE = (STATUS_SEEN, STATUS_REVIEW)
+
+    BATCH_SIZE = 200
+
+    # Límite de parámetros por consulta IN (...) en SQLite
+    _IN_CHUNK = 500
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id      TEXT PRIMARY KEY,  -- índice implícito por job_id
+            title       TEXT,
+            company     TEXT,
+            location    TEXT,
+            posted      TEXT,
+            easy_apply  INTEGER NOT NULL DEFAULT 0,
+            query       TEXT,
+            status      TEXT NOT NULL DEFAULT 'seen',
+            first_seen  REAL NOT NULL,
+            updated_at  REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+        CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs (posted);
+        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+        CREATE TABLE IF NOT EXISTS job_details (
+            job_id      TEXT PRIMARY KEY,
+            description TEXT,
+            insights    TEXT,              -- JSON: lista de textos
+            fetched_at  REAL NOT NULL
+        );
+    """
+
+    UPSERT = """
+        INSERT INTO jobs (job_id, title, company, location, posted, easy_apply, query, first_seen, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (job_id) DO UPDATE SET
+            title = excluded.title,
+            company = excluded.company,
+            location = excluded.location,
+            posted = COALESCE(excluded.posted, jobs.posted),
+            easy_apply = excluded.easy_apply,
+            updated_at = excluded.updated_at
+    """
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or settings.JOB_STORE_FILE
+        directory = os.path.dirname(self.db_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Una conexión compartida entre hilos, serializada con un lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_file, check_same_thread=False, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.SCHEMA)
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # ==================== ESCRITURA ====================
+
+    def upsert_cards(self, cards, query=None, batch_size=None):
+        """
+        Inserta o actualiza tarjetas en lotes de batch_size (una transacción
+        por lote). Retorna el número de tarjetas escritas.
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        now = time.time()
+        rows = [
+            (card.job_id, card.title, card.company, card.location, card.posted,
+             int(card.easy_apply), query, now, now)
+            for card in cards
+        ]
+        with self._lock:
+            for start in range(0, len(rows), batch_size):
+                with self._connection:
+                    self._connection.executemany(self.UPSERT, rows[start:start + batch_size])
+        return len(rows)
+
+    def upsert_details(self, details, batch_size=None):
+        """Guarda JobDetail (descripción y datos destacados) en lotes; retorna cuántos"""
+        batch_size = batch_size or self.BATCH_SIZE
+        now = time.time()
+        rows = [
+            (detail.job_id, detail.description, json.dumps(list(detail.insights), ensure_ascii=False), now)
+            for detail in details
+        ]
+        with self._lock:
+            for start in range(0, len(rows), batch_size):
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO job_details (job_id, description, insights, fetched_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        rows[start:start + batch_size],
+                    )
+        return len(rows)
+
+    def set_status(self, job_id, status):
+        """Cambia el estado de un empleo; retorna False si no existe"""
+        if status not in self.STATUSES:
+            raise ValueError(f"Estado desconocido: {status} (usar {', '.join(self.STATUSES)})")
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ?",
+                (status, time.time(), str(job_id)),
+            )
+        return cursor.rowcount > 0
+
+    def claim(self, job_id):
+        """
+        Reserva un empleo para postular: pasa a 'applying' solo si está en
+        seen/review. El UPDATE condicional es atómico (también entre
+        procesos), así que con varios navegadores solo uno gana. Retorna
+        True si esta llamada lo reservó; False si ya estaba postulado, en
+        curso o no existe. El estado final lo fija set_status.
+        """
+        placeholders = ", ".join("?" * len(self.CLAIMABLE))
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                f"UPDATE jobs SET status = ?, updated_at = ? WHERE job_id = ? AND status IN ({placeholders})",
+                (self.STATUS_APPLYING, time.time(), str(job_id), *self.CLAIMABLE),
+            )
+        return cursor.rowcount > 0
+
+    # ==================== LECTURA ====================
+
+    def contains(self, job_id):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM jobs WHERE job_id = ?", (str(job_id),)
+            ).fetchone()
+        return row is not None
+
+    def known_ids(self, job_ids):
+        """Subconjunto de job_ids que ya están en el almacén"""
+        job_ids = [str(job_id) for job_id in job_ids]
+        known = set()
+        with self._lock:
+            for start in range(0, len(job_ids), self._IN_CHUNK):
+                chunk = job_ids[start:start + self._IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                known.update(row[0] for row in self._connection.execute(
+                    f"SELECT job_id FROM jobs WHERE job_id IN ({placeholders})", chunk
+                ))
+        return known
+
+    def get(self, job_id):
+        """Empleo como dict, o None si no existe"""
+        with self._lock:
+            cursor = self._connection.execute("SELECT * FROM jobs WHERE job_id = ?", (str(job_id),))
+            row = cursor.fetchone()
+            columns = [column[0] for column in cursor.description]
+        return dict(zip(columns, row)) if row else None
+
+    def cards(self, job_ids):
+        """JobCard de los job_ids que están en el almacén (en el orden pedido)"""
+        job_ids = [str(job_id) for job_id in job_ids]
+        found = {}
+        with self._lock:
+            for start in range(0, len(job_ids), self._IN_CHUNK):
+                chunk = job_ids[start:start + self._IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._connection.execute(
+                    f"SELECT job_id, title, company, location, posted, easy_apply FROM jobs "
+                    f"WHERE job_id IN ({placeholders})", chunk
+                ):
+                    found[row[0]] = JobCard.from_row(row)
+        return [found[job_id] for job_id in job_ids if job_id in found]
+
+    def cards_with_status(self, status, limit=None):
+        """JobCard de los empleos con ese estado, los más antiguos primero"""
+        sql = ("SELECT job_id, title, company, location, posted, easy_apply FROM jobs "
+               "WHERE status = ? ORDER BY updated_at")
+        params = [status]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [JobCard.from_row(row) for row in rows]
+
+    def get_details(self, job_id):
+        """Detalle guardado de un empleo como dict (insights como lista), o None"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT description, insights, fetched_at FROM job_details WHERE job_id = ?", (str(job_id),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"job_id": str(job_id), "description": row[0], "insights": json.loads(row[1] or "[]"),
+                "fetched_at": row[2]}
+
+    def count(self, status=None):
+        with self._lock:
+            if status is None:
+                row = self._connection.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            else:
+                row = self._connection.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()
+        return row[0]
@@ -0,0 +1,193 @@
+from urllib.parse import urlparse
+from config.settings import settings
+from utils.cdp_events import CDPEventBus
+
+
+class LoginReport:
+    """
+    Resultado de un intento de login.
+
+    - outcome: success, bad_credentials, checkpoint o timeout
+    - url: URL donde terminó el login (si se conoce)
+    - status: código HTTP del documento final (si llegó por CDP)
+    - elapsed: segundos desde el envío del formulario
+    - source: qué lo detectó ("cdp" o "dom")
+    """
+
+    def __init__(self, outcome, url, elapsed, status=None, source=None):
+        self.outcome = outcome
+        self.url = url
+        self.elapsed = elapsed
+        self.status = status
+        self.source = source
+
+    @property
+    def success(self):
+        return self.outcome == LoginWatcher.SUCCESS
+
+    def __repr__(self):
+        return (f"LoginReport(outcome={self.outcome!r}, url={self.url!r}, "
+                f"elapsed={self.elapsed:.3f}s, source={self.source!r})")
+
+
+class LoginWatcher:
+    """
+    Detecta el final del login por eventos en lugar de sondear la URL.
+
+    1. arm() ANTES de pulsar el botón: se suscribe a Page.frameNavigated y
+       Network.responseReceived en el bus CDP compartido del driver
+    2. wait(): en cuanto el marco principal navega fuera del login se
+       clasifica la URL (éxito o checkpoint/CAPTCHA); si el navegador
+       vuelve a una página de login, un único script en la página decide
+       si hay error de credenciales
+    3. Sin log de rendimiento (bus no soportado) ese mismo script, que no
+       espera nada, hace de respaldo: location.href + errores visibles
+       (el éxito por URL solo cuenta si cambió desde arm(): en /jobs/ el
+       formulario de login está en la misma página)
+
+    Operación silenciosa - no genera logs.
+    """
+
+    SUCCESS = "success"
+    BAD_CREDENTIALS = "bad_credentials"
+    CHECKPOINT = "checkpoint"
+    TIMEOUT = "timeout"
+
+    # URLs de verificación adicional (desafío, CAPTCHA, teléfono, PIN)
+    CHECKPOINT_MARKERS = ("/checkpoint/challenge", "/checkpoint/rp", "/checkpoint/pin",
+                          "captcha", "add-phone", "/two-step")
+    # URLs que siguen siendo parte del login
+    LOGIN_MARKERS = ("login", "signin", "/checkpoint/lg/", "/uas/")
+
+    # Estado del login en la página, sin esperas (un solo viaje)
+    CHECK_SCRIPT = """
+        var errors = document.querySelector(
+            '#error-for-password, #error-for-username, .form__label--error, [role="alert"].alert-content'
+        );
+        var visible = !!(errors && (errors.textContent || '').trim());
+        var challenge = !!document.querySelector(
+            'iframe[src*="captcha"], #captcha-internal, form[action*="checkpoint/challenge"]'
+        );
+        return {url: location.href, error: visible, challenge: challenge};
+    """
+
+    # Segundos entre comprobaciones en la página cuando los eventos no alcanzan
+    DOM_CHECK_INTERVAL = 0.5
+
+    def __init__(self, driver, clock=None):
+        self.driver = driver
+        self.bus = CDPEventBus.for_driver(driver)
+        self.policy = settings.WAIT_POLICY
+        self.clock = clock or self.policy.clock
+        self.listener = None
+        self.navigations = []
+        self.statuses = {}
+        self.armed_at = None
+        self.start_url = None
+
+    # ==================== EVENTOS ====================
+
+    def arm(self):
+        """Empieza a escuchar (llamar antes de enviar el formulario)"""
+        self.bus.poll()
+        self.navigations = []
+        self.statuses = {}
+        self.listener = self.bus.subscribe(self._on_event, "")
+        self.start_url = self._current_url()
+        self.armed_at = self.clock.now()
+        return self
+
+    def disarm(self):
+        if self.listener is not None:
+            self.bus.unsubscribe(self.listener)
+            self.listener = None
+
+    def _on_event(self, method, params):
+        if method == "Page.frameNavigated":
+            frame = params.get("frame", {})
+            if not frame.get("parentId"):
+                self.navigations.append(frame.get("url", ""))
+        elif method == "Network.responseReceived" and params.get("type") == "Document":
+            response = params.get("response", {})
+            self.statuses[response.get("url", "")] = response.get("status")
+
+    # ==================== ESPERA ====================
+
+    def wait(self, timeout=None):
+        """
+        Espera el resultado del login (como máximo timeout segundos,
+        recortado al plazo del paso) y retorna un LoginReport.
+        """
+        if self.armed_at is None:
+            self.arm()
+        timeout = self.policy.budget(self.policy.login_timeout if timeout is None else timeout)
+        deadline = self.armed_at + timeout
+        seen = 0
+        next_dom_check = self.clock.now() + self.DOM_CHECK_INTERVAL
+
+        try:
+            while True:
+                self.bus.poll()
+
+                # Navegaciones nuevas del marco principal
+                while seen < len(self.navigations):
+                    url = self.navigations[seen]
+                    seen += 1
+                    outcome = self.classify_url(url)
+                    if outcome is None:
+                        # Volvió al login: ¿con error de credenciales?
+                        outcome = self._check_page().get("outcome")
+                    if outcome:
+                        return self._report(outcome, url, "cdp")
+
+                now = self.clock.now()
+                if self.bus.supported is False or now >= next_dom_check:
+                    next_dom_check = now + self.DOM_CHECK_INTERVAL
+                    state = self._check_page()
+                    if state.get("outcome"):
+                        return self._report(state["outcome"], state.get("url"), "dom")
+
+                if now >= deadline:
+                    return self._report(self.TIMEOUT, self._current_url(), None)
+                self.clock.sleep(min(self.policy.ready_poll_interval, max(0.0, deadline - now)))
+        finally:
+            self.disarm()
+
+    # ==================== CLASIFICACIÓN ====================
+
+    @classmethod
+    def classify_url(cls, url):
+        """success / checkpoint según la URL, o None si sigue en el login"""
+        if not url or url.startswith(("about:", "data:", "chrome-error:")):
+            return None
+        path = urlparse(url.lower()).path
+        if any(marker in path for marker in cls.CHECKPOINT_MARKERS):
+            return cls.CHECKPOINT
+        if any(marker in path for marker in cls.LOGIN_MARKERS):
+            return None
+        return cls.SUCCESS
+
+    def _check_page(self):
+        """Un execute_script: URL actual, error de credenciales o desafío visible"""
+        try:
+            state = self.driver.execute_script(self.CHECK_SCRIPT) or {}
+        except Exception:
+            return {}
+        url = state.get("url")
+        if state.get("challenge"):
+            state["outcome"] = self.CHECKPOINT
+        elif state.get("error"):
+            state["outcome"] = self.BAD_CREDENTIALS
+        elif url != self.start_url:
+            state["outcome"] = self.classify_url(url)
+        return state
+
+    def _current_url(self):
+        try:
+            return self.driver.current_url
+        except Exception:
+            return None
+
+    def _report(self, outcome, url, source):
+        return LoginReport(outcome, url, self.clock.now() - self.armed_at,
+                           self.statuses.get(url), source)
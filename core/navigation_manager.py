@@ -1,7 +1,17 @@
+from contextlib import contextmanager
 from pages.jobs_page import JobsPage
 from core.session_manager import SessionManager
+from core.login_watcher import LoginWatcher
+from core.detail_fetcher import DetailFetcher
+from core.answer_cache import AnswerCache
+from core.easy_apply import EasyApplyEngine
+from core.review_queue import ReviewQueue
+from core.network_capture import NetworkCapture
+from core.job_store import JobStore
+from core.search_spec import SearchSpec
 from config.settings import settings
 from utils.logger import logger
+from utils.tracing import tracer
 
 class NavigationManager:
     """
@@ -12,63 +22,188 @@ class NavigationManager:
     3. Si SÍ hay formulario de login → Loguearse y volver a /jobs/
     """
     
-    def __init__(self, driver):
+    def __init__(self, driver, session_manager=None, job_store=None):
         self.driver = driver
-        self.session_manager = SessionManager()
+        self.session_manager = session_manager or SessionManager()
+        self._job_store = job_store
         self.jobs_page = JobsPage(driver)
+        self.wait_policy = settings.WAIT_POLICY
+        # Sesión ya verificada en este navegador (permite reutilizarlo)
+        self.authenticated = False
+        # La sesión se dio por válida solo por el sondeo (sin mirar el DOM)
+        self.session_from_probe = False
+        self.next_step = 3
+        self.current_spec = None
+        # Escucha la API desde el principio: las respuestas de la primera
+        # página llegan durante la navegación de la búsqueda
+        self.capture = NetworkCapture.for_driver(driver) if settings.NETWORK_CAPTURE else None
     
-    def go_to_jobs_and_search(self):
+    @property
+    def job_store(self):
+        """Almacén de empleos (se abre al primer uso)"""
+        if self._job_store is None:
+            self._job_store = JobStore()
+        return self._job_store
+    
+    def go_to_jobs_and_search(self, query=None):
         """
         Flujo simplificado con logs diferenciados:
         1. Ir a https://www.linkedin.com/jobs/
         2. Verificar si hay formulario de login
         3. Si NO hay formulario → Buscar
         4. Si SÍ hay formulario → Login y volver a intentar
+        
+        query: SearchSpec, dict con sus campos o texto a buscar (por defecto
+        settings.JOB_SEARCH_QUERY con los filtros de la configuración).
+        La búsqueda navega directo a la URL de resultados con los filtros;
+        en un navegador ya autenticado es la única navegación.
+        
+        Cada paso tiene un plazo total (WAIT_POLICY.step_deadline): una página
+        lenta falla rápido y de forma predecible en lugar de acumular timeouts.
         """
         
+        spec = SearchSpec.coerce(query)
+        self.current_spec = spec
+        
         logger.section("🚀 INICIANDO PROCESO DE BÚSQUEDA EN LINKEDIN JOBS")
-        logger.info(f"Búsqueda configurada: '{settings.JOB_SEARCH_QUERY}'")
+        logger.info(f"Búsqueda configurada: '{spec}'")
         logger.separator()
         
+        if self.authenticated:
+            # Navegador reutilizado: directo a los resultados
+            self.next_step = 1
+            if self._search_step(spec):
+                return True
+            if not self.jobs_page.is_login_form_present(timeout=0):
+                return False
+            logger.info("⚠️  La sesión expiró - Se requiere autenticación")
+            self.authenticated = False
+        
+        if not self.ensure_session():
+            return False
+        
+        if self._search_step(spec):
+            return True
+        
+        # El sondeo dio la sesión por válida pero LinkedIn pide login
+        # (cookie revocada en el servidor): login y un segundo intento
+        if not self.session_from_probe or not self.jobs_page.is_login_form_present(timeout=0):
+            return False
+        logger.info("⚠️  La sesión guardada ya no es válida - Se requiere autenticación")
+        self.authenticated = False
+        if not self.ensure_session(force_login=True):
+            return False
+        return self._search_step(spec)
+    
+    def run_search(self, query=None, fetch_details=None, easy_apply=None, retry_review=True,
+                   max_results=None, job_store=None):
+        """
+        Flujo completo de una búsqueda, el mismo con un navegador (main.py),
+        en cada tarea del pool o en el daemon:
+        
+        búsqueda → empleos nuevos al almacén → detalle (FETCH_DETAILS) →
+        Easy Apply (EASY_APPLY; con retry_review, antes los empleos en
+        revisión que ya tienen respuestas)
+        
+        Retorna un resumen serializable:
+        {"query", "success", "new_jobs", "cards": [dict de JobCard], "details",
+         "apply": {resultado: cantidad}}
+        """
+        fetch_details = settings.FETCH_DETAILS if fetch_details is None else fetch_details
+        easy_apply = settings.EASY_APPLY if easy_apply is None else easy_apply
+        job_store = job_store or self.job_store
+        spec = SearchSpec.coerce(query)
+        result = {"query": spec.keywords, "success": False, "new_jobs": 0, "cards": [], "details": 0, "apply": {}}
+        
+        if not self.go_to_jobs_and_search(spec):
+            return result
+        result["success"] = True
+        
+        # Recorrer resultados y guardar solo los empleos nuevos
+        new_cards = self.crawl_results(job_store, max_results=max_results)
+        result["new_jobs"] = len(new_cards)
+        result["cards"] = [card._asdict() for card in new_cards]
+        
+        # Detalle de los empleos nuevos (varias pestañas en paralelo)
+        if fetch_details:
+            result["details"] = len(self.fetch_details(new_cards, job_store))
+        
+        # Postulación con Easy Apply (preguntas sin respuesta → review.py)
+        if easy_apply:
+            cards = (self.review_cards(job_store) if retry_review else []) + new_cards
+            for report in self.apply_to_jobs(cards, job_store):
+                result["apply"][report.outcome] = result["apply"].get(report.outcome, 0) + 1
+        return result
+    
+    def ensure_session(self, force_login=False):
+        """
+        Pasos 1-5: deja el navegador con la sesión iniciada.
+        
+        El sondeo de SessionManager.probe_auth decide el camino sin
+        renderizar /jobs/:
+        - logged_in: se cargan las cookies (CDP, sin navegar) y no se busca
+          el formulario de login; la búsqueda es la primera navegación
+        - expired (o force_login): directo a la página de login (LOGIN_URL)
+        - unknown: /jobs/ y verificación del formulario en el DOM
+        
+        Si este navegador ya se autenticó antes (navegador reutilizado,
+        modo daemon) se omite la carga de cookies y se verifica en el DOM.
+        Retorna True si la sesión quedó activa.
+        """
         # PASO 1: Cargar cookies y navegar
         logger.section("📂 PASO 1: CARGANDO SESIÓN Y NAVEGANDO")
-        self._load_cookies_if_exist()
-        self.jobs_page.navigate_to_jobs()
+        with self._step("PASO 1") as deadline:
+            if force_login:
+                auth_state = SessionManager.AUTH_EXPIRED
+            elif self.authenticated:
+                auth_state = SessionManager.AUTH_UNKNOWN
+            else:
+                auth_state = self._load_cookies_if_exist()
+            
+            if auth_state == SessionManager.AUTH_EXPIRED:
+                self.jobs_page.navigate_to_login()
+            elif auth_state == SessionManager.AUTH_UNKNOWN:
+                self.jobs_page.navigate_to_jobs()
+        if not self._within_deadline(deadline):
+            return False
         logger.separator()
+        self.session_from_probe = auth_state == SessionManager.AUTH_LOGGED_IN
         
-        # PASO 2: Verificar si hay formulario de login
-        logger.section("🔍 PASO 2: VERIFICANDO ESTADO DE AUTENTICACIÓN")
-        has_login_form = self.jobs_page.is_login_form_present()
+        # PASO 2: Verificar si hay formulario de login (solo si el sondeo no lo sabe)
+        if auth_state == SessionManager.AUTH_UNKNOWN:
+            logger.section("🔍 PASO 2: VERIFICANDO ESTADO DE AUTENTICACIÓN")
+            with self._step("PASO 2"):
+                has_login_form = self.jobs_page.is_login_form_present()
+        else:
+            has_login_form = auth_state == SessionManager.AUTH_EXPIRED
         
         if not has_login_form:
-            # NO hay formulario → Hacer búsqueda directamente
+            # NO hay formulario → Sesión activa
             logger.success("✓ Sesión activa - No se requiere login")
             logger.separator()
-            
-            logger.section("🔎 PASO 3: REALIZANDO BÚSQUEDA DE EMPLEO")
-            success = self.jobs_page.search_job()
-            logger.separator()
-            
-            if success:
-                logger.success("🎉 BÚSQUEDA COMPLETADA EXITOSAMENTE")
-            else:
-                logger.error("❌ ERROR: No se pudo completar la búsqueda")
-            
-            return success
+            self.authenticated = True
+            self.next_step = 3
+            return True
         
         # SÍ hay formulario → Hacer login
+        self.authenticated = False
         logger.info("⚠️  Se requiere autenticación")
         logger.separator()
         
         # PASO 3: Realizar login
         logger.section("🔐 PASO 3: INICIANDO SESIÓN")
-        if not self.jobs_page.perform_login(settings.EMAIL, settings.PASSWORD):
-            logger.error("❌ ERROR: Fallo al enviar credenciales")
-            return False
-        
-        # Esperar a que se complete el login
-        if not self._wait_for_login_redirect():
-            logger.error("❌ ERROR: Login no completado o credenciales incorrectas")
+        with self._step("PASO 3") as deadline:
+            # Escuchar las navegaciones antes de pulsar el botón
+            watcher = LoginWatcher(self.driver).arm()
+            if not self.jobs_page.perform_login(settings.EMAIL, settings.PASSWORD):
+                watcher.disarm()
+                logger.error("❌ ERROR: Fallo al enviar credenciales")
+                return False
+            
+            # Esperar a que se complete el login
+            if not self._wait_for_login(watcher):
+                return False
+        if not self._within_deadline(deadline):
             return False
         
         logger.success("✓ Login exitoso - Sesión establecida")
@@ -76,22 +211,36 @@ class NavigationManager:
         
         # PASO 4: Volver a /jobs/ después del login
         logger.section("🔄 PASO 4: VOLVIENDO A LINKEDIN JOBS")
-        self.jobs_page.navigate_to_jobs()
+        with self._step("PASO 4") as deadline:
+            self.jobs_page.navigate_to_jobs()
+        if not self._within_deadline(deadline):
+            return False
         logger.separator()
         
         # PASO 5: Verificar que ya no haya formulario
         logger.section("✅ PASO 5: VERIFICANDO AUTENTICACIÓN")
-        if self.jobs_page.is_login_form_present():
+        with self._step("PASO 5"):
+            login_still_present = self.jobs_page.is_login_form_present()
+        if login_still_present:
             # Login falló, todavía pide credenciales
             logger.error("❌ ERROR: Autenticación fallida - Formulario aún presente")
             return False
         
         logger.success("✓ Autenticación verificada")
         logger.separator()
-        
-        # PASO 6: Realizar búsqueda
-        logger.section("🔎 PASO 6: REALIZANDO BÚSQUEDA DE EMPLEO")
-        success = self.jobs_page.search_job()
+        self.authenticated = True
+        self.next_step = 6
+        return True
+    
+    def _search_step(self, spec):
+        """Último paso: búsqueda de empleo (numerado según si hubo login)"""
+        step = f"PASO {self.next_step}"
+        logger.section(f"🔎 {step}: REALIZANDO BÚSQUEDA DE EMPLEO")
+        if self.capture:
+            self.capture.reset()
+        with self._step(step) as deadline:
+            success = self.jobs_page.open_search(spec)
+        success = success and self._within_deadline(deadline)
         logger.separator()
         
         if success:
@@ -101,41 +250,229 @@ class NavigationManager:
         
         return success
     
+    def crawl_results(self, job_store=None, stop_at_known=None, max_results=None, max_pages=None,
+                      start_page=1, on_page=None, query=None):
+        """
+        Recorre los resultados de la búsqueda actual y guarda los empleos nuevos.
+        
+        Los empleos que ya están en el almacén se omiten. Con stop_at_known
+        (búsqueda ordenada por fecha) el recorrido termina en el primer empleo
+        conocido: todo lo que sigue ya se vio en una ejecución anterior.
+        Por defecto se activa si la búsqueda actual está ordenada por fecha.
+        
+        Los empleos de cada página quedan guardados antes de llamar a
+        on_page(página, nuevas), así que sirve como checkpoint.
+        Retorna la lista de JobCard nuevas.
+        """
+        job_store = job_store or self.job_store
+        if stop_at_known is None:
+            stop_at_known = bool(self.current_spec and self.current_spec.sorted_by_date)
+        if query is None and self.current_spec:
+            query = self.current_spec.keywords
+        new_cards, pending = [], []
+        
+        def page_done(page, new_on_page):
+            job_store.upsert_cards(pending, query=query)
+            pending.clear()
+            if on_page:
+                on_page(page, new_on_page)
+        
+        with tracer.span("crawl_results", "results") as span:
+            for card in self.jobs_page.iter_results(max_results, max_pages, start_page, page_done,
+                                                    capture=self.capture):
+                if job_store.contains(card.job_id):
+                    if stop_at_known:
+                        logger.info(f"🛑 Empleo ya conocido ({card.job_id}) - Resto de resultados ya vistos")
+                        break
+                    continue
+                
+                new_cards.append(card)
+                pending.append(card)
+                if len(pending) >= job_store.BATCH_SIZE:
+                    job_store.upsert_cards(pending, query=query)
+                    pending.clear()
+            span.set(new=len(new_cards))
+        
+        job_store.upsert_cards(pending, query=query)
+        logger.success(f"💾 {len(new_cards)} empleos nuevos guardados ({job_store.count()} en total)")
+        return new_cards
+    
+    def fetch_details(self, cards, job_store=None, concurrency=None):
+        """
+        Lee el detalle (descripción, datos destacados) de cada empleo con
+        varias pestañas en paralelo (DetailFetcher) y lo guarda en el almacén.
+        Retorna la lista de JobDetail leídos.
+        """
+        cards = list(cards or [])
+        if not cards:
+            return []
+        job_store = job_store or self.job_store
+        fetcher = DetailFetcher(self.driver, concurrency, capture=self.capture)
+        
+        logger.section(f"📑 LEYENDO DETALLE DE {len(cards)} EMPLEOS ({fetcher.concurrency} pestañas)")
+        with tracer.span("fetch_details", "details", jobs=len(cards)) as span:
+            details = list(fetcher.fetch(cards))
+            stats = fetcher.stats()
+            span.set(fetched=stats["fetched"], failed=stats["failed"])
+        
+        job_store.upsert_details(details)
+        logger.success(f"📑 {stats['fetched']} detalles en {stats['elapsed']:.1f}s "
+                       f"({stats['per_second']:.2f} empleos/s)")
+        if fetcher.failed:
+            reasons = ", ".join(f"{job_id} ({reason})" for job_id, reason in fetcher.failed[:5])
+            logger.info(f"⚠️  {len(fetcher.failed)} empleos sin detalle: {reasons}")
+        return details
+    
+    def apply_to_jobs(self, cards, job_store=None, limit=None, engine=None):
+        """
+        Postula con Easy Apply a los empleos que lo permiten (como máximo
+        APPLY_MAX_PER_RUN) y actualiza su estado en el almacén. Las
+        preguntas sin respuesta quedan en la cola de revisión (review.py).
+        Cada empleo se reserva en el almacén (claim) antes de postular: si
+        otro navegador del pool ya lo tomó o ya está postulado, se salta.
+        Retorna la lista de ApplyReport.
+        """
+        limit = settings.APPLY_MAX_PER_RUN if limit is None else limit
+        cards = [card for card in cards or [] if card.easy_apply]
+        if limit:
+            cards = cards[:limit]
+        if not cards:
+            return []
+        job_store = job_store or self.job_store
+        engine = engine or EasyApplyEngine(self.driver)
+        
+        logger.section(f"📨 EASY APPLY: {len(cards)} EMPLEOS")
+        reports = []
+        with tracer.span("easy_apply", "apply", jobs=len(cards)) as span:
+            for card in cards:
+                label = f"{card.title} ({card.company})"
+                if not job_store.claim(card.job_id):
+                    logger.info(f"⏭️  Ya postulado o en curso en otro navegador: {label}")
+                    continue
+                try:
+                    report = engine.apply(card)
+                except Exception:
+                    # No dejar el empleo reservado si el navegador falla a medias
+                    job_store.set_status(card.job_id, job_store.STATUS_FAILED)
+                    raise
+                reports.append(report)
+                if report.outcome == engine.APPLIED:
+                    job_store.set_status(card.job_id, job_store.STATUS_APPLIED)
+                    logger.success(f"📨 Postulación enviada: {label} - {report.steps} pasos, {report.elapsed:.1f}s")
+                elif report.outcome == engine.UNCONFIRMED:
+                    job_store.set_status(card.job_id, job_store.STATUS_UNCONFIRMED)
+                    logger.info(f"❔ Envío sin confirmar (puede haberse enviado, revisar en LinkedIn): {label}")
+                elif report.outcome == engine.READY:
+                    job_store.set_status(card.job_id, job_store.STATUS_SEEN)
+                    logger.info(f"🧪 Formulario completo sin enviar (APPLY_DRY_RUN): {label}")
+                elif report.outcome == engine.REVIEW:
+                    job_store.set_status(card.job_id, job_store.STATUS_REVIEW)
+                    logger.info(f"📝 {len(report.unanswered)} preguntas a revisión: {label}")
+                elif report.outcome == engine.SKIPPED:
+                    job_store.set_status(card.job_id, job_store.STATUS_SKIPPED)
+                    logger.info(f"⏭️  Sin Easy Apply ({report.reason}): {label}")
+                else:
+                    job_store.set_status(card.job_id, job_store.STATUS_FAILED)
+                    logger.error(f"❌ Postulación fallida ({report.reason}): {label}")
+            counts = {}
+            for report in reports:
+                counts[report.outcome] = counts.get(report.outcome, 0) + 1
+            span.set(**counts)
+        
+        engine.answers.save()
+        logger.success(f"📨 {counts.get(engine.APPLIED, 0)} postulaciones enviadas, "
+                       f"{counts.get(engine.REVIEW, 0)} a revisión, {counts.get(engine.UNCONFIRMED, 0)} sin confirmar, "
+                       f"{counts.get(engine.FAILED, 0)} fallidas")
+        return reports
+    
+    def review_cards(self, job_store=None, engine=None):
+        """
+        Empleos que quedaron en revisión (estado "review") y cuyas preguntas
+        ya tienen respuesta en el AnswerCache: listos para volver a postular.
+        """
+        job_store = job_store or self.job_store
+        cards = job_store.cards_with_status(job_store.STATUS_REVIEW)
+        if not cards:
+            return []
+        answers = engine.answers if engine else AnswerCache()
+        queue = engine.review_queue if engine else ReviewQueue()
+        blocked = queue.blocked_jobs(
+            lambda question: answers.lookup(question.get("label"), question.get("options") or None) is not None
+        )
+        ready = [card for card in cards if card.job_id not in blocked]
+        if ready:
+            logger.info(f"📝 {len(ready)} empleos en revisión con respuestas nuevas - Se vuelve a postular")
+        return ready
+    
     # ==================== MÉTODOS AUXILIARES ====================
     
+    @contextmanager
+    def _step(self, label):
+        """Paso del flujo: plazo total de WAIT_POLICY y span de trazado"""
+        with tracer.span(label, "step") as span:
+            with self.wait_policy.step(label) as deadline:
+                yield deadline
+            if deadline.expired():
+                span.set("timeout")
+    
+    def _within_deadline(self, deadline):
+        """Verifica que el paso terminó dentro de su plazo total"""
+        if deadline.expired():
+            logger.error(f"⏱️  {deadline.label} excedió su plazo de {deadline.budget:.0f}s")
+            return False
+        return True
+    
+    @tracer.traced("load_cookies", "session")
     def _load_cookies_if_exist(self):
-        """Carga cookies si existen (silencioso)"""
-        if self.session_manager.cookies_exist():
-            logger.info("📝 Cargando cookies de sesión anterior...")
-            return self.session_manager.load_cookies(self.driver)
-        else:
+        """
+        Carga cookies si existen (silencioso).
+        Antes de cargar nada se sondea la sesión en milisegundos
+        (SessionManager.probe_auth): una sesión vencida se detecta sin
+        cargar ninguna página y se va directo al flujo de login.
+        Retorna el estado del sondeo (AUTH_LOGGED_IN, AUTH_EXPIRED o
+        AUTH_UNKNOWN); logged_in solo si las cookies se cargaron.
+        """
+        if not self.session_manager.cookies_exist():
+            # El perfil del navegador podría tener sesión: se mira el DOM
             logger.info("📝 No se encontraron cookies - Primera ejecución")
-        return False
+            return SessionManager.AUTH_UNKNOWN
+        
+        auth_state = self.session_manager.probe_auth()
+        elapsed_ms = self.session_manager.last_probe["elapsed_ms"]
+        
+        if auth_state == SessionManager.AUTH_EXPIRED:
+            logger.info(f"📝 La sesión guardada venció ({elapsed_ms:.0f} ms) - Directo al login")
+            return auth_state
+        
+        if auth_state == SessionManager.AUTH_LOGGED_IN:
+            logger.info(f"📝 Sesión guardada válida ({elapsed_ms:.0f} ms) - Cargando cookies...")
+        else:
+            logger.info("📝 Cargando cookies de sesión anterior...")
+        if not self.session_manager.load_cookies(self.driver):
+            return SessionManager.AUTH_UNKNOWN
+        return auth_state
     
-    def _wait_for_login_redirect(self):
+    def _wait_for_login(self, watcher):
         """
-        Espera a que se complete el login y redirija.
-        Verifica que ya no estemos en página de login.
+        Espera el resultado del login (LoginWatcher: eventos de navegación,
+        sin sondear la URL) y lo reporta.
+        El tiempo máximo es WAIT_POLICY.login_timeout (recortado al plazo del paso).
+        Retorna True solo si el login terminó con éxito.
         """
-        import time
-        start_time = time.time()
-        
         logger.info("⏳ Esperando redirección después del login...")
+        with tracer.span("login_redirect", "login") as span:
+            report = watcher.wait()
+            span.set(report.outcome, source=report.source)
         
-        while time.time() - start_time < 10:
-            current_url = self.driver.current_url.lower()
-            
-            # Si ya no estamos en página de login, éxito
-            if "login" not in current_url and "signin" not in current_url:
-                # Guardar cookies para próxima vez
-                logger.info("💾 Guardando cookies de sesión...")
-                self.session_manager.save_cookies(self.driver)
-                return True
-            
-            # Si después de 3 segundos todavía hay formulario, falló
-            if time.time() - start_time > 3 and self.jobs_page.is_login_form_present():
-                return False
-            
-            time.sleep(0.5)
+        if report.success:
+            logger.info(f"💾 Redirección en {report.elapsed:.2f}s - Guardando cookies de sesión...")
+            self.session_manager.save_cookies(self.driver)
+            return True
         
+        if report.outcome == LoginWatcher.BAD_CREDENTIALS:
+            logger.error("❌ ERROR: Credenciales incorrectas")
+        elif report.outcome == LoginWatcher.CHECKPOINT:
+            logger.error(f"🧩 ERROR: LinkedIn pide una verificación adicional (checkpoint/CAPTCHA): {report.url}")
+        else:
+            logger.error(f"⏱️  ERROR: El login no terminó en {report.elapsed:.1f}s")
         return False
\ No newline at end of file
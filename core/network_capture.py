@@ -0,0 +1,241 @@
+import base64
+import json
+from collections import deque
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from config.settings import settings
+from pages.job_card import JobCard
+from pages.job_detail import JobDetail
+from utils.cdp_events import CDPEventBus
+
+
+class NetworkCapture:
+    """
+    Captura los datos de empleos desde las respuestas JSON de la API
+    interna de LinkedIn (voyager) en lugar de leer el DOM.
+
+    1. Escucha los eventos Network.* del bus CDP compartido y anota las
+       peticiones a los endpoints conocidos (CARD_ENDPOINTS,
+       DETAIL_ENDPOINTS) que respondieron 200
+    2. Al llegar su Network.loadingFinished pide el cuerpo con
+       Network.getResponseBody (mientras la página sigue cargada)
+    3. Decodifica el JSON a los MISMOS registros que el scraper:
+       JobCard (resultados) y JobDetail (vista de detalle)
+
+    Quien consume (ResultsPaginator, DetailFetcher) toma lo capturado y,
+    si no hay nada (endpoint cambiado, log de rendimiento no disponible),
+    sigue leyendo el DOM como siempre.
+
+    Una instancia por driver: NetworkCapture.for_driver(driver).
+    Operación silenciosa - no genera logs.
+    """
+
+    _ATTRIBUTE = "_network_capture"
+
+    CARDS = "cards"
+    DETAIL = "detail"
+
+    # Resultados de búsqueda (tarjetas) y detalle de un empleo
+    CARD_ENDPOINTS = ("/voyager/api/voyagerjobsdashjobcards", "/voyager/api/search/hits")
+    DETAIL_ENDPOINTS = ("/voyager/api/jobs/jobpostings/",)
+
+    CARD_TYPE = "JobPostingCard"
+
+    def __init__(self, driver, clock=None):
+        self.driver = driver
+        self.bus = CDPEventBus.for_driver(driver)
+        self.clock = clock or settings.WAIT_POLICY.clock
+        self.pending = {}
+        self.cards = deque()
+        self.details = {}
+        # paging ({start, count, total}) de la última respuesta de resultados
+        self.paging = {}
+        self.stats = {"cards": 0, "details": 0, "errors": 0}
+        self.listener = self.bus.subscribe(self._on_event, "Network.")
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Obtiene (o crea) la captura asociada a un driver"""
+        capture = getattr(driver, cls._ATTRIBUTE, None)
+        if capture is None:
+            capture = cls(driver)
+            try:
+                setattr(driver, cls._ATTRIBUTE, capture)
+            except Exception:
+                pass
+        return capture
+
+    @property
+    def supported(self):
+        return self.bus.supported is not False
+
+    # ==================== EVENTOS ====================
+
+    @classmethod
+    def classify(cls, url):
+        """CARDS / DETAIL si la URL es de un endpoint conocido, o None"""
+        path = urlparse(url).path.lower()
+        if any(endpoint in path for endpoint in cls.CARD_ENDPOINTS):
+            return cls.CARDS
+        if any(endpoint in path for endpoint in cls.DETAIL_ENDPOINTS):
+            return cls.DETAIL
+        return None
+
+    def _on_event(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            # En vuelo desde que sale: collect_cards() espera su respuesta
+            kind = self.classify(params.get("request", {}).get("url", ""))
+            if kind:
+                self.pending[request_id] = kind
+        elif method == "Network.responseReceived":
+            response = params.get("response", {})
+            kind = self.classify(response.get("url", ""))
+            if kind and response.get("status") == 200:
+                self.pending[request_id] = kind
+            else:
+                self.pending.pop(request_id, None)
+        elif method == "Network.loadingFinished":
+            kind = self.pending.pop(request_id, None)
+            if kind:
+                self._read(request_id, kind)
+        elif method == "Network.loadingFailed":
+            self.pending.pop(request_id, None)
+
+    def _read(self, request_id, kind):
+        try:
+            response = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            body = response.get("body", "")
+            if response.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8")
+            payload = json.loads(body)
+        except Exception:
+            self.stats["errors"] += 1
+            return
+
+        if kind == self.CARDS:
+            cards = self.decode_job_cards(payload)
+            self.paging = (payload.get("data") or {}).get("paging") or {}
+            self.cards.extend(cards)
+            self.stats["cards"] += len(cards)
+        else:
+            detail = self.decode_job_posting(payload)
+            if detail:
+                self.details[detail.job_id] = detail
+                self.stats["details"] += 1
+
+    # ==================== CONSUMO ====================
+
+    def collect_cards(self, timeout=0):
+        """
+        Tarjetas capturadas desde la última llamada. Si hay respuestas de
+        resultados todavía en vuelo, espera (como máximo timeout) a que
+        terminen de llegar.
+        """
+        deadline = self.clock.now() + timeout
+        self.bus.poll()
+        while self.CARDS in self.pending.values() and self.clock.now() < deadline:
+            self.clock.sleep(settings.WAIT_POLICY.ready_poll_interval)
+            self.bus.poll()
+        cards = list(self.cards)
+        self.cards.clear()
+        return cards
+
+    def pop_detail(self, job_id):
+        """JobDetail capturado de job_id (o None)"""
+        self.bus.poll()
+        return self.details.pop(str(job_id), None)
+
+    def reset(self):
+        """Descarta lo capturado (ej. antes de una búsqueda nueva)"""
+        self.bus.poll()
+        self.pending.clear()
+        self.cards.clear()
+        self.details.clear()
+        self.paging = {}
+
+    # ==================== DECODIFICACIÓN ====================
+
+    @classmethod
+    def decode_job_cards(cls, payload):
+        """
+        Tarjetas de una respuesta de resultados en formato normalizado
+        (entidades JobPostingCard en "included"), en el orden de la página.
+        """
+        entities = {}
+        for entity in payload.get("included") or []:
+            if cls.CARD_TYPE in entity.get("$type", ""):
+                entities[entity.get("entityUrn")] = entity
+
+        # El orden de la página está en data["*elements"]; si no, el de included
+        order = (payload.get("data") or {}).get("*elements") or list(entities)
+        cards, seen = [], set()
+        for urn in order:
+            entity = entities.get(urn)
+            if not entity:
+                continue
+            job_id = cls._urn_id(entity.get("jobPostingUrn") or entity.get("entityUrn"))
+            title = entity.get("jobPostingTitle") or cls._text(entity.get("title"))
+            if not job_id or not title or job_id in seen:
+                continue
+            seen.add(job_id)
+
+            posted, easy_apply = None, False
+            for item in entity.get("footerItems") or []:
+                if item.get("type") == "LISTED_DATE" and item.get("timeAt"):
+                    posted = cls._iso_date(item["timeAt"])
+                elif item.get("type") == "EASY_APPLY_TEXT":
+                    easy_apply = True
+            cards.append(JobCard(
+                job_id, title,
+                cls._text(entity.get("primaryDescription")),
+                cls._text(entity.get("secondaryDescription")),
+                posted, easy_apply,
+            ))
+        return cards
+
+    @classmethod
+    def decode_job_posting(cls, payload):
+        """JobDetail de una respuesta de /jobs/jobPostings/<id> (o None)"""
+        data = payload.get("data") or payload
+        job_id = str(data.get("jobPostingId") or cls._urn_id(data.get("entityUrn")) or "")
+        if not job_id:
+            return None
+
+        company = ""
+        for value in (data.get("companyDetails") or {}).values():
+            if isinstance(value, dict):
+                company = (value.get("companyResolutionResult") or {}).get("name") or value.get("companyName") or ""
+                if company:
+                    break
+
+        insights = [value for value in (data.get("formattedEmploymentStatus"),
+                                        data.get("formattedExperienceLevel")) if value]
+        apply_type = (data.get("applyMethod") or {}).get("$type", "")
+        return JobDetail(
+            job_id,
+            data.get("title") or "",
+            company,
+            data.get("formattedLocation") or "",
+            cls._text(data.get("description")),
+            tuple(insights),
+            "OnsiteApply" in apply_type,
+        )
+
+    @staticmethod
+    def _text(value):
+        if isinstance(value, dict):
+            return (value.get("text") or "").strip()
+        return (value or "").strip()
+
+    @staticmethod
+    def _urn_id(urn):
+        """urn:li:fsd_jobPosting:123 → "123" (también urn:li:...:(123,CONTEXTO))"""
+        if not urn:
+            return None
+        last = urn.rsplit(":", 1)[-1].strip("()")
+        return last.split(",")[0] or None
+
+    @staticmethod
+    def _iso_date(milliseconds):
+        return datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc).date().isoformat()
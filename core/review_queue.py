@@ -0,0 +1,99 @@
+import json
+import os
+import time
+from config.settings import settings
+
+
+class ReviewQueue:
+    """
+    Cola de preguntas de Easy Apply que nadie sabe responder todavía
+    (JSON lines en REVIEW_QUEUE_FILE, solo se agregan líneas).
+    NO genera logs - operaciones internas silenciosas.
+
+    En lugar de bloquear la ejecución, el empleo se deja para después y
+    sus preguntas quedan aquí; review.py las pregunta a una persona, guarda
+    las respuestas en el AnswerCache y vacía la cola. El empleo queda como
+    "review" en el JobStore: la próxima ejecución vuelve a postular a los
+    que ya no tienen preguntas pendientes (blocked_jobs).
+
+        {"job_id": "...", "title": "...", "company": "...", "reason": "unanswered",
+         "questions": [{"label": "...", "type": "select", "options": [...],
+                        "suggestion": {"question": "...", "answer": "...", "score": 0.9}}], "at": ...}
+
+    suggestion (opcional): respuesta de una pregunta guardada parecida.
+    """
+
+    def __init__(self, queue_file=None):
+        self.queue_file = queue_file or settings.REVIEW_QUEUE_FILE
+        directory = os.path.dirname(self.queue_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def add(self, job_id, questions, title=None, company=None, reason="unanswered"):
+        entry = {
+            "job_id": str(job_id),
+            "title": title,
+            "company": company,
+            "reason": reason,
+            "questions": [self._question(question) for question in questions],
+            "at": time.time(),
+        }
+        with open(self.queue_file, "a", encoding="utf-8") as file:
+            file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    @staticmethod
+    def _question(question):
+        entry = {"label": question.get("label"), "type": question.get("type"),
+                 "options": question.get("options") or []}
+        if question.get("suggestion"):
+            entry["suggestion"] = question["suggestion"]
+        return entry
+
+    def entries(self):
+        """Todas las entradas (una última línea cortada se ignora)"""
+        if not os.path.exists(self.queue_file):
+            return []
+        entries = []
+        with open(self.queue_file, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+        return entries
+
+    def pending_questions(self, normalize=None):
+        """
+        Preguntas distintas de la cola, en orden de llegada, con los empleos
+        que las pidieron: [{"label", "type", "options", "jobs": [...]}].
+        normalize: función para agrupar etiquetas equivalentes.
+        """
+        normalize = normalize or (lambda text: (text or "").strip().lower())
+        questions = {}
+        for entry in self.entries():
+            for question in entry.get("questions") or []:
+                key = normalize(question.get("label"))
+                if not key:
+                    continue
+                pending = questions.setdefault(key, dict(question, jobs=[]))
+                pending["jobs"].append(entry.get("job_id"))
+        return list(questions.values())
+
+    def blocked_jobs(self, answered):
+        """
+        job_id con alguna pregunta todavía sin respuesta (o sin preguntas:
+        no hay respuesta que lo desbloquee, reintentarlo repetiría el fallo).
+        answered(pregunta) -> True si el AnswerCache ya la responde.
+        """
+        blocked = set()
+        for entry in self.entries():
+            questions = entry.get("questions") or []
+            if not questions or any(not answered(question) for question in questions):
+                blocked.add(str(entry.get("job_id")))
+        return blocked
+
+    def clear(self):
+        if os.path.exists(self.queue_file):
+            os.remove(self.queue_file)
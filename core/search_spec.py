@@ -0,0 +1,150 @@
+from urllib.parse import urlencode
+from config.settings import settings
+from pages.results_paginator import ResultsPaginator
+
+
+class SearchSpec:
+    """
+    Especificación de una búsqueda que se compila directamente a la URL de
+    resultados de LinkedIn, con los filtros aplicados por el servidor:
+
+    - keywords, location / geo_id
+    - remote: onsite, remote, hybrid (f_WT)
+    - date_posted: 24h, week, month (f_TPR)
+    - experience: internship, entry, associate, mid-senior, director, executive (f_E)
+    - easy_apply: solo Easy Apply (f_AL)
+    - sort: relevance o date (sortBy R / DD)
+
+    remote y experience aceptan un valor o una lista. Navegar a to_url()
+    reemplaza escribir en el buscador: una sola navegación por búsqueda.
+    """
+
+    REMOTE = {"onsite": "1", "remote": "2", "hybrid": "3"}
+    DATE_POSTED = {"24h": "r86400", "week": "r604800", "month": "r2592000"}
+    EXPERIENCE = {
+        "internship": "1", "entry": "2", "associate": "3",
+        "mid-senior": "4", "director": "5", "executive": "6",
+    }
+    SORT = {"relevance": "R", "date": "DD"}
+
+    # Campos aceptados por from_dict (además de keywords / query)
+    FIELDS = ("location", "geo_id", "remote", "date_posted", "experience", "easy_apply", "sort")
+
+    def __init__(self, keywords, location=None, geo_id=None, remote=None, date_posted=None,
+                 experience=None, easy_apply=False, sort="relevance"):
+        self.keywords = keywords
+        self.location = location or None
+        self.geo_id = str(geo_id) if geo_id else None
+        self.remote = self._as_list(remote)
+        self.date_posted = (date_posted or "").lower() or None
+        self.experience = self._as_list(experience)
+        self.easy_apply = bool(easy_apply)
+        self.sort = (sort or "relevance").lower()
+
+        self._check("remote", self.remote, self.REMOTE)
+        self._check("experience", self.experience, self.EXPERIENCE)
+        self._check("date_posted", [self.date_posted] if self.date_posted else [], self.DATE_POSTED)
+        self._check("sort", [self.sort], self.SORT)
+
+    @classmethod
+    def from_settings(cls, keywords=None):
+        """Búsqueda con los filtros por defecto de la configuración (.env)"""
+        return cls(
+            keywords or settings.JOB_SEARCH_QUERY,
+            location=settings.JOB_SEARCH_LOCATION,
+            geo_id=settings.JOB_SEARCH_GEO_ID,
+            remote=settings.JOB_SEARCH_REMOTE,
+            date_posted=settings.JOB_SEARCH_DATE_POSTED,
+            experience=settings.JOB_SEARCH_EXPERIENCE,
+            easy_apply=settings.JOB_SEARCH_EASY_APPLY,
+            sort=settings.JOB_SEARCH_SORT,
+        )
+
+    @classmethod
+    def coerce(cls, value):
+        """Acepta un SearchSpec, un dict con sus campos o un texto de búsqueda"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        return cls.from_settings(value)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Búsqueda desde un dict (JSON de lotes o del daemon); campos desconocidos son un error"""
+        data = dict(data)
+        keywords = data.pop("keywords", None)
+        query = data.pop("query", None)
+        keywords = keywords or query
+        if not keywords:
+            raise ValueError("La búsqueda necesita 'keywords'")
+        unknown = sorted(set(data) - set(cls.FIELDS))
+        if unknown:
+            raise ValueError(f"Campos de búsqueda desconocidos: {', '.join(unknown)} "
+                             f"(usar keywords, {', '.join(cls.FIELDS)})")
+        return cls(keywords, **data)
+
+    def as_dict(self):
+        return {
+            "keywords": self.keywords,
+            "location": self.location,
+            "geo_id": self.geo_id,
+            "remote": self.remote,
+            "date_posted": self.date_posted,
+            "experience": self.experience,
+            "easy_apply": self.easy_apply,
+            "sort": self.sort,
+        }
+
+    @property
+    def sorted_by_date(self):
+        return self.sort == "date"
+
+    def key(self):
+        """Identificador estable de la búsqueda (para journals y checkpoints)"""
+        return self.to_url()
+
+    def to_url(self, page=1):
+        """URL de resultados con todos los filtros (page: número de página, desde 1)"""
+        params = [("keywords", self.keywords)]
+        if self.location:
+            params.append(("location", self.location))
+        if self.geo_id:
+            params.append(("geoId", self.geo_id))
+        if self.remote:
+            params.append(("f_WT", ",".join(self.REMOTE[value] for value in self.remote)))
+        if self.date_posted:
+            params.append(("f_TPR", self.DATE_POSTED[self.date_posted]))
+        if self.experience:
+            params.append(("f_E", ",".join(self.EXPERIENCE[value] for value in self.experience)))
+        if self.easy_apply:
+            params.append(("f_AL", "true"))
+        params.append(("sortBy", self.SORT[self.sort]))
+        if page > 1:
+            params.append(("start", str((page - 1) * ResultsPaginator.PAGE_SIZE)))
+        return f"{settings.BASE_URL}/jobs/search/?{urlencode(params)}"
+
+    def __str__(self):
+        filters = [value for value in (self.location, self.date_posted) if value]
+        filters += self.remote + self.experience
+        if self.easy_apply:
+            filters.append("easy apply")
+        if self.sorted_by_date:
+            filters.append("por fecha")
+        return f"{self.keywords} ({', '.join(filters)})" if filters else self.keywords
+
+    # ==================== MÉTODOS AUXILIARES ====================
+
+    @staticmethod
+    def _as_list(value):
+        if not value:
+            return []
+        if isinstance(value, str):
+            return [part.strip().lower() for part in value.split(",") if part.strip()]
+        return [str(part).lower() for part in value]
+
+    @staticmethod
+    def _check(name, values, allowed):
+        for value in values:
+            if value not in allowed:
+                raise ValueError(f"Valor de {name} desconocido: {value} (usar {', '.join(allowed)})")
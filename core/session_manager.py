@@ -1,74 +1,287 @@
+import json
 import pickle
 import os
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlparse
 from selenium.webdriver.remote.webdriver import WebDriver
 from config.settings import settings
+from utils.rate_governor import RateGovernor, rate_governor
 
 class SessionManager:
     """
     Gestor de sesión para cookies.
     NO genera logs - operaciones internas silenciosas.
+
+    Las cookies se restauran y leen por CDP (Network.setCookies /
+    Network.getAllCookies), sin cargar ninguna página. Se guardan en un
+    JSON versionado que conserva la expiración de cada cookie:
+
+        {"version": 1, "saved_at": 1700000000.0, "cookies": [{name, value, domain, path, expires, ...}]}
+
+    El pickle antiguo (LEGACY_COOKIES_FILE) se migra automáticamente.
     """
-    
-    def __init__(self):
-        self.cookies_file = settings.COOKIES_FILE
+
+    FORMAT_VERSION = 1
+
+    # Campos aceptados por CDP Network.setCookies (CookieParam)
+    COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+    # Estados de la sesión guardada
+    STATE_MISSING = "missing"
+    STATE_EXPIRED = "expired"
+    STATE_VALID = "valid"
+
+    # Resultados de probe_auth
+    AUTH_LOGGED_IN = "logged_in"
+    AUTH_EXPIRED = "expired"
+    AUTH_UNKNOWN = "unknown"
+
+    def __init__(self, cookies_file=None):
+        self.cookies_file = cookies_file or settings.COOKIES_FILE
+        self.last_probe = None
         self._ensure_cookies_directory()
-    
+
     def _ensure_cookies_directory(self):
         """Crea directorio de cookies si no existe"""
         os.makedirs(os.path.dirname(self.cookies_file), exist_ok=True)
-    
+
     def save_cookies(self, driver: WebDriver):
         """
-        Guarda cookies del navegador.
+        Guarda cookies del navegador sin navegar (CDP Network.getAllCookies).
         Operación silenciosa - no genera logs.
         """
         try:
-            driver.get("https://www.linkedin.com")
-            cookies = driver.get_cookies()
-            with open(self.cookies_file, 'wb') as file:
-                pickle.dump(cookies, file)
-            return True
+            try:
+                cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+            except Exception:
+                # Driver sin CDP: cookies del documento actual
+                cookies = driver.get_cookies()
+
+            cookies = [
+                self._normalize(cookie) for cookie in cookies
+                if settings.COOKIE_DOMAIN in cookie.get("domain", "")
+            ]
+            return self._write(cookies)
         except Exception as e:
             return False
-    
+
     def load_cookies(self, driver: WebDriver):
         """
-        Carga cookies en el navegador.
+        Carga cookies en el navegador ANTES de la primera navegación,
+        todas de una vez con CDP Network.setCookies.
+        Las cookies vencidas se descartan; si la cookie de autenticación
+        venció no se carga nada (retorna False).
         Operación silenciosa - no genera logs.
         """
         try:
-            if not os.path.exists(self.cookies_file):
+            if self.session_state() != self.STATE_VALID:
                 return False
-            
-            with open(self.cookies_file, 'rb') as file:
-                cookies = pickle.load(file)
-            
-            driver.get("https://www.linkedin.com")
-            for cookie in cookies:
-                try:
-                    driver.add_cookie(cookie)
-                except:
-                    continue
-            
+
+            cookies = self.get_valid_cookies()
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
             return True
         except Exception as e:
             return False
-    
+
     def cookies_exist(self):
         """
         Verifica si existen cookies guardadas.
         Operación silenciosa - no genera logs.
         """
-        return os.path.exists(self.cookies_file)
-    
+        return os.path.exists(self.cookies_file) or os.path.exists(settings.LEGACY_COOKIES_FILE)
+
     def delete_cookies(self):
         """
         Elimina cookies guardadas.
         Operación silenciosa - no genera logs.
         """
         try:
-            if os.path.exists(self.cookies_file):
-                os.remove(self.cookies_file)
+            for path in (self.cookies_file, settings.LEGACY_COOKIES_FILE):
+                if os.path.exists(path):
+                    os.remove(path)
             return True
         except Exception as e:
-            return False
\ No newline at end of file
+            return False
+
+    # ==================== ESTADO DE LA SESIÓN (SIN NAVEGAR) ====================
+
+    def get_valid_cookies(self, now=None):
+        """Cookies guardadas que todavía no vencieron"""
+        now = time.time() if now is None else now
+        return [cookie for cookie in self._read() if not self._is_expired(cookie, now)]
+
+    def get_auth_cookie(self):
+        """Cookie de autenticación guardada (settings.AUTH_COOKIE_NAME) o None"""
+        for cookie in self._read():
+            if cookie.get("name") == settings.AUTH_COOKIE_NAME:
+                return cookie
+        return None
+
+    def session_state(self, now=None):
+        """
+        Estado de la sesión guardada, sin cargar ninguna página:
+        - missing: no hay cookies o falta la cookie de autenticación
+        - expired: la cookie de autenticación venció
+        - valid: la cookie de autenticación sigue vigente
+        """
+        auth_cookie = self.get_auth_cookie()
+        if not auth_cookie or not auth_cookie.get("value"):
+            return self.STATE_MISSING
+        if self._is_expired(auth_cookie, time.time() if now is None else now):
+            return self.STATE_EXPIRED
+        return self.STATE_VALID
+
+    # ==================== SONDEO RÁPIDO DE AUTENTICACIÓN ====================
+
+    def probe_auth(self, driver=None, http_check=None, timeout=3):
+        """
+        Determina en milisegundos si hay sesión, sin renderizar /jobs/:
+
+        1. Revisa las cookies guardadas (presencia y expiración de la cookie de auth)
+        2. Opcionalmente (http_check) hace UNA petición HTTP a AUTH_PROBE_URL con
+           las cookies del navegador (si se pasa driver) o las guardadas, sin
+           seguir redirecciones: 200 → logged_in, redirección a login → expired
+
+        Retorna AUTH_LOGGED_IN, AUTH_EXPIRED o AUTH_UNKNOWN.
+        El detalle queda en self.last_probe (estado, fuente, ms).
+        """
+        started_at = time.perf_counter()
+        http_check = settings.AUTH_PROBE_HTTP if http_check is None else http_check
+
+        state = self.session_state()
+        if state == self.STATE_EXPIRED:
+            result, source = self.AUTH_EXPIRED, "cookies"
+        elif state == self.STATE_MISSING and driver is None:
+            # Sin cookie guardada: el perfil del navegador podría tener sesión
+            result, source = self.AUTH_UNKNOWN, "cookies"
+        elif http_check:
+            result, source = self._probe_http(self._cookies_for_probe(driver), timeout), "http"
+        else:
+            result = self.AUTH_LOGGED_IN if state == self.STATE_VALID else self.AUTH_UNKNOWN
+            source = "cookies"
+
+        self.last_probe = {
+            "state": result,
+            "source": source,
+            "elapsed_ms": round((time.perf_counter() - started_at) * 1000, 1),
+        }
+        return result
+
+    def _cookies_for_probe(self, driver):
+        """Cookies del navegador (CDP, sin navegar) o, si no hay driver, las guardadas"""
+        if driver is not None:
+            try:
+                return driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+            except Exception:
+                pass
+        return self.get_valid_cookies()
+
+    def _probe_http(self, cookies, timeout):
+        host = urlparse(settings.AUTH_PROBE_URL).hostname or ""
+        cookie_header = "; ".join(
+            f"{cookie['name']}={cookie['value']}"
+            for cookie in cookies
+            if self._domain_matches(host, cookie.get("domain", ""))
+        )
+        if not cookie_header:
+            return self.AUTH_EXPIRED
+
+        # Una petición real a LinkedIn: cuenta en el presupuesto como la navegación que evita
+        rate_governor.acquire("probe", RateGovernor.PRIORITY_HIGH)
+        request = urllib.request.Request(settings.AUTH_PROBE_URL, headers={
+            "Cookie": cookie_header,
+            "User-Agent": settings.USER_AGENT,
+        })
+        opener = urllib.request.build_opener(_NoRedirectHandler)
+        try:
+            with opener.open(request, timeout=timeout) as response:
+                status, location = response.status, ""
+        except urllib.error.HTTPError as e:
+            status, location = e.code, e.headers.get("Location", "") or ""
+        except Exception:
+            return self.AUTH_UNKNOWN
+
+        if status == 200:
+            return self.AUTH_LOGGED_IN
+        if status in (401, 403):
+            return self.AUTH_EXPIRED
+        if 300 <= status < 400:
+            location = location.lower()
+            if any(marker in location for marker in ("login", "authwall", "signin", "uas/")):
+                return self.AUTH_EXPIRED
+        return self.AUTH_UNKNOWN
+
+    @staticmethod
+    def _domain_matches(host, domain):
+        domain = domain.lstrip(".")
+        return bool(domain) and (host == domain or host.endswith("." + domain))
+
+    # ==================== FORMATO EN DISCO ====================
+
+    def _normalize(self, cookie):
+        """Convierte una cookie de Selenium o CDP al formato CookieParam de CDP"""
+        normalized = {field: cookie[field] for field in self.COOKIE_FIELDS if field in cookie}
+
+        # Selenium usa 'expiry'; CDP usa 'expires' (-1 = cookie de sesión)
+        if "expires" not in normalized and "expiry" in cookie:
+            normalized["expires"] = cookie["expiry"]
+        if normalized.get("expires", -1) in (-1, None) or cookie.get("session"):
+            normalized.pop("expires", None)
+
+        if normalized.get("sameSite") not in ("Strict", "Lax", "None"):
+            normalized.pop("sameSite", None)
+
+        normalized.setdefault("path", "/")
+        return normalized
+
+    @staticmethod
+    def _is_expired(cookie, now):
+        expires = cookie.get("expires")
+        return expires is not None and expires <= now
+
+    def _read(self):
+        """Lee las cookies guardadas (migrando el pickle antiguo si hace falta)"""
+        try:
+            if not os.path.exists(self.cookies_file):
+                return self._migrate_legacy()
+
+            with open(self.cookies_file, "r", encoding="utf-8") as file:
+                data = json.load(file)
+
+            if data.get("version") != self.FORMAT_VERSION:
+                return []
+            return data.get("cookies", [])
+        except Exception as e:
+            return []
+
+    def _write(self, cookies):
+        data = {
+            "version": self.FORMAT_VERSION,
+            "saved_at": time.time(),
+            "cookies": cookies,
+        }
+        temp_file = self.cookies_file + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+        os.replace(temp_file, self.cookies_file)
+        return True
+
+    def _migrate_legacy(self):
+        """Convierte cookies/linkedin_cookies.pkl (lista de Selenium) al formato nuevo"""
+        if not os.path.exists(settings.LEGACY_COOKIES_FILE):
+            return []
+
+        with open(settings.LEGACY_COOKIES_FILE, "rb") as file:
+            cookies = [self._normalize(cookie) for cookie in pickle.load(file)]
+
+        self._write(cookies)
+        return cookies
+
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Convierte las redirecciones en HTTPError para poder clasificarlas"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
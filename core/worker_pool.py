@@ -0,0 +1,305 @@
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import Future
+from config.settings import settings
+from core.job_store import JobStore
+from core.navigation_manager import NavigationManager
+from core.session_manager import SessionManager
+from utils.logger import logger
+from utils.web_driver import WebDriverManager
+
+
+class SearchTask:
+    """
+    Búsqueda pendiente en la cola del pool (resultado en self.future).
+    Ejecuta el flujo completo de NavigationManager.run_search (resultados,
+    detalle, Easy Apply) y su resumen es el resultado; options son sus
+    argumentos (fetch_details, easy_apply, retry_review, max_results).
+    """
+
+    def __init__(self, query, **options):
+        self.query = query
+        self.options = options
+        self.future = Future()
+
+    def run(self, navigation):
+        return navigation.run_search(self.query, **self.options)
+
+
+class ApplyTask:
+    """
+    Postulación con Easy Apply pendiente en la cola del pool: empleos ya
+    guardados en el JobStore (job_ids) y, con review, los que quedaron en
+    revisión y ya tienen respuestas. El resultado es un resumen con un
+    ApplyReport por empleo.
+    """
+
+    def __init__(self, job_ids=None, review=False, limit=None):
+        self.job_ids = [str(job_id) for job_id in job_ids or []]
+        self.review = review
+        self.limit = limit
+        self.future = Future()
+
+    def run(self, navigation):
+        result = {"success": False, "requested": len(self.job_ids), "unknown": [], "reports": []}
+        if not navigation.authenticated and not navigation.ensure_session():
+            return result
+
+        job_store = navigation.job_store
+        cards = job_store.cards(self.job_ids)
+        known = {card.job_id for card in cards}
+        result["unknown"] = [job_id for job_id in self.job_ids if job_id not in known]
+        if self.review:
+            review = navigation.review_cards(job_store)
+            pending = {card.job_id for card in review}
+            cards = review + [card for card in cards if card.job_id not in pending]
+        reports = navigation.apply_to_jobs(cards, job_store, limit=self.limit)
+        result["success"] = True
+        result["reports"] = [report.as_dict() for report in reports]
+        return result
+
+
+class BrowserWorker(threading.Thread):
+    """
+    Un navegador Chrome con perfil y sesión propios.
+
+    Toma tareas de la cola compartida y ejecuta el flujo de
+    NavigationManager. Antes de cada tarea verifica que el navegador
+    responda; si no, lo recicla (cierra y abre uno nuevo).
+
+    - warm: al arrancar abre el navegador e inicia sesión sin esperar tareas
+    - idle_timeout: segundos sin tareas tras los que se cierra el navegador
+      (se vuelve a abrir al llegar la siguiente tarea)
+    """
+
+    def __init__(self, worker_id, tasks, driver_factory, warm=False, idle_timeout=None, job_store=None):
+        super().__init__(name=f"browser-worker-{worker_id}", daemon=True)
+        self.worker_id = worker_id
+        self.tasks = tasks
+        self.driver_factory = driver_factory
+        self.job_store = job_store
+        self.warm = warm
+        self.idle_timeout = idle_timeout
+        self.driver_manager = None
+        self.navigation = None
+        self.completed = 0
+        self.failed = 0
+        self.recycled = 0
+        self.busy = False
+        self.last_used = time.monotonic()
+
+    def run(self):
+        if self.warm:
+            self._warm_up()
+
+        check_interval = min(self.idle_timeout, 30) if self.idle_timeout else None
+        while True:
+            try:
+                task = self.tasks.get(timeout=check_interval)
+            except queue.Empty:
+                self._recycle_if_idle()
+                continue
+
+            try:
+                # Centinela de apagado
+                if task is None:
+                    break
+
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+
+                self.busy = True
+                try:
+                    self._ensure_healthy()
+                    result = task.run(self.navigation)
+                    self.completed += 1
+                    task.future.set_result(result)
+                except Exception as e:
+                    self.failed += 1
+                    task.future.set_exception(e)
+                    self._teardown()
+                finally:
+                    self.busy = False
+                    self.last_used = time.monotonic()
+            finally:
+                self.tasks.task_done()
+
+        self._teardown()
+
+    # ==================== SALUD DEL NAVEGADOR ====================
+
+    def is_healthy(self):
+        """El navegador responde a un script trivial"""
+        if not self.driver_manager or not self.driver_manager.driver:
+            return False
+        try:
+            return self.driver_manager.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _ensure_healthy(self):
+        if self.is_healthy():
+            return
+        if self.driver_manager:
+            self.recycled += 1
+            logger.info(f"♻️  Worker {self.worker_id}: navegador sin respuesta - reiniciando")
+        self._teardown()
+        self._setup()
+
+    def _warm_up(self):
+        """Abre el navegador y deja la sesión iniciada antes de la primera tarea"""
+        try:
+            self._ensure_healthy()
+            self.navigation.ensure_session()
+        except Exception:
+            self._teardown()
+        self.last_used = time.monotonic()
+
+    def _recycle_if_idle(self):
+        """Cierra el navegador si lleva más de idle_timeout sin tareas"""
+        if not self.driver_manager or not self.idle_timeout:
+            return
+        if time.monotonic() - self.last_used >= self.idle_timeout:
+            logger.info(f"💤 Worker {self.worker_id}: inactivo {self.idle_timeout:.0f}s - cerrando navegador")
+            self.recycled += 1
+            self._teardown()
+
+    def _setup(self):
+        self.driver_manager, session_manager = self.driver_factory(self.worker_id)
+        driver = self.driver_manager.setup_driver()
+        self.navigation = NavigationManager(driver, session_manager, self.job_store)
+
+    def _teardown(self):
+        if self.driver_manager:
+            try:
+                self.driver_manager.teardown_driver()
+            except Exception:
+                pass
+        self.driver_manager = None
+        self.navigation = None
+
+    def status(self):
+        return {
+            "worker": self.worker_id,
+            "alive": self.is_alive(),
+            "busy": self.busy,
+            "browser_open": self.driver_manager is not None,
+            "authenticated": bool(self.navigation and self.navigation.authenticated),
+            "idle_seconds": round(time.monotonic() - self.last_used, 1),
+            "completed": self.completed,
+            "failed": self.failed,
+            "recycled": self.recycled,
+        }
+
+
+def default_driver_factory(worker_id):
+    """
+    Crea el WebDriverManager y el SessionManager de un worker:
+    perfil de Chrome en PROFILES_DIR/worker_N y cookies propias, sembradas
+    desde las cookies compartidas la primera vez.
+    """
+    profile_dir = os.path.join(settings.PROFILES_DIR, f"worker_{worker_id}")
+    cookies_dir, cookies_name = os.path.split(settings.COOKIES_FILE)
+    cookies_file = os.path.join(cookies_dir, f"worker_{worker_id}", cookies_name)
+
+    if not os.path.exists(cookies_file) and os.path.exists(settings.COOKIES_FILE):
+        os.makedirs(os.path.dirname(cookies_file), exist_ok=True)
+        shutil.copy(settings.COOKIES_FILE, cookies_file)
+
+    return WebDriverManager(profile_dir=profile_dir), SessionManager(cookies_file)
+
+
+class BrowserPool:
+    """
+    Pool de N navegadores que ejecutan búsquedas en paralelo.
+
+    - Cola acotada: submit() bloquea (o lanza queue.Full con timeout)
+      cuando hay demasiadas búsquedas pendientes
+    - Cada worker tiene su propio Chrome, perfil y cookies
+    - Health check antes de cada tarea y reciclaje de navegadores caídos
+    - Un JobStore compartido por todos los workers (SQLite, serializado)
+    - shutdown(): termina lo encolado y cierra todos los navegadores
+
+    Uso:
+        with BrowserPool(size=4) as pool:
+            results = pool.map(["Python Developer", "Data Engineer"])
+    """
+
+    def __init__(self, size=None, queue_size=None, driver_factory=None, warm=False, idle_timeout=None,
+                 job_store=None):
+        self.size = size or settings.POOL_SIZE
+        self.tasks = queue.Queue(maxsize=queue_size or settings.POOL_QUEUE_SIZE)
+        self.driver_factory = driver_factory or default_driver_factory
+        self.warm = warm
+        self.idle_timeout = idle_timeout
+        self.job_store = job_store
+        self.workers = []
+        self._closed = False
+
+    def start(self):
+        if self.job_store is None:
+            self.job_store = JobStore()
+        for worker_id in range(1, self.size + 1):
+            worker = BrowserWorker(
+                worker_id, self.tasks, self.driver_factory,
+                warm=self.warm, idle_timeout=self.idle_timeout, job_store=self.job_store
+            )
+            worker.start()
+            self.workers.append(worker)
+        logger.info(f"🧵 Pool iniciado con {self.size} navegadores")
+        return self
+
+    def submit(self, query, timeout=None, **options):
+        """Encola una búsqueda (flujo completo, ver SearchTask) y retorna su Future"""
+        return self.submit_task(SearchTask(query, **options), timeout)
+
+    def submit_task(self, task, timeout=None):
+        """Encola cualquier tarea con run(navigation) y future"""
+        if self._closed:
+            raise RuntimeError("El pool está cerrado")
+        self.tasks.put(task, timeout=timeout)
+        return task.future
+
+    def map(self, queries, **options):
+        """Ejecuta varias búsquedas y retorna sus resúmenes en orden"""
+        futures = [self.submit(query, **options) for query in queries]
+        return [future.result() for future in futures]
+
+    def health(self):
+        """Estado de cada worker"""
+        return [worker.status() for worker in self.workers]
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Apagado ordenado: opcionalmente cancela lo pendiente, envía un
+        centinela por worker y espera a que cierren sus navegadores.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if cancel_pending:
+            while True:
+                try:
+                    task = self.tasks.get_nowait()
+                except queue.Empty:
+                    break
+                task.future.cancel()
+                self.tasks.task_done()
+
+        for _ in self.workers:
+            self.tasks.put(None)
+
+        if wait:
+            for worker in self.workers:
+                worker.join()
+        logger.info("🔚 Pool cerrado")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown(cancel_pending=exc_type is not None)
@@ -0,0 +1,78 @@
+import argparse
+import json
+import sys
+from core.daemon import BrowserDaemon, DaemonClient
+
+
+def main():
+    """
+    Daemon de navegadores autenticados y su cliente.
+
+    Uso:
+        python daemon.py serve --workers 2          # arranca el daemon
+        python daemon.py search "Python Developer"  # envía búsquedas (empleos nuevos al JobStore)
+        python daemon.py apply 3901 3904            # Easy Apply a empleos ya guardados
+        python daemon.py apply --review             # reintenta los empleos en revisión
+        python daemon.py status                     # estado de los navegadores
+        python daemon.py stop                       # apagado ordenado
+    """
+    parser = argparse.ArgumentParser(description="Daemon de LinkedIn Jobs")
+    parser.add_argument("--host", default=None)
+    parser.add_argument("--port", type=int, default=None)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Arranca el daemon")
+    serve.add_argument("--workers", type=int, default=None)
+    serve.add_argument("--idle-timeout", type=float, default=None)
+
+    search = commands.add_parser("search", help="Ejecuta búsquedas en el daemon")
+    search.add_argument("queries", nargs="+")
+    search.add_argument("--timeout", type=float, default=None)
+    search.add_argument("--max-results", type=int, default=None)
+    search.add_argument("--apply", action="store_true", help="Easy Apply a los empleos nuevos")
+
+    apply = commands.add_parser("apply", help="Easy Apply a empleos guardados")
+    apply.add_argument("job_ids", nargs="*")
+    apply.add_argument("--review", action="store_true", help="Incluye los empleos en revisión ya respondidos")
+    apply.add_argument("--limit", type=int, default=None)
+    apply.add_argument("--timeout", type=float, default=None)
+
+    commands.add_parser("status", help="Estado del daemon")
+    commands.add_parser("stop", help="Detiene el daemon")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        daemon = BrowserDaemon(
+            workers=args.workers, host=args.host, port=args.port, idle_timeout=args.idle_timeout
+        )
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    client = DaemonClient(args.host, args.port)
+    try:
+        if args.command == "search":
+            results = [client.search(query, args.timeout, max_results=args.max_results,
+                                     easy_apply=True if args.apply else None)
+                       for query in args.queries]
+        elif args.command == "apply":
+            if not args.job_ids and not args.review:
+                parser.error("apply necesita job_ids o --review")
+            results = client.apply(args.job_ids, args.review, args.timeout, args.limit)
+        elif args.command == "status":
+            results = client.status()
+        else:
+            results = client.shutdown()
+    except OSError as e:
+        print(f"❌ No se pudo contactar al daemon: {e}")
+        return 1
+
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
+import sys
 from utils.web_driver import WebDriverManager
 from core.navigation_manager import NavigationManager
+from core.worker_pool import BrowserPool
 from config.settings import settings
 from utils.logger import logger
+from utils.tracing import tracer
 
 def main():
     """
@@ -21,29 +24,31 @@ def main():
     - ℹ️ Información general
     """
     driver_manager = WebDriverManager()
+    success = False
     
     try:
         # Banner inicial
-        print("\n" + "=" * 80)
-        print("🚀 LINKEDIN JOBS - AUTOMATIZACIÓN DE BÚSQUEDA DE EMPLEO")
-        print("=" * 80 + "\n")
+        logger.raw("\n" + "=" * 80)
+        logger.raw("🚀 LINKEDIN JOBS - AUTOMATIZACIÓN DE BÚSQUEDA DE EMPLEO")
+        logger.raw("=" * 80 + "\n")
         
         # Configurar driver (silencioso)
         driver = driver_manager.setup_driver()
+        logger.info(f"⚡ {driver_manager.format_startup_report()}")
         
-        # Navegación y búsqueda (con logs detallados)
+        # Búsqueda, recorrido de resultados, detalle y Easy Apply (con logs detallados)
         nav_manager = NavigationManager(driver)
-        success = nav_manager.go_to_jobs_and_search()
+        success = nav_manager.run_search()["success"]
         
         # Resumen final
-        print("\n" + "=" * 80)
+        logger.raw("\n" + "=" * 80)
         if success:
             logger.success("🎉 PROCESO COMPLETADO EXITOSAMENTE")
             logger.info(f"📍 URL final: {driver.current_url}")
         else:
             logger.error("❌ PROCESO COMPLETADO CON ERRORES")
             logger.info(f"📍 URL actual: {driver.current_url}")
-        print("=" * 80 + "\n")
+        logger.raw("=" * 80 + "\n")
         
     except KeyboardInterrupt:
         logger.error("\n⚠️  Proceso interrumpido por el usuario")
@@ -51,13 +56,72 @@ def main():
         logger.error(f"❌ Error crítico: {str(e)}")
     
     finally:
-        if settings.CLOSE_BROWSER:
+        # Sin pantalla o sin terminal (servidores, cron) nunca se espera input()
+        if settings.CLOSE_BROWSER or not settings.INTERACTIVE or not sys.stdin.isatty():
             logger.info("🔚 Cerrando navegador...")
             driver_manager.teardown_driver()
         else:
             logger.info("🔄 Navegador mantenido abierto para inspección")
+            logger.flush()
             input("\n⏸️  Presiona Enter para cerrar el navegador...")
             driver_manager.teardown_driver()
+        
+        tracer.finish(logger)
+    
+    return success
+
+def run_pool():
+    """
+    Ejecuta JOB_SEARCH_QUERIES en paralelo con un pool de POOL_SIZE navegadores.
+    Cada navegador tiene su propio perfil y sesión; cada búsqueda hace el
+    mismo flujo que main() (resultados, detalle y Easy Apply) sobre un
+    JobStore compartido.
+    """
+    queries = settings.JOB_SEARCH_QUERIES
+    pool = BrowserPool(size=min(settings.POOL_SIZE, len(queries)))
+    
+    logger.raw("\n" + "=" * 80)
+    logger.raw(f"🚀 LINKEDIN JOBS - {len(queries)} BÚSQUEDAS EN {pool.size} NAVEGADORES")
+    logger.raw("=" * 80 + "\n")
+    
+    pool.start()
+    all_succeeded = True
+    try:
+        # Los empleos en revisión se reintentan una sola vez (en la primera búsqueda)
+        futures = {query: pool.submit(query, retry_review=index == 0) for index, query in enumerate(queries)}
+        
+        new_jobs = 0
+        logger.raw("\n" + "=" * 80)
+        for query, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                all_succeeded = False
+                logger.error(f"❌ {query}: {str(e)}")
+                continue
+            if not result["success"]:
+                all_succeeded = False
+                logger.error(f"❌ {query}")
+                continue
+            new_jobs += result["new_jobs"]
+            applied = result["apply"].get("applied", 0)
+            logger.success(f"🎉 {query}: {result['new_jobs']} empleos nuevos"
+                           + (f", {applied} postulaciones" if applied else ""))
+        logger.success(f"💾 {new_jobs} empleos nuevos en total ({pool.job_store.count()} en el almacén)")
+        logger.raw("=" * 80 + "\n")
+        pool.shutdown()
+    except KeyboardInterrupt:
+        all_succeeded = False
+        logger.error("\n⚠️  Proceso interrumpido por el usuario")
+        pool.shutdown(cancel_pending=True)
+    
+    tracer.finish(logger)
+    return all_succeeded
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Código de salida para servidores/cron: 0 = éxito, 1 = errores
+    if settings.POOL_SIZE > 1:
+        ok = run_pool()
+    else:
+        ok = main()
+    sys.exit(0 if ok else 1)
\ No newline at end of file
@@ -1,6 +1,10 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 from utils.logger import logger
 from utils.element_finder import ElementFinder
+from utils.page_readiness import ReadinessEngine
+from utils.resource_policy import ResourcePolicy
+from utils.rate_governor import RateGovernor, rate_governor
+from utils.tracing import tracer
 
 class BasePage:
     """
@@ -11,51 +15,73 @@ class BasePage:
     def __init__(self, driver: WebDriver):
         self.driver = driver
         self.finder = ElementFinder(driver)
+        self.readiness = ReadinessEngine(driver)
+        self.last_readiness = None
+        # Selectores que indican que la página es usable (cada página define los suyos)
+        self.ready_selectors = []
+        # Categorías de recursos que esta página necesita aunque el perfil
+        # las bloquee (ej. ["images", "stylesheets"] para renderizado completo)
+        self.resource_allow = []
     
-    def wait_for_dom_ready(self):
+    def wait_for_dom_ready(self, ready_selectors=None, timeout=None):
         """
-        Paso 1: Espera a que la página cargue COMPLETAMENTE (incluyendo recursos)
-        Log: PAGINA CARGO COMPLETAMENTE (DOMContentLoaded)
+        Paso 1: Espera a que la página esté USABLE según señales reales
+        (readyState, DOM en reposo, red ociosa y condiciones de la página).
+        Log: PAGINA CARGO COMPLETAMENTE (con el tiempo de espera) solo si
+        quedó lista; si no, una advertencia con el motivo (timeout / error)
+        
+        ready_selectors: selectores que indican que la página es usable.
+        Por defecto se usan los de la página (self.ready_selectors).
         """
-        import time
-        try:
-            # Esperar a que el documento esté completo
-            self.driver.execute_script("""
-                return new Promise(resolve => {
-                    if (document.readyState === 'complete') {
-                        resolve(true);
-                    } else {
-                        window.addEventListener('load', () => resolve(true));
-                    }
-                });
-            """)
-            
-            # Espera adicional para recursos asíncronos (imágenes, CSS, fuentes)
-            # LinkedIn carga muchos recursos de forma asíncrona
-            time.sleep(2)
-            
-            # Verificar que jQuery esté cargado (LinkedIn lo usa)
-            try:
-                self.driver.execute_script("return typeof jQuery !== 'undefined'")
-            except:
-                pass
-            
-            logger.page_loaded(self.driver.current_url)
-            return True
-        except Exception as e:
+        if ready_selectors is None:
+            ready_selectors = self.ready_selectors
+        
+        with tracer.span("wait_for_dom_ready", "page") as span:
+            report = self.readiness.wait(ready_selectors, timeout=timeout)
+            span.set(report.reason, polls=report.polls)
+        self.last_readiness = report
+        
+        if not report.ready:
+            # Sin current_url: con reason="error" el driver puede no responder
+            logger.warning(f"PAGINA NO LISTA ({report.reason}) tras {report.elapsed:.2f}s "
+                           f"(readyState={report.ready_state or '?'})")
             return False
+        
+        logger.page_loaded(self.driver.current_url, elapsed=report.elapsed)
+        return True
     
-    def navigate_to(self, url):
+    def navigate_to(self, url, ready_selectors=None, priority=RateGovernor.PRIORITY_NORMAL):
         """
         Navegación con logs modularizados:
         1. URL de la pagina
         2. PAGINA CARGO COMPLETAMENTE
+        
+        ready_selectors: señales de página lista para esta URL concreta
+        (por defecto las de la página)
+        priority: prioridad de la navegación en el RateGovernor
         """
-        self.driver.get(url)
-        logger.current_url(url)
-        self.wait_for_dom_ready()
+        with tracer.span("navigate_to", "page", url=url) as span:
+            with tracer.span("rate_governor", "wait"):
+                rate_governor.acquire("navigate", priority)
+            ResourcePolicy.for_driver(self.driver).apply(self.driver, allow=self.resource_allow)
+            self.readiness.begin_navigation()
+            with tracer.span("driver.get", "page"):
+                self.driver.get(url)
+            logger.current_url(url)
+            if not self.wait_for_dom_ready(ready_selectors):
+                span.set("not_ready")
         return self
     
+    def is_driver_alive(self):
+        """
+        El navegador responde a un script trivial. Tras un error de script
+        distingue "falló el script" de "Chrome se cayó" (hay que propagarlo).
+        """
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+    
     def get_current_url(self):
         """Obtiene la URL actual sin logging"""
         return self.driver.current_url
@@ -85,4 +111,25 @@ class BasePage:
     
     def is_element_present(self, selector):
         """Verifica presencia sin logging (método auxiliar)"""
-        return self.finder.is_element_present(selector)
\ No newline at end of file
+        return self.finder.is_element_present(selector)
+    
+    def probe(self, selectors, decisive=None, timeout=0, description=""):
+        """
+        Verifica varios selectores en un solo viaje al navegador.
+        Retorna dict {selector: True/False} (ver ElementFinder.probe)
+        """
+        return self.finder.probe(selectors, decisive, timeout, description)
+    
+    def detect_state(self, states, timeout=0, description=""):
+        """
+        Detecta en qué estado está la página con un único sondeo.
+        
+        states: dict ordenado {nombre_estado: [selectores]}
+        Retorna el primer estado con algún selector presente, o None.
+        """
+        selectors = [selector for group in states.values() for selector in group]
+        result = self.probe(selectors, timeout=timeout, description=description)
+        for name, group in states.items():
+            if any(result.get(selector) for selector in group):
+                return name
+        return None
\ No newline at end of file
@@ -0,0 +1,352 @@
+from .base_page import BasePage
+from config.settings import settings
+from utils.rate_governor import RateGovernor, rate_governor
+from utils.selector_registry import selector_registry
+
+
+class EasyApplyPage(BasePage):
+    """
+    Modal de Easy Apply de un empleo (/jobs/view/<id>/).
+
+    Cada paso del modal cuesta tres viajes al navegador, tenga las
+    preguntas que tenga (antes: buscar, limpiar y escribir cada campo):
+
+    1. read_step(): un script lee TODAS las preguntas del paso (etiqueta,
+       tipo, opciones, valor actual, obligatoria, con error) y el botón
+       principal. Cada pregunta queda marcada con data-aja-field.
+    2. fill(valores): un script rellena todos los campos con el setter
+       nativo de value y dispara input/change/blur, como al escribir: el
+       formulario de LinkedIn (React) ignora los valores sin eventos.
+    3. advance(): pulsa Siguiente / Revisar / Enviar y espera con un
+       MutationObserver a que cambie el paso, aparezca un error o se envíe.
+
+    Operación silenciosa - no genera logs (salvo la carga de la página).
+    """
+
+    # Funciones comunes a los scripts del modal (arguments[0] = selectores)
+    HELPERS_SCRIPT = """
+        var s = arguments[0];
+        var modal = document.querySelector(s.modal);
+
+        function text(el) {
+            if (!el) return '';
+            var visible = el.querySelector('[aria-hidden="true"]');
+            return ((visible || el).innerText || (visible || el).textContent || '').replace(/\\s+/g, ' ').trim();
+        }
+        function labelFor(group, control) {
+            var legend = group.querySelector('legend');
+            if (legend) return text(legend);
+            var label = control && control.id ? group.querySelector('label[for="' + control.id + '"]') : null;
+            return text(label || group.querySelector('label'));
+        }
+        function primaryButton() {
+            if (!modal) return null;
+            var known = [['submit', 'Submit application'], ['review', 'Review your application'],
+                         ['next', 'Continue to next step']];
+            for (var i = 0; i < known.length; i++) {
+                var button = modal.querySelector('button[aria-label="' + known[i][1] + '"]');
+                if (button) return {kind: known[i][0], element: button};
+            }
+            var buttons = modal.querySelectorAll('footer button.artdeco-button--primary, button.artdeco-button--primary');
+            if (!buttons.length) return null;
+            var last = buttons[buttons.length - 1], label = text(last);
+            var kind = /submit|enviar/i.test(label) ? 'submit' : /review|revisar/i.test(label) ? 'review' : 'next';
+            return {kind: kind, element: last};
+        }
+        function groups() {
+            var result = [];
+            if (!modal) return result;
+            var nodes = modal.querySelectorAll(s.field);
+            for (var i = 0; i < nodes.length; i++) {
+                var parent = nodes[i].parentElement && nodes[i].parentElement.closest(s.field);
+                if (!parent || !modal.contains(parent)) result.push(nodes[i]);
+            }
+            return result;
+        }
+        function signature() {
+            var button = primaryButton();
+            return (button ? button.kind : '') + '|' + groups().map(function(group) {
+                return labelFor(group, group.querySelector('input, select, textarea'));
+            }).join('|');
+        }
+        function errors() {
+            var found = [], nodes = modal ? modal.querySelectorAll(s.error) : [];
+            for (var i = 0; i < nodes.length; i++) {
+                var value = text(nodes[i]);
+                if (value) found.push(value);
+            }
+            return found;
+        }
+    """
+
+    # Abre el modal con el botón Easy Apply y espera a que aparezca
+    OPEN_SCRIPT = HELPERS_SCRIPT + """
+        var timeoutMs = arguments[1];
+        var done = arguments[arguments.length - 1];
+        // Abierto = el modal ya pintó su primer paso (tiene botón principal)
+        function ready() {
+            modal = document.querySelector(s.modal);
+            return !!(modal && primaryButton());
+        }
+        if (ready()) { done({opened: true}); return; }
+
+        var buttons = document.querySelectorAll(s.apply_button), button = null;
+        for (var i = 0; i < buttons.length; i++) {
+            if (/easy apply/i.test(text(buttons[i]) || buttons[i].getAttribute('aria-label') || '')) {
+                button = buttons[i];
+                break;
+            }
+        }
+        if (!button) { done({error: buttons.length ? 'not_easy_apply' : 'no_button'}); return; }
+
+        var finished = false, timer = null;
+        var observer = new MutationObserver(function() {
+            if (ready()) finish({opened: true});
+        });
+        function finish(result) {
+            if (finished) return;
+            finished = true;
+            observer.disconnect();
+            if (timer) clearTimeout(timer);
+            done(result);
+        }
+        observer.observe(document.body, {childList: true, subtree: true});
+        button.click();
+        timer = setTimeout(function() {
+            finish(ready() ? {opened: true} : {error: 'timeout'});
+        }, timeoutMs);
+    """
+
+    # Todas las preguntas del paso actual en un solo viaje
+    READ_STEP_SCRIPT = HELPERS_SCRIPT + """
+        if (!modal) return null;
+        window.__ajaFieldSeq = window.__ajaFieldSeq || 0;
+
+        var fields = [], list = groups();
+        for (var i = 0; i < list.length; i++) {
+            var group = list[i];
+            var radios = group.querySelectorAll('input[type="radio"]');
+            var select = group.querySelector('select');
+            var control = select || group.querySelector('textarea, input:not([type="hidden"]):not([type="radio"])');
+            if (!radios.length && !control) continue;
+
+            var key = group.getAttribute('data-aja-field');
+            if (!key) {
+                key = String(++window.__ajaFieldSeq);
+                group.setAttribute('data-aja-field', key);
+            }
+            var field = {
+                key: key,
+                label: labelFor(group, control || radios[0]),
+                type: '',
+                options: [],
+                value: '',
+                required: !!group.querySelector('[required], [aria-required="true"]'),
+                invalid: !!group.querySelector(s.error) && !!text(group.querySelector(s.error))
+            };
+            if (radios.length) {
+                field.type = 'radio';
+                for (var j = 0; j < radios.length; j++) {
+                    var option = text(group.querySelector('label[for="' + radios[j].id + '"]')) || radios[j].value;
+                    field.options.push(option);
+                    if (radios[j].checked) field.value = option;
+                }
+            } else if (select) {
+                field.type = 'select';
+                for (var k = 0; k < select.options.length; k++) {
+                    var item = select.options[k];
+                    if (!item.value || /^select an option$/i.test(item.text.trim())) continue;
+                    field.options.push(item.text.trim());
+                    if (item.selected) field.value = item.text.trim();
+                }
+            } else if (control.tagName === 'TEXTAREA') {
+                field.type = 'textarea';
+                field.value = control.value;
+            } else {
+                field.type = (control.getAttribute('type') || 'text').toLowerCase();
+                field.value = field.type === 'checkbox' ? (control.checked ? 'true' : '') : control.value;
+            }
+            field.required = field.required || /\\*$/.test(field.label);
+            fields.push(field);
+        }
+        var button = primaryButton();
+        return {fields: fields, action: button ? button.kind : null, signature: signature(), errors: errors()};
+    """
+
+    # Rellena todos los campos en un solo viaje; retorna las claves que no pudo
+    FILL_SCRIPT = HELPERS_SCRIPT + """
+        var values = arguments[1], failed = [];
+
+        function setValue(control, value) {
+            var proto = control.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype
+                : control.tagName === 'SELECT' ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+            if (control.focus) control.focus();
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(control, value);
+            control.dispatchEvent(new Event('input', {bubbles: true}));
+            control.dispatchEvent(new Event('change', {bubbles: true}));
+            control.dispatchEvent(new Event('blur'));
+            control.dispatchEvent(new Event('focusout', {bubbles: true}));
+        }
+        function same(a, b) {
+            return String(a).replace(/\\s+/g, ' ').trim().toLowerCase() === String(b).replace(/\\s+/g, ' ').trim().toLowerCase();
+        }
+
+        for (var i = 0; i < values.length; i++) {
+            var key = values[i][0], value = values[i][1];
+            var group = modal && modal.querySelector('[data-aja-field="' + key + '"]');
+            if (!group) { failed.push(key); continue; }
+
+            var radios = group.querySelectorAll('input[type="radio"]');
+            var select = group.querySelector('select');
+            var control = select || group.querySelector('textarea, input:not([type="hidden"]):not([type="radio"])');
+            var ok = false;
+            if (radios.length) {
+                for (var j = 0; j < radios.length; j++) {
+                    var label = text(group.querySelector('label[for="' + radios[j].id + '"]')) || radios[j].value;
+                    if (same(label, value)) {
+                        if (!radios[j].checked) radios[j].click();
+                        ok = true;
+                        break;
+                    }
+                }
+            } else if (select) {
+                for (var k = 0; k < select.options.length; k++) {
+                    if (same(select.options[k].text, value)) {
+                        setValue(select, select.options[k].value);
+                        ok = true;
+                        break;
+                    }
+                }
+            } else if (control && control.type === 'checkbox') {
+                var wanted = /^(true|yes|si|sí|1)$/i.test(String(value).trim());
+                if (control.checked !== wanted) control.click();
+                ok = true;
+            } else if (control) {
+                setValue(control, String(value));
+                ok = true;
+            }
+            if (!ok) failed.push(key);
+        }
+        return failed;
+    """
+
+    # Pulsa el botón principal y espera: paso nuevo, error de validación o envío
+    ADVANCE_SCRIPT = HELPERS_SCRIPT + """
+        var before = arguments[1], timeoutMs = arguments[2];
+        var done = arguments[arguments.length - 1];
+        var button = primaryButton();
+        if (!button) { done({state: 'no_button', errors: []}); return; }
+        var submitting = button.kind === 'submit';
+
+        var finished = false, timer = null, observer = null;
+        function check(final) {
+            if (document.querySelector(s.done)) return 'submitted';
+            modal = document.querySelector(s.modal);
+            if (!modal) return submitting ? 'submitted' : 'closed';
+            if (signature() !== before) return 'next';
+            if (errors().length) return 'error';
+            return final ? 'stuck' : null;
+        }
+        function finish(state) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            if (timer) clearTimeout(timer);
+            done({state: state, errors: modal ? errors() : []});
+        }
+        // Solo se evalúa tras una mutación: los errores de antes del clic no cuentan
+        observer = new MutationObserver(function() {
+            var state = check(false);
+            if (state) finish(state);
+        });
+        observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+        button.element.click();
+        timer = setTimeout(function() { finish(check(true)); }, timeoutMs);
+    """
+
+    # Cierra el modal y confirma descartar la postulación si lo pregunta
+    DISMISS_SCRIPT = HELPERS_SCRIPT + """
+        var timeoutMs = arguments[1];
+        var done = arguments[arguments.length - 1];
+        var confirmSelector = '[data-control-name="discard_application_confirm_btn"], '
+            + '[data-test-dialog-secondary-btn], button[data-test-dialog-discard-btn]';
+        var close = document.querySelector('button[aria-label="Dismiss"], .artdeco-modal__dismiss');
+        if (!close) { done(false); return; }
+        close.click();
+
+        var started = Date.now();
+        (function confirm() {
+            var button = document.querySelector(confirmSelector);
+            if (button) { button.click(); done(true); return; }
+            if (!document.querySelector(s.modal) || Date.now() - started > timeoutMs) { done(true); return; }
+            setTimeout(confirm, 50);
+        })();
+    """
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.policy = settings.WAIT_POLICY
+        self.selectors = {
+            "modal": selector_registry.group("easy_apply_modal"),
+            "field": selector_registry.group("easy_apply_field"),
+            "error": selector_registry.group("easy_apply_error"),
+            "done": selector_registry.group("easy_apply_done"),
+            "apply_button": selector_registry.group("detail_apply_button"),
+        }
+        # La vista está lista cuando aparece el botón de postular (o el login)
+        self.ready_selectors = [
+            self.selectors["apply_button"],
+            selector_registry.group("login_form"),
+        ]
+
+    # ==================== MODAL ====================
+
+    def open(self, job_id):
+        """
+        Carga la vista del empleo y abre el modal de Easy Apply.
+        Retorna None si quedó abierto, o el motivo (no_button,
+        not_easy_apply, timeout, error).
+        """
+        self.navigate_to(f"{settings.BASE_URL}/jobs/view/{job_id}/")
+        rate_governor.acquire("click", RateGovernor.PRIORITY_HIGH)
+        result = self._run_async(self.OPEN_SCRIPT, self._timeout_ms()) or {"error": "error"}
+        return None if result.get("opened") else result.get("error", "error")
+
+    def read_step(self):
+        """Preguntas del paso actual: {fields, action, signature, errors} (o None sin modal)"""
+        try:
+            return self.driver.execute_script(self.READ_STEP_SCRIPT, self.selectors)
+        except Exception:
+            return None
+
+    def fill(self, values):
+        """Rellena [[clave, valor], ...] en un solo viaje; retorna las claves que fallaron"""
+        if not values:
+            return []
+        try:
+            return self.driver.execute_script(self.FILL_SCRIPT, self.selectors, values) or []
+        except Exception:
+            return [key for key, _ in values]
+
+    def advance(self, signature):
+        """
+        Pulsa el botón principal del paso. Retorna {state, errors} con state:
+        next, submitted, error (validación), stuck, closed, no_button.
+        """
+        rate_governor.acquire("submit", RateGovernor.PRIORITY_HIGH)
+        return self._run_async(self.ADVANCE_SCRIPT, signature, self._timeout_ms()) or {"state": "stuck", "errors": []}
+
+    def dismiss(self):
+        """Cierra el modal (descartando la postulación si no se envió)"""
+        return bool(self._run_async(self.DISMISS_SCRIPT, self._timeout_ms()))
+
+    # ==================== AUXILIARES ====================
+
+    def _run_async(self, script, *args):
+        try:
+            return self.driver.execute_async_script(script, self.selectors, *args)
+        except Exception:
+            return None
+
+    def _timeout_ms(self):
+        return int(self.policy.budget(self.policy.apply_timeout) * 1000)
@@ -0,0 +1,27 @@
+from typing import NamedTuple, Optional
+from config.settings import settings
+
+
+class JobCard(NamedTuple):
+    """
+    Tarjeta de empleo de la lista de resultados (registro compacto e inmutable).
+
+    posted: fecha ISO del atributo datetime de <time> (o su texto si no lo tiene)
+    """
+
+    job_id: str
+    title: str
+    company: str
+    location: str
+    posted: Optional[str]
+    easy_apply: bool
+
+    @classmethod
+    def from_row(cls, row):
+        """Construye la tarjeta desde la fila compacta que devuelve el script de extracción"""
+        job_id, title, company, location, posted, easy_apply = row
+        return cls(str(job_id), title, company, location, posted or None, bool(easy_apply))
+
+    @property
+    def url(self):
+        return f"{settings.BASE_URL}/jobs/view/{self.job_id}/"
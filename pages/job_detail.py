@@ -0,0 +1,35 @@
+from typing import NamedTuple, Tuple
+from config.settings import settings
+
+
+class JobDetail(NamedTuple):
+    """
+    Detalle de un empleo leído de su vista /jobs/view/<id>/.
+
+    insights: datos destacados del encabezado (modalidad, jornada, nivel...)
+    """
+
+    job_id: str
+    title: str
+    company: str
+    location: str
+    description: str
+    insights: Tuple[str, ...]
+    easy_apply: bool
+
+    @classmethod
+    def from_dict(cls, data):
+        """Construye el detalle desde el objeto que devuelve el script de extracción"""
+        return cls(
+            str(data["job_id"]),
+            data.get("title") or "",
+            data.get("company") or "",
+            data.get("location") or "",
+            data.get("description") or "",
+            tuple(data.get("insights") or ()),
+            bool(data.get("easy_apply")),
+        )
+
+    @property
+    def url(self):
+        return f"{settings.BASE_URL}/jobs/view/{self.job_id}/"
@@ -3,6 +3,10 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from .base_page import BasePage
+from .job_card import JobCard
+from .results_paginator import ResultsPaginator
+from utils.rate_governor import RateGovernor, rate_governor
+from utils.selector_registry import selector_registry
 from config.settings import settings
 from utils.logger import logger
 
@@ -14,13 +18,25 @@ class JobsPage(BasePage):
     
     def __init__(self, driver):
         super().__init__(driver)
-        # Selectores como constantes
-        self.EMAIL_SELECTOR = '[name="session_key"]'
-        self.PASSWORD_SELECTOR = '[name="session_password"]'
-        self.LOGIN_BUTTON_SELECTOR = '[data-id="sign-in-form__submit-btn"][type="submit"]'
-        self.JOBS_INDICATOR = '[placeholder="Title, skill or Company"]'
-        self.LOGIN_FORM_SELECTOR = 'form[data-id="sign-in-form"]'
-        self.SEARCH_INPUT_SELECTOR = '[placeholder="Title, skill or Company"]'
+        # Selectores: todos los candidatos del SelectorRegistry como un solo
+        # selector CSS (sondeos de presencia). Las acciones usan el nombre
+        # lógico para que el registro aprenda qué candidato responde.
+        self.EMAIL_SELECTOR = selector_registry.group("email_field")
+        self.PASSWORD_SELECTOR = selector_registry.group("password_field")
+        self.LOGIN_BUTTON_SELECTOR = selector_registry.group("login_button")
+        self.JOBS_INDICATOR = selector_registry.group("search_input")
+        self.LOGIN_FORM_SELECTOR = selector_registry.group("login_form")
+        self.SEARCH_INPUT_SELECTOR = self.JOBS_INDICATOR
+        self.RESULTS_LIST_SELECTOR = selector_registry.group("results_list")
+        self.NO_RESULTS_SELECTOR = selector_registry.group("no_results")
+        self.JOB_CARD_SELECTOR = selector_registry.group("job_card")
+        
+        # /jobs/ está lista cuando aparece el buscador (sesión activa) o el login
+        self.ready_selectors = [
+            self.SEARCH_INPUT_SELECTOR,
+            self.LOGIN_FORM_SELECTOR,
+            self.EMAIL_SELECTOR,
+        ]
     
     # ==================== PASO 1: NAVEGACIÓN ====================
     
@@ -31,29 +47,43 @@ class JobsPage(BasePage):
         - URL: https://www.linkedin.com/jobs/
         - PAGINA CARGO COMPLETAMENTE
         """
-        return self.navigate_to("https://www.linkedin.com/jobs/")
+        return self.navigate_to(settings.JOBS_URL)
+    
+    def navigate_to_login(self):
+        """
+        Paso 1 con la sesión vencida: directo a la página de login
+        (LOGIN_URL), sin renderizar /jobs/ primero.
+        """
+        return self.navigate_to(settings.LOGIN_URL, [self.LOGIN_FORM_SELECTOR, self.EMAIL_SELECTOR])
     
     # ==================== PASO 2: VERIFICACIONES ====================
     
-    def is_login_form_present(self):
+    def is_login_form_present(self, timeout=None):
         """
         Verificación: detecta si el formulario de login está presente.
-        NO genera logs (método interno - usa is_element_present).
+        Un solo sondeo en el navegador (ElementFinder.probe) que resuelve
+        en cuanto aparece el formulario, el password o el buscador de empleos.
         
         Retorna True si encuentra:
         - Formulario de login completo
         - O campos de email + password
         """
+        if timeout is None:
+            timeout = self.finder.policy.probe_timeout
+        
+        result = self.probe(
+            [self.LOGIN_FORM_SELECTOR, self.EMAIL_SELECTOR, self.PASSWORD_SELECTOR, self.JOBS_INDICATOR],
+            decisive=[self.LOGIN_FORM_SELECTOR, self.PASSWORD_SELECTOR, self.JOBS_INDICATOR],
+            timeout=timeout,
+            description="Formulario de login"
+        )
+        
         # Verificar formulario completo
-        if self.is_element_present(self.LOGIN_FORM_SELECTOR):
+        if result[self.LOGIN_FORM_SELECTOR]:
             return True
         
         # Verificar campos individuales
-        if (self.is_element_present(self.EMAIL_SELECTOR) and 
-            self.is_element_present(self.PASSWORD_SELECTOR)):
-            return True
-        
-        return False
+        return result[self.EMAIL_SELECTOR] and result[self.PASSWORD_SELECTOR]
     
     # ==================== PASO 3: LOGIN ====================
     
@@ -62,21 +92,21 @@ class JobsPage(BasePage):
         Paso 3: Realizar login desde formulario en la página actual.
         
         Logs generados:
-        1. 🔎 BUSCANDO ELEMENTO: [name="session_key"]
+        1. 🔎 BUSCANDO ELEMENTO: email_field [candidatos]
         2. ✓ ELEMENTO ENCONTRADO: [name="session_key"] - Campo de email
         3. 🧹 ACCIÓN → LIMPIAR: Campo de email
         4. ⌨️ ACCIÓN → ESCRIBIR: Campo de email → 'sergio...'
-        5. 🔎 BUSCANDO ELEMENTO: [name="session_password"]
+        5. 🔎 BUSCANDO ELEMENTO: password_field [candidatos]
         6. ✓ ELEMENTO ENCONTRADO: [name="session_password"] - Campo de password
         7. 🧹 ACCIÓN → LIMPIAR: Campo de password
         8. ⌨️ ACCIÓN → ESCRIBIR: Campo de password → '●●●●●●●●'
-        9. 🔎 BUSCANDO ELEMENTO: [data-id="sign-in-form__submit-btn"] - Botón de login (clickable)
+        9. 🔎 BUSCANDO ELEMENTO: login_button [candidatos] - Botón de login (clickable)
         10. ✓ ELEMENTO ENCONTRADO: [data-id="sign-in-form__submit-btn"] - Botón de login (clickable)
         11. 👆 ACCIÓN → CLICK: Botón de login
         """
         # Llenar email
         email_success = self.safe_send_keys(
-            self.EMAIL_SELECTOR, 
+            "email_field", 
             email, 
             "Campo de email"
         )
@@ -86,7 +116,7 @@ class JobsPage(BasePage):
         
         # Llenar password
         password_success = self.safe_send_keys(
-            self.PASSWORD_SELECTOR, 
+            "password_field", 
             password, 
             "Campo de password"
         )
@@ -94,9 +124,10 @@ class JobsPage(BasePage):
         if not password_success:
             return False
         
-        # Clic en botón de login
+        # Clic en botón de login (envío de formulario: pasa por el regulador)
+        rate_governor.acquire("submit", RateGovernor.PRIORITY_HIGH)
         login_success = self.safe_click(
-            self.LOGIN_BUTTON_SELECTOR,
+            "login_button",
             "Botón de login"
         )
         
@@ -109,7 +140,7 @@ class JobsPage(BasePage):
         Paso 4: Realizar búsqueda de trabajo.
         
         Logs generados:
-        1. BUSCANDO ELEMENTO: [placeholder="Title, skill or Company"] - Campo de búsqueda
+        1. BUSCANDO ELEMENTO: search_input [candidatos] - Campo de búsqueda
         2. ELEMENTO ENCONTRADO: [placeholder="Title, skill or Company"] - Campo de búsqueda
         3. ELEMENTO ACCIONADO: Campo de búsqueda de trabajos - send_keys: Python Developer
         4. BUSCANDO ELEMENTO: .jobs-search-box__submit-button - Botón de búsqueda (clickable)
@@ -121,7 +152,7 @@ class JobsPage(BasePage):
         
         # Buscar el campo de búsqueda
         search_input = self.safe_find_element(
-            self.SEARCH_INPUT_SELECTOR,
+            "search_input",
             "Campo de búsqueda de trabajos"
         )
         
@@ -135,12 +166,131 @@ class JobsPage(BasePage):
             logger.element_action("Campo de búsqueda de trabajos", f"send_keys: {job_title}")
             
             # presionar Enter
+            rate_governor.acquire("submit")
             search_input.send_keys(Keys.RETURN)
             logger.element_action("Campo de búsqueda de trabajos", "send_keys: ENTER")
             
             # Esperar a que los resultados carguen
-            self.wait_for_dom_ready()
+            self.wait_for_dom_ready([self.RESULTS_LIST_SELECTOR])
             return True
             
         except Exception as e:
-            return False
\ No newline at end of file
+            return False
+    
+    def open_search(self, spec):
+        """
+        Paso 4 (directo): navega a la URL de resultados de un SearchSpec,
+        con los filtros ya aplicados por el servidor. Una sola navegación,
+        sin escribir en el buscador.
+        
+        Retorna True si cargó la lista de resultados (o el aviso de
+        "sin resultados"), False si apareció el login o no cargó nada.
+        """
+        logger.info(f"🔎 Búsqueda: {spec}")
+        try:
+            self.navigate_to(spec.to_url(), [
+                self.RESULTS_LIST_SELECTOR,
+                self.NO_RESULTS_SELECTOR,
+                self.LOGIN_FORM_SELECTOR,
+            ])
+        except Exception:
+            return False
+        
+        state = self.detect_state({
+            "results": [self.RESULTS_LIST_SELECTOR],
+            "empty": [self.NO_RESULTS_SELECTOR],
+            "login": [self.LOGIN_FORM_SELECTOR, self.PASSWORD_SELECTOR],
+        }, description="Resultados de búsqueda")
+        
+        if state == "empty":
+            logger.info("📭 La búsqueda no tiene resultados")
+        return state in ("results", "empty")
+    
+    # ==================== PASO 5: EXTRACCIÓN DE RESULTADOS ====================
+    
+    # Un solo viaje al navegador por lote: cada tarjeta vuelve como fila compacta
+    # [id, título, empresa, ubicación, fecha, easy_apply]. Las tarjetas que
+    # LinkedIn todavía no renderizó (ocluidas, sin título) se omiten.
+    EXTRACT_CARDS_SCRIPT = """
+        var cardSelector = arguments[0], start = arguments[1], limit = arguments[2];
+        
+        function text(root, selector) {
+            var el = root.querySelector(selector);
+            if (!el) return '';
+            return (el.innerText || el.textContent || '').trim().split('\\n')[0].trim();
+        }
+        
+        var seen = {}, cards = [];
+        var nodes = document.querySelectorAll(cardSelector);
+        for (var i = 0; i < nodes.length; i++) {
+            var node = nodes[i];
+            var id = node.getAttribute('data-occludable-job-id') || node.getAttribute('data-job-id');
+            if (!id || seen[id]) continue;
+            seen[id] = true;
+            var title = text(node, '.job-card-list__title, .job-card-container__link, .artdeco-entity-lockup__title');
+            if (!title) continue;
+            cards.push([id, title, node]);
+        }
+        
+        var end = limit ? Math.min(cards.length, start + limit) : cards.length;
+        var rows = [];
+        for (var j = start; j < end; j++) {
+            var card = cards[j][2];
+            var time = card.querySelector('time');
+            var footer = text(card, '.job-card-container__footer-wrapper, .job-card-list__footer-wrapper, .job-card-container__apply-method');
+            rows.push([
+                cards[j][0],
+                cards[j][1],
+                text(card, '.artdeco-entity-lockup__subtitle, .job-card-container__primary-description, .job-card-container__company-name'),
+                text(card, '.job-card-container__metadata-item, .artdeco-entity-lockup__caption'),
+                time ? (time.getAttribute('datetime') || (time.textContent || '').trim()) : null,
+                /easy apply/i.test(footer || card.textContent || '')
+            ]);
+        }
+        return {total: cards.length, rows: rows};
+    """
+    
+    def iter_job_cards(self, chunk_size=10):
+        """
+        Generador de JobCard de las tarjetas visibles.
+        Extrae por lotes de chunk_size (un execute_script por lote) para que
+        las etapas siguientes empiecen antes de procesar toda la página.
+        Si el navegador deja de responder, el error se propaga.
+        Operación silenciosa - no genera logs.
+        """
+        start = 0
+        while True:
+            try:
+                data = self.driver.execute_script(
+                    self.EXTRACT_CARDS_SCRIPT, self.JOB_CARD_SELECTOR, start, chunk_size
+                ) or {}
+            except Exception:
+                if not self.is_driver_alive():
+                    raise
+                return
+            
+            rows = data.get("rows") or []
+            for row in rows:
+                yield JobCard.from_row(row)
+            
+            start += len(rows)
+            if not rows or start >= data.get("total", 0):
+                return
+    
+    def extract_job_cards(self):
+        """
+        Extrae TODAS las tarjetas visibles en una sola llamada execute_script.
+        Log: 📋 TARJETAS EXTRAÍDAS
+        """
+        cards = list(self.iter_job_cards(chunk_size=0))
+        logger.info(f"📋 TARJETAS EXTRAÍDAS: {len(cards)} empleos")
+        return cards
+    
+    def iter_results(self, max_results=None, max_pages=None, start_page=1, on_page=None, capture=None):
+        """
+        Iterador de JobCard sobre todas las páginas de resultados
+        (scroll de la lista + paginación, sin repetir empleos).
+        Con capture (NetworkCapture) las tarjetas salen de la API.
+        Ver ResultsPaginator.
+        """
+        return ResultsPaginator(self, max_results, max_pages, start_page, on_page, capture)
@@ -0,0 +1,251 @@
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from config.settings import settings
+from utils.logger import logger
+from utils.rate_governor import RateGovernor, rate_governor
+
+
+class ResultsPaginator:
+    """
+    Recorre los resultados de búsqueda como un iterador de JobCard:
+
+    1. Toma las tarjetas que la página recibió de la API (NetworkCapture,
+       si se pasó capture); si la API trajo la página completa no hace
+       falta el DOM. Si no, extrae las tarjetas visibles (JobsPage.iter_job_cards)
+    2. Desplaza el contenedor de la lista y espera tarjetas nuevas con un
+       MutationObserver (sin sleeps): termina la página cuando el scroll
+       llega al fondo y no aparece nada nuevo, tras MAX_IDLE_SCROLLS
+       desplazamientos seguidos sin tarjetas nuevas, al llegar a
+       MAX_SCROLLS o al vencer el plazo del paso
+    3. Pasa a la página siguiente con el botón numerado (sin recargar) o,
+       si no existe, navegando a la URL con el parámetro start
+
+    Las tarjetas se deduplican con un conjunto de ids vistos y el recorrido
+    se detiene al alcanzar max_results, max_pages o una página sin novedades.
+    on_page(página, nuevas) se llama al terminar cada página (checkpoints).
+    Un error de script con Chrome caído no es "página sin novedades": se
+    propaga para que el recorrido no cuente como terminado.
+    """
+
+    PAGE_SIZE = 25
+    # Tope de desplazamientos por página (una lista que nunca llega al fondo no cuelga el recorrido)
+    MAX_SCROLLS = 30
+    MAX_IDLE_SCROLLS = 3
+
+    # Desplaza el contenedor una pantalla y espera a que se agreguen nodos
+    SCROLL_SCRIPT = """
+        var selector = arguments[0], timeoutMs = arguments[1];
+        var done = arguments[arguments.length - 1];
+        var list = document.querySelector(selector);
+        if (!list) { done(null); return; }
+
+        var box = list;
+        while (box && box !== document.body && box.scrollHeight <= box.clientHeight) box = box.parentElement;
+        if (!box || box === document.body) box = document.scrollingElement;
+
+        var before = box.scrollTop, finished = false, timer = null;
+        var observer = new MutationObserver(function(mutations) {
+            for (var i = 0; i < mutations.length; i++) {
+                if (mutations[i].addedNodes.length) { finish(true); return; }
+            }
+        });
+        function finish(changed) {
+            if (finished) return;
+            finished = true;
+            observer.disconnect();
+            if (timer) clearTimeout(timer);
+            done({
+                changed: changed,
+                moved: box.scrollTop !== before,
+                atBottom: box.scrollTop + box.clientHeight >= box.scrollHeight - 2
+            });
+        }
+        observer.observe(list, {childList: true, subtree: true});
+        box.scrollTop = before + Math.max(box.clientHeight, 200);
+        timer = setTimeout(function() { finish(false); }, timeoutMs);
+    """
+
+    # Pulsa el botón de la página indicada y espera al primer cambio de la lista
+    NEXT_PAGE_SCRIPT = """
+        var page = arguments[0], selector = arguments[1], timeoutMs = arguments[2];
+        var done = arguments[arguments.length - 1];
+        var button = document.querySelector('[data-test-pagination-page-btn="' + page + '"] button')
+            || document.querySelector('button[aria-label="Page ' + page + '"]');
+        if (!button) { done(false); return; }
+
+        var target = document.querySelector(selector) || document.body;
+        var finished = false, timer = null;
+        var observer = new MutationObserver(function() { finish(true); });
+        function finish(result) {
+            if (finished) return;
+            finished = true;
+            observer.disconnect();
+            if (timer) clearTimeout(timer);
+            done(result);
+        }
+        observer.observe(target, {childList: true, subtree: true});
+        button.click();
+        timer = setTimeout(function() { finish(true); }, timeoutMs);
+    """
+
+    def __init__(self, jobs_page, max_results=None, max_pages=None, start_page=1, on_page=None,
+                 capture=None):
+        self.jobs_page = jobs_page
+        self.capture = capture
+        self.driver = jobs_page.driver
+        self.policy = settings.WAIT_POLICY
+        self.max_results = max_results if max_results is not None else settings.MAX_RESULTS
+        self.max_pages = max_pages if max_pages is not None else settings.MAX_RESULT_PAGES
+        self.start_page = max(1, start_page)
+        self.on_page = on_page
+        self.seen_ids = set()
+        self.page = self.start_page
+        self.yielded = 0
+
+    def __iter__(self):
+        return self.iter_cards()
+
+    def iter_cards(self):
+        """Generador de JobCard nuevas, página por página"""
+        if self.start_page > 1 and not self._goto_page_url(self.start_page):
+            return
+
+        pages_done = 0
+        while True:
+            new_on_page = 0
+            for card in self._iter_page():
+                new_on_page += 1
+                self.yielded += 1
+                yield card
+                if self.max_results and self.yielded >= self.max_results:
+                    self._page_done(new_on_page)
+                    return
+
+            self._page_done(new_on_page)
+            pages_done += 1
+
+            if new_on_page == 0:
+                logger.info(f"📄 Página {self.page} sin empleos nuevos - fin del recorrido")
+                return
+            if self.max_pages and pages_done >= self.max_pages:
+                return
+            if not self._next_page():
+                return
+
+    # ==================== MÉTODOS AUXILIARES ====================
+
+    def _iter_page(self):
+        """Tarjetas nuevas de la página actual, desplazando la lista hasta el fondo"""
+        captured = self._captured_cards()
+        for card in captured:
+            if card.job_id in self.seen_ids:
+                continue
+            self.seen_ids.add(card.job_id)
+            yield card
+        if self._captured_complete(captured):
+            logger.debug(f"🛰️  Página {self.page}: {len(captured)} empleos desde la API")
+            return
+
+        # Sin captura (o página incompleta): tarjetas del DOM
+        idle = 0
+        for scrolls in range(self.MAX_SCROLLS + 1):
+            found = 0
+            for card in self.jobs_page.iter_job_cards():
+                if card.job_id in self.seen_ids:
+                    continue
+                self.seen_ids.add(card.job_id)
+                found += 1
+                yield card
+
+            idle = 0 if found else idle + 1
+            if idle >= self.MAX_IDLE_SCROLLS:
+                logger.debug(f"📄 Página {self.page}: {idle} desplazamientos sin tarjetas nuevas")
+                return
+            deadline = self.policy.current_deadline()
+            if deadline is not None and deadline.expired():
+                logger.info(f"⏱️  Página {self.page}: plazo del paso vencido tras {scrolls} desplazamientos")
+                return
+            if scrolls == self.MAX_SCROLLS:
+                logger.info(f"📄 Página {self.page}: tope de {self.MAX_SCROLLS} desplazamientos")
+                return
+
+            state = self._scroll_once()
+            if not state:
+                return
+            if not state.get("changed") and (state.get("atBottom") or not state.get("moved")):
+                return
+
+    def _captured_cards(self):
+        """Tarjetas de las respuestas de la API de esta página (espera las que están en vuelo)"""
+        if not self.capture:
+            return []
+        return self.capture.collect_cards(self.policy.budget(self.policy.presence_timeout))
+
+    def _captured_complete(self, captured):
+        """La API trajo la página entera (25 tarjetas, o todas las que quedaban)"""
+        if not captured:
+            return False
+        paging = self.capture.paging
+        total = paging.get("total")
+        return len(captured) >= self.PAGE_SIZE or (
+            total is not None and paging.get("start", 0) + len(captured) >= total)
+
+    def _scroll_once(self):
+        timeout = self.policy.budget(self.policy.presence_timeout)
+        try:
+            return self.driver.execute_async_script(
+                self.SCROLL_SCRIPT, self.jobs_page.RESULTS_LIST_SELECTOR, int(timeout * 1000)
+            )
+        except Exception:
+            if not self.jobs_page.is_driver_alive():
+                raise
+            return None
+
+    def _page_done(self, new_on_page):
+        logger.info(f"📄 Página {self.page}: {new_on_page} empleos nuevos ({len(self.seen_ids)} en total)")
+        if self.on_page:
+            self.on_page(self.page, new_on_page)
+
+    def _next_page(self):
+        """Avanza a la página siguiente; retorna False si no hay más"""
+        page = self.page + 1
+        rate_governor.acquire("paginate", RateGovernor.PRIORITY_LOW)
+        timeout = self.policy.budget(self.policy.presence_timeout)
+        try:
+            clicked = self.driver.execute_async_script(
+                self.NEXT_PAGE_SCRIPT, page, self.jobs_page.RESULTS_LIST_SELECTOR, int(timeout * 1000)
+            )
+        except Exception:
+            if not self.jobs_page.is_driver_alive():
+                raise
+            clicked = False
+
+        if clicked:
+            self.jobs_page.wait_for_dom_ready([self.jobs_page.RESULTS_LIST_SELECTOR])
+            self.page = page
+            return True
+
+        # Sin botón numerado: solo se navega por URL si la página anterior estaba llena
+        if len(self.seen_ids) < (page - self.start_page) * self.PAGE_SIZE:
+            return False
+        return self._goto_page_url(page)
+
+    def _goto_page_url(self, page):
+        try:
+            url = self.page_url(self.driver.current_url, page)
+            self.jobs_page.navigate_to(url, priority=RateGovernor.PRIORITY_LOW)
+        except Exception:
+            if not self.jobs_page.is_driver_alive():
+                raise
+            return False
+        self.page = page
+        return True
+
+    @classmethod
+    def page_url(cls, url, page):
+        """URL de resultados para una página concreta (parámetro start)"""
+        parts = urlparse(url)
+        query = parse_qs(parts.query)
+        query["start"] = [str((page - 1) * cls.PAGE_SIZE)]
+        if page <= 1:
+            query.pop("start")
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
@@ -0,0 +1,74 @@
+import argparse
+import sys
+from core.answer_cache import AnswerCache
+from core.review_queue import ReviewQueue
+from utils.logger import logger
+
+
+def main():
+    """
+    Responde las preguntas de Easy Apply que quedaron en la cola de
+    revisión. Las respuestas se guardan en el AnswerCache (ANSWERS_FILE):
+    la próxima ejecución las usa y vuelve a postular a los empleos en
+    estado "review" que ya no tienen preguntas pendientes.
+
+    Uso:
+        python review.py              # pregunta una por una
+        python review.py --list       # solo muestra las preguntas pendientes
+    """
+    parser = argparse.ArgumentParser(description="Cola de revisión de Easy Apply")
+    parser.add_argument("--queue", default=None, help="Cola de revisión (REVIEW_QUEUE_FILE)")
+    parser.add_argument("--answers", default=None, help="Respuestas (ANSWERS_FILE)")
+    parser.add_argument("--list", action="store_true", help="Muestra las preguntas sin pedir respuestas")
+    args = parser.parse_args()
+
+    queue = ReviewQueue(args.queue)
+    answers = AnswerCache(args.answers)
+    pending = [question for question in queue.pending_questions(AnswerCache.normalize)
+               if answers.lookup(question["label"], question.get("options") or None) is None]
+
+    if not pending:
+        logger.success("✓ No hay preguntas pendientes de revisión")
+        queue.clear()
+        return 0
+
+    logger.raw("\n" + "=" * 80)
+    logger.raw(f"📝 {len(pending)} PREGUNTAS DE EASY APPLY SIN RESPUESTA")
+    logger.raw("=" * 80 + "\n")
+
+    answered = 0
+    try:
+        for question in pending:
+            logger.raw(f"❓ {question['label']}  ({question.get('type')}, {len(question['jobs'])} empleos)")
+            options = question.get("options") or []
+            for index, option in enumerate(options, 1):
+                logger.raw(f"     {index}. {option}")
+            suggestion = question.get("suggestion")
+            if suggestion:
+                logger.raw(f"   💡 Parecida a «{suggestion['question']}» → {suggestion['answer']} "
+                           f"(solo sugerencia, + para usarla)")
+            if args.list:
+                continue
+
+            logger.flush()
+            value = input("   → Respuesta (Enter = omitir): ").strip()
+            if not value:
+                continue
+            if value == "+" and suggestion:
+                value = str(suggestion["answer"])
+            if options and value.isdigit() and 1 <= int(value) <= len(options):
+                value = options[int(value) - 1]
+            answers.store(question["label"], value)
+            answered += 1
+    except (KeyboardInterrupt, EOFError):
+        logger.error("\n⚠️  Revisión interrumpida - se guardan las respuestas dadas")
+
+    answers.save()
+    if answered and answered == len(pending):
+        queue.clear()
+    logger.success(f"💾 {answered} respuestas guardadas ({len(answers)} en total)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
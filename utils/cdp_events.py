@@ -0,0 +1,83 @@
+import json
+
+
+class CDPEventBus:
+    """
+    Bus de eventos CDP basado en los logs de rendimiento de ChromeDriver.
+
+    Chrome entrega los eventos Network.* y Page.* a través de
+    driver.get_log('performance') (requiere la capacidad goog:loggingPrefs).
+    Leer ese log lo VACÍA, así que todos los consumidores (readiness, login,
+    captura de red...) deben compartir una única instancia por driver:
+    usar siempre CDPEventBus.for_driver(driver).
+
+    Operación silenciosa - no genera logs.
+    """
+
+    _ATTRIBUTE = "_cdp_event_bus"
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.listeners = []
+        self.supported = None
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Obtiene (o crea) el bus asociado a un driver"""
+        bus = getattr(driver, cls._ATTRIBUTE, None)
+        if bus is None:
+            bus = cls(driver)
+            try:
+                setattr(driver, cls._ATTRIBUTE, bus)
+            except Exception:
+                pass
+        return bus
+
+    def subscribe(self, callback, prefix=""):
+        """
+        Registra un callback(method, params) para los eventos cuyo
+        método empiece por `prefix` (ej. "Network." o "Page.frameNavigated").
+        """
+        listener = (prefix, callback)
+        self.listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        """Elimina un callback registrado con subscribe()"""
+        try:
+            self.listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def poll(self):
+        """
+        Vacía el log de rendimiento y despacha los eventos a los suscriptores.
+        Retorna el número de eventos procesados, o None si el driver no
+        tiene habilitado el log de rendimiento.
+        """
+        if self.supported is False:
+            return None
+
+        try:
+            entries = self.driver.get_log("performance")
+            self.supported = True
+        except Exception:
+            self.supported = False
+            return None
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except Exception:
+                continue
+
+            method = message.get("method", "")
+            params = message.get("params", {})
+            for prefix, callback in list(self.listeners):
+                if method.startswith(prefix):
+                    try:
+                        callback(method, params)
+                    except Exception:
+                        continue
+
+        return len(entries)
@@ -0,0 +1,57 @@
+import threading
+import time
+
+
+class SystemClock:
+    """Reloj real (time.monotonic / time.sleep)"""
+
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait(self, condition, seconds=None):
+        """Espera una notificación de condition (threading.Condition) o seconds"""
+        condition.wait(seconds)
+
+
+class VirtualClock:
+    """
+    Reloj simulado para simulaciones y benchmarks sin esperas reales:
+    sleep() y wait() avanzan el tiempo al instante.
+
+    settle: segundos REALES que wait() cede el lock antes de avanzar, para
+    que otros hilos alcancen a encolarse (colas de prioridad simuladas).
+    """
+
+    def __init__(self, start=0.0, settle=0.0):
+        self._now = start
+        self.settle = settle
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def now(self):
+        return self._now
+
+    def advance(self, seconds):
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._now += seconds
+            self.slept += seconds
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+    def wait(self, condition, seconds=None):
+        if seconds is None:
+            condition.wait(self.settle or None)
+            return
+        if self.settle:
+            condition.wait(self.settle)
+        self.advance(seconds)
+
+
+system_clock = SystemClock()
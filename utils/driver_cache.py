@@ -0,0 +1,135 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from config.settings import settings
+
+
+class DriverCache:
+    """
+    Caché local de la resolución de ChromeDriver.
+
+    ChromeDriverManager().install() consulta versiones (y a veces descarga)
+    en cada ejecución y falla sin red. Aquí se guarda la ruta del binario
+    junto con la versión de Chrome para la que se resolvió, y solo se vuelve
+    a resolver cuando cambia la versión mayor de Chrome instalada.
+
+    Metadatos en settings.DRIVER_CACHE_FILE:
+        {"driver_path": ..., "driver_version": ..., "browser_version": ..., "resolved_at": ...}
+
+    Operación silenciosa - no genera logs.
+    """
+
+    VERSION_PATTERN = re.compile(r"(\d+\.\d+\.\d+\.\d+)")
+
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file or settings.DRIVER_CACHE_FILE
+        # Origen de la última resolución: "cache", "download", "stale-cache" o "selenium-manager"
+        self.source = None
+
+    def resolve(self):
+        """
+        Retorna la ruta de ChromeDriver, o None si no se pudo resolver
+        (Selenium intentará entonces con su propio selenium-manager).
+        """
+        cached = self._read()
+        browser_version = self.detect_browser_version()
+
+        if self._is_valid(cached, browser_version):
+            self.source = "cache"
+            return cached["driver_path"]
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver_path = ChromeDriverManager().install()
+        except Exception:
+            # Sin red: mejor un driver quizá desactualizado que ninguno
+            if cached and os.path.exists(cached.get("driver_path", "")):
+                self.source = "stale-cache"
+                return cached["driver_path"]
+            self.source = "selenium-manager"
+            return None
+
+        self._write({
+            "driver_path": driver_path,
+            "driver_version": self._binary_version([driver_path, "--version"]),
+            "browser_version": browser_version,
+            "resolved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        })
+        self.source = "download"
+        return driver_path
+
+    def invalidate(self):
+        """Fuerza una nueva resolución en la próxima ejecución"""
+        try:
+            if os.path.exists(self.cache_file):
+                os.remove(self.cache_file)
+            return True
+        except Exception:
+            return False
+
+    # ==================== VERSIONES ====================
+
+    def detect_browser_version(self):
+        """Versión de Chrome instalada, detectada localmente (sin red)"""
+        if sys.platform.startswith("win"):
+            output = self._run([
+                "reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"
+            ])
+            match = self.VERSION_PATTERN.search(output or "")
+            return match.group(1) if match else None
+
+        if sys.platform == "darwin":
+            candidates = ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+        else:
+            candidates = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+
+        for binary in candidates:
+            version = self._binary_version([binary, "--version"])
+            if version:
+                return version
+        return None
+
+    def _is_valid(self, cached, browser_version):
+        if not cached or not os.path.exists(cached.get("driver_path", "")):
+            return False
+        # Si no se puede detectar Chrome, se confía en la caché
+        if not browser_version or not cached.get("browser_version"):
+            return True
+        return self._major(cached["browser_version"]) == self._major(browser_version)
+
+    def _binary_version(self, command):
+        match = self.VERSION_PATTERN.search(self._run(command) or "")
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _major(version):
+        return version.split(".")[0]
+
+    @staticmethod
+    def _run(command):
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=5)
+            return result.stdout
+        except Exception:
+            return None
+
+    # ==================== ARCHIVO DE METADATOS ====================
+
+    def _read(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except Exception:
+            return None
+
+    def _write(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=2)
+            return True
+        except Exception:
+            return False
@@ -1,8 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from config.settings import settings
 from utils.logger import logger
+from utils.selector_registry import selector_registry
+from utils.tracing import tracer
 
 class ElementFinder:
     """
@@ -19,12 +21,108 @@ class ElementFinder:
        - ⌨️ ACCIÓN → ESCRIBIR
        - 🧹 ACCIÓN → LIMPIAR
        - 📤 ACCIÓN → SUBMIT
+    
+    El selector puede ser CSS o el nombre de un elemento lógico del
+    SelectorRegistry (ej. "email_field"): en ese caso se prueban todos
+    sus candidatos en un solo viaje (ver find_registered).
+    """
+    
+    # Scripts de sondeo multi-selector (ver probe)
+    PROBE_SCRIPT = """
+        var selectors = arguments[0];
+        var matched = [];
+        for (var i = 0; i < selectors.length; i++) {
+            try {
+                if (document.querySelector(selectors[i])) matched.push(selectors[i]);
+            } catch (e) {}
+        }
+        return matched;
     """
     
-    def __init__(self, driver):
+    PROBE_WAIT_SCRIPT = """
+        var selectors = arguments[0], decisive = arguments[1], timeoutMs = arguments[2];
+        var done = arguments[arguments.length - 1];
+        var finished = false, observer = null, timer = null;
+        
+        function check() {
+            var matched = [];
+            for (var i = 0; i < selectors.length; i++) {
+                try {
+                    if (document.querySelector(selectors[i])) matched.push(selectors[i]);
+                } catch (e) {}
+            }
+            return matched;
+        }
+        function finish(matched) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            if (timer) clearTimeout(timer);
+            done(matched);
+        }
+        function isDecisive(matched) {
+            for (var i = 0; i < matched.length; i++) {
+                if (decisive.indexOf(matched[i]) !== -1) return true;
+            }
+            return false;
+        }
+        
+        var initial = check();
+        if (isDecisive(initial)) { finish(initial); return; }
+        
+        observer = new MutationObserver(function() {
+            var matched = check();
+            if (isDecisive(matched)) finish(matched);
+        });
+        observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+        timer = setTimeout(function() { finish(check()); }, timeoutMs);
+    """
+    
+    # Todos los candidatos de un elemento lógico en un viaje: retorna los que
+    # coinciden y el elemento del primero (en el orden preferido), o null
+    FIND_FIRST_SCRIPT = """
+        var candidates = arguments[0], timeoutMs = arguments[1];
+        var done = arguments[arguments.length - 1];
+        var finished = false, observer = null, timer = null;
+        
+        function check() {
+            var matched = [], element = null;
+            for (var i = 0; i < candidates.length; i++) {
+                var found = null;
+                try { found = document.querySelector(candidates[i]); } catch (e) {}
+                if (found) {
+                    matched.push(candidates[i]);
+                    if (!element) element = found;
+                }
+            }
+            return matched.length ? {matched: matched, element: element} : null;
+        }
+        function finish(result) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            if (timer) clearTimeout(timer);
+            done(result);
+        }
+        
+        var initial = check();
+        if (initial || !timeoutMs) { finish(initial); return; }
+        
+        observer = new MutationObserver(function() {
+            var result = check();
+            if (result) finish(result);
+        });
+        observer.observe(document.documentElement, {childList: true, subtree: true});
+        timer = setTimeout(function() { finish(check()); }, timeoutMs);
+    """
+    
+    def __init__(self, driver, registry=None):
         self.driver = driver
+        self.policy = settings.WAIT_POLICY
+        self.registry = registry or selector_registry
     
-    def find_element(self, selector, timeout=3, description=""):
+    @tracer.traced(category="finder")
+    def find_element(self, selector, timeout=None, description=""):
         """
         Encuentra un elemento de forma segura.
         Logs SIEMPRE generados: 
@@ -32,10 +130,14 @@ class ElementFinder:
         2. ✓ ELEMENTO ENCONTRADO (si lo encuentra)
         3. ❌ ELEMENTO NO ENCONTRADO (si no lo encuentra)
         """
+        if selector in self.registry:
+            return self.find_registered(selector, timeout, description)
         logger.searching_element(selector, description)
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            element = self.policy.until(
+                self.driver,
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector)),
+                self.policy.find_timeout if timeout is None else timeout
             )
             logger.element_found(selector, description)
             return element
@@ -46,7 +148,8 @@ class ElementFinder:
             logger.element_not_found(selector, description)
             return None
     
-    def find_clickable(self, selector, timeout=5, description=""):
+    @tracer.traced(category="finder")
+    def find_clickable(self, selector, timeout=None, description=""):
         """
         Encuentra un elemento clickable de forma segura.
         Logs SIEMPRE generados:
@@ -54,10 +157,14 @@ class ElementFinder:
         2. ✓ ELEMENTO ENCONTRADO (si lo encuentra)
         3. ❌ ELEMENTO NO ENCONTRADO (si no lo encuentra)
         """
+        if selector in self.registry:
+            return self.find_registered(selector, timeout, description, clickable=True)
         logger.searching_element(selector, f"{description} (clickable)")
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+            element = self.policy.until(
+                self.driver,
+                EC.element_to_be_clickable((By.CSS_SELECTOR, selector)),
+                self.policy.clickable_timeout if timeout is None else timeout
             )
             logger.element_found(selector, f"{description} (clickable)")
             return element
@@ -68,7 +175,69 @@ class ElementFinder:
             logger.element_not_found(selector, f"{description} (clickable)")
             return None
     
-    def find_multiple(self, selector, timeout=3, description=""):
+    @tracer.traced(category="finder")
+    def find_registered(self, name, timeout=None, description="", clickable=False):
+        """
+        Encuentra un elemento lógico del SelectorRegistry.
+        
+        Un solo execute_async_script prueba todos los candidatos (y espera
+        con un MutationObserver si aún no existe ninguno): un selector
+        muerto no cuesta un timeout propio. El registro anota qué
+        candidatos acertaron y en cuánto tiempo, y la próxima búsqueda
+        empieza por el mejor. Un script que falló o un elemento ausente
+        no dicen nada de los candidatos: no se anotan.
+        
+        Logs:
+        1. 🔎 BUSCANDO ELEMENTO (nombre lógico y candidatos)
+        2. ✓ ELEMENTO ENCONTRADO (selector que respondió) / ❌ ELEMENTO NO ENCONTRADO
+        """
+        suffix = f"{description} (clickable)" if clickable else description
+        candidates = self.registry.candidates(name)
+        logger.searching_element(f"{name} [{' | '.join(candidates)}]", suffix)
+        
+        if timeout is None:
+            timeout = self.policy.clickable_timeout if clickable else self.policy.find_timeout
+        timeout = max(0.0, self.policy.budget(timeout))
+        clock = self.policy.clock
+        started_at = clock.now()
+        try:
+            result = self.driver.execute_async_script(self.FIND_FIRST_SCRIPT, candidates, int(timeout * 1000))
+        except Exception:
+            logger.element_not_found(name, suffix)
+            return None
+        
+        matched = (result or {}).get("matched") or []
+        if not matched:
+            logger.element_not_found(name, suffix)
+            return None
+        self.registry.record(name, matched, candidates, clock.now() - started_at)
+        
+        element = result.get("element")
+        if clickable and not self._is_clickable(element):
+            # Existe pero todavía no es clickable: esperar solo a ese candidato
+            remaining = timeout - (clock.now() - started_at)
+            try:
+                element = self.policy.until(
+                    self.driver, EC.element_to_be_clickable((By.CSS_SELECTOR, matched[0])), remaining
+                )
+            except Exception:
+                logger.element_not_found(name, suffix)
+                return None
+        
+        if matched[0] != candidates[0]:
+            logger.debug(lambda: f"🩹 {name}: respondió '{matched[0]}' en lugar de '{candidates[0]}'")
+        logger.element_found(matched[0], suffix)
+        return element
+    
+    @staticmethod
+    def _is_clickable(element):
+        try:
+            return element.is_displayed() and element.is_enabled()
+        except Exception:
+            return False
+    
+    @tracer.traced(category="finder")
+    def find_multiple(self, selector, timeout=None, description=""):
         """
         Encuentra múltiples elementos de forma segura.
         Logs SIEMPRE generados:
@@ -78,8 +247,10 @@ class ElementFinder:
         """
         logger.searching_element(selector, f"{description} (múltiples)")
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
+            elements = self.policy.until(
+                self.driver,
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)),
+                self.policy.find_timeout if timeout is None else timeout
             )
             logger.element_found(selector, f"{description} (encontrados: {len(elements)})")
             return elements
@@ -90,7 +261,8 @@ class ElementFinder:
             logger.element_not_found(selector, f"{description} (múltiples)")
             return []
     
-    def is_element_present(self, selector, timeout=2, description=""):
+    @tracer.traced(category="finder")
+    def is_element_present(self, selector, timeout=None, description=""):
         """
         Verifica si un elemento está presente.
         AHORA CON LOGGING - ya no es silencioso.
@@ -103,8 +275,10 @@ class ElementFinder:
         """
         logger.searching_element(selector, f"{description} (verificación)")
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            self.policy.until(
+                self.driver,
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector)),
+                self.policy.presence_timeout if timeout is None else timeout
             )
             logger.element_found(selector, f"{description} (verificación)")
             return True
@@ -112,7 +286,48 @@ class ElementFinder:
             logger.element_not_found(selector, f"{description} (verificación)")
             return False
     
-    def safe_click(self, selector, description="", timeout=5):
+    @tracer.traced(category="finder")
+    def probe(self, selectors, decisive=None, timeout=0, description=""):
+        """
+        Verifica VARIOS selectores CSS en un solo viaje al navegador.
+        
+        - timeout=0: una única llamada execute_script (foto instantánea del DOM)
+        - timeout>0: un MutationObserver en la página resuelve en cuanto aparece
+          algún selector "decisivo" (por defecto, cualquiera) o vence el plazo
+        
+        Logs generados:
+        1. 🔎 BUSCANDO ELEMENTO (todos los selectores en una línea)
+        2. ✓ ELEMENTO ENCONTRADO (los que coincidieron) / ❌ ELEMENTO NO ENCONTRADO
+        
+        Retorna: dict {selector: True/False}
+        """
+        selectors = list(selectors)
+        decisive = list(decisive) if decisive is not None else selectors
+        label = " | ".join(selectors)
+        logger.searching_element(label, f"{description} (sondeo)")
+        
+        timeout = self.policy.budget(timeout)
+        try:
+            if timeout and timeout > 0:
+                matched = self.driver.execute_async_script(
+                    self.PROBE_WAIT_SCRIPT, selectors, decisive, int(timeout * 1000)
+                )
+            else:
+                matched = self.driver.execute_script(self.PROBE_SCRIPT, selectors)
+        except Exception:
+            matched = []
+        
+        matched = set(matched or [])
+        result = {selector: selector in matched for selector in selectors}
+        
+        if matched:
+            logger.element_found(" | ".join(s for s in selectors if result[s]), f"{description} (sondeo)")
+        else:
+            logger.element_not_found(label, f"{description} (sondeo)")
+        return result
+    
+    @tracer.traced(category="finder")
+    def safe_click(self, selector, description="", timeout=None):
         """
         Hace clic de forma segura en un elemento.
         
@@ -131,7 +346,8 @@ class ElementFinder:
                 return False
         return False
     
-    def safe_send_keys(self, selector, text, description="", timeout=5, clear_first=True):
+    @tracer.traced(category="finder")
+    def safe_send_keys(self, selector, text, description="", timeout=None, clear_first=True):
         """
         Envía texto de forma segura a un elemento.
         
@@ -141,6 +357,7 @@ class ElementFinder:
         3. 🧹 ACCIÓN → LIMPIAR (si clear_first=True)
         4. ⌨️ ACCIÓN → ESCRIBIR
         """
+        timeout = self.policy.clickable_timeout if timeout is None else timeout
         element = self.find_element(selector, timeout, description)
         if element:
             try:
@@ -155,7 +372,8 @@ class ElementFinder:
                 return False
         return False
     
-    def safe_submit(self, selector, description="", timeout=5):
+    @tracer.traced(category="finder")
+    def safe_submit(self, selector, description="", timeout=None):
         """
         Envía un formulario (submit) de forma segura.
         
@@ -164,6 +382,7 @@ class ElementFinder:
         2. ✓ ELEMENTO ENCONTRADO / ❌ ELEMENTO NO ENCONTRADO
         3. 📤 ACCIÓN → SUBMIT (solo si se encontró)
         """
+        timeout = self.policy.clickable_timeout if timeout is None else timeout
         element = self.find_element(selector, timeout, description)
         if element:
             try:
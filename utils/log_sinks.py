@@ -0,0 +1,187 @@
+import json
+import os
+import threading
+from datetime import datetime
+from colorama import init, Fore, Back, Style
+from config.settings import settings
+
+# Inicializar colorama para colores en Windows/Linux/Mac
+init()
+
+
+class LogRecord:
+    """
+    Registro de log con el mensaje SIN formatear: template.format(*args)
+    se evalúa recién en el hilo de escritura (get_message).
+    """
+
+    __slots__ = ("level", "kind", "emoji", "template", "args", "created", "thread")
+
+    def __init__(self, level, kind, emoji, template, args, created, thread):
+        self.level = level
+        self.kind = kind
+        self.emoji = emoji
+        self.template = template
+        self.args = args
+        self.created = created
+        self.thread = thread
+
+    def get_message(self):
+        if callable(self.template):
+            return str(self.template())
+        if self.args:
+            return self.template.format(*self.args)
+        return self.template
+
+
+def _ensure_directory(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+class ConsoleSink:
+    """Consola con colores (el formato original del logger)"""
+
+    COLORS = {
+        'PAGE': Fore.GREEN,
+        'URL': Fore.CYAN,
+        'SEARCHING': Fore.LIGHTYELLOW_EX,
+        'FOUND': Fore.YELLOW,
+        'NOT_FOUND': Fore.LIGHTBLACK_EX,
+        'ACTION_CLICK': Fore.MAGENTA,
+        'ACTION_SEND': Fore.LIGHTBLUE_EX,
+        'ACTION_OTHER': Fore.LIGHTMAGENTA_EX,
+        'SUCCESS': Fore.LIGHTGREEN_EX,
+        'ERROR': Fore.RED,
+        'INFO': Fore.LIGHTCYAN_EX,
+        'DEBUG': Fore.LIGHTBLACK_EX,
+        'WARNING': Fore.LIGHTYELLOW_EX,
+    }
+    TIMESTAMP = Fore.WHITE
+    RESET = Style.RESET_ALL
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.time_format = self._time_format()
+
+    @staticmethod
+    def _time_format():
+        """Formato del timestamp según configuración (06:00 PM - Monday - 31/12/2024)"""
+        format_str = "%I:%M %p"
+        if settings.LOG_SHOW_DAY:
+            format_str += " - %A"
+        if settings.LOG_SHOW_DATE:
+            format_str += " - %d/%m/%Y"
+        return format_str
+
+    def format(self, record):
+        if record.kind == 'RAW':
+            return record.get_message()
+        if record.kind == 'SEPARATOR':
+            return f"{Fore.LIGHTBLACK_EX}{'─' * 80}{self.RESET}"
+
+        timestamp = datetime.fromtimestamp(record.created).strftime(self.time_format)
+        prefix = f"{self.TIMESTAMP}[{timestamp}]{self.RESET}"
+        if record.kind == 'SECTION':
+            return f"\n{prefix} {Back.BLUE}{Fore.WHITE} {record.get_message()} {self.RESET}"
+        color = self.COLORS.get(record.kind, '')
+        return f"{prefix} {record.emoji} {color}{record.get_message()}{self.RESET}"
+
+    def emit(self, record):
+        print(self.format(record), file=self.stream)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    """Un objeto JSON por línea (para procesar logs con herramientas)"""
+
+    def __init__(self, path=None):
+        self.path = path or settings.LOG_JSON_FILE
+        _ensure_directory(self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def emit(self, record):
+        if record.kind in ('SEPARATOR', 'RAW'):
+            return
+        self.file.write(json.dumps({
+            "ts": round(record.created, 3),
+            "level": record.level,
+            "kind": record.kind,
+            "message": record.get_message(),
+            "thread": record.thread,
+        }, ensure_ascii=False) + "\n")
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class RotatingFileSink:
+    """Texto plano sin colores; rota el archivo al superar max_bytes (.1, .2, ...)"""
+
+    def __init__(self, path=None, max_bytes=None, backups=None):
+        self.path = path or settings.LOG_FILE
+        self.max_bytes = settings.LOG_FILE_MAX_BYTES if max_bytes is None else max_bytes
+        self.backups = settings.LOG_FILE_BACKUPS if backups is None else backups
+        _ensure_directory(self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def format(record):
+        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        return f"{timestamp} {record.level:<7} [{record.thread}] {record.get_message()}"
+
+    def emit(self, record):
+        if record.kind in ('SEPARATOR', 'RAW'):
+            return
+        with self._lock:
+            self.file.write(self.format(record) + "\n")
+            if self.max_bytes and self.file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def _rotate(self):
+        self.file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def flush(self):
+        with self._lock:
+            self.file.flush()
+
+    def close(self):
+        with self._lock:
+            self.file.close()
+
+
+SINKS = {
+    "console": ConsoleSink,
+    "json": JsonLinesSink,
+    "file": RotatingFileSink,
+}
+
+
+def build_sinks(names=None):
+    """Crea los sinks configurados (LOG_SINKS, ej. "console,file")"""
+    names = names if names is not None else settings.LOG_SINKS
+    sinks = []
+    for name in names:
+        if name not in SINKS:
+            raise ValueError(f"Sink de log desconocido: {name} (usar {', '.join(SINKS)})")
+        sinks.append(SINKS[name]())
+    return sinks
@@ -1,174 +1,254 @@
+import atexit
 import os
-import sys
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from colorama import init, Fore, Back, Style
 from config.settings import settings
-
-# Inicializar colorama para colores en Windows/Linux/Mac
-init()
+from utils.log_sinks import LogRecord, RotatingFileSink, build_sinks
 
 class Logger:
     """
     Logger modularizado con logs bonitos y diferenciados:
     1. PAGINA CARGO COMPLETAMENTE (DOMContentLoaded)
     2. URL de la pagina
-    3. BUSCANDO ELEMENTO
-    4. ELEMENTO ENCONTRADO
-    5. ELEMENTO NO ENCONTRADO (nuevo)
+    3. BUSCANDO ELEMENTO (DEBUG)
+    4. ELEMENTO ENCONTRADO (DEBUG)
+    5. ELEMENTO NO ENCONTRADO (DEBUG)
     6. ELEMENTO ACCIONADO (con tipos diferenciados)
+
+    El nivel se verifica ANTES de construir el mensaje: un log descartado
+    no formatea nada. Los registros se escriben desde un hilo en segundo
+    plano a los sinks configurados (LOG_SINKS: console, json, file).
+    Con nivel INFO los registros DEBUG se guardan sin formatear en un
+    buffer circular (LOG_DEBUG_BUFFER) que solo se vuelca a disco
+    (LOG_DEBUG_DUMP_FILE) cuando ocurre un error.
     """
-    
-    def __init__(self):
-        self.levels = {
-            'DEBUG': 0,
-            'INFO': 1,
-            'WARNING': 2,
-            'ERROR': 3
-        }
-        self.current_level = self.levels.get(settings.LOG_LEVEL, 1)
-        self.colors = {
-            'PAGE': Fore.GREEN,
-            'URL': Fore.CYAN,
-            'SEARCHING': Fore.LIGHTYELLOW_EX,
-            'FOUND': Fore.YELLOW,
-            'NOT_FOUND': Fore.LIGHTBLACK_EX,  # Nuevo color para "no encontrado"
-            'ACTION_CLICK': Fore.MAGENTA,
-            'ACTION_SEND': Fore.LIGHTBLUE_EX,
-            'ACTION_OTHER': Fore.LIGHTMAGENTA_EX,
-            'SUCCESS': Fore.LIGHTGREEN_EX,
-            'ERROR': Fore.RED,
-            'TIMESTAMP': Fore.WHITE,
-            'RESET': Style.RESET_ALL
-        }
-    
-    def _get_timestamp(self):
-        """Genera timestamp según configuración"""
-        now = datetime.now()
-        
-        time_format = "%I:%M %p"  # 06:00 PM
-        day_format = ""
-        date_format = ""
-        
-        if settings.LOG_SHOW_TIME:
-            time_format = "%I:%M %p"
-        
-        if settings.LOG_SHOW_DAY:
-            day_format = " - %A"
-        
-        if settings.LOG_SHOW_DATE:
-            date_format = " - %d/%m/%Y"
-        
-        format_str = time_format + day_format + date_format
-        return now.strftime(format_str)
-    
-    def _should_log(self, level):
+
+    LEVELS = {
+        'DEBUG': 0,
+        'INFO': 1,
+        'WARNING': 2,
+        'ERROR': 3
+    }
+    DEBUG, INFO, WARNING, ERROR = 0, 1, 2, 3
+    LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+    def __init__(self, sinks=None, asynchronous=None):
+        self.current_level = self.LEVELS.get(settings.LOG_LEVEL, self.INFO)
+        self.sinks = sinks if sinks is not None else build_sinks()
+        self.asynchronous = settings.LOG_ASYNC if asynchronous is None else asynchronous
+
+        # Registros DEBUG descartados por nivel (se vuelcan solo ante un error)
+        self.debug_buffer = deque(maxlen=settings.LOG_DEBUG_BUFFER) if settings.LOG_DEBUG_BUFFER else None
+        self.dump_file = settings.LOG_DEBUG_DUMP_FILE
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+
+    # ==================== NÚCLEO ====================
+
+    def is_enabled(self, level):
         """Verifica si el nivel debe ser mostrado"""
-        return self.levels[level] >= self.current_level
-    
-    def _print_log(self, emoji, color, message):
-        """Método interno unificado para imprimir logs"""
-        if not self._should_log('INFO'):
+        return level >= self.current_level
+
+    def _log(self, level, kind, emoji, template, *args):
+        """
+        Encola un registro. template.format(*args) (o template() si es
+        callable) se evalúa en el hilo de escritura, nunca en el llamador.
+        """
+        if level < self.current_level:
+            if level == self.DEBUG and self.debug_buffer is not None:
+                self.debug_buffer.append(self._record(level, kind, emoji, template, args))
+            return
+
+        record = self._record(level, kind, emoji, template, args)
+        if level >= self.ERROR and self.debug_buffer:
+            # Contexto del error: los DEBUG previos se vuelcan a disco
+            pending = list(self.debug_buffer)
+            self.debug_buffer.clear()
+            self._submit(("dump", pending))
+        self._submit(("record", record))
+
+    @staticmethod
+    def _record(level, kind, emoji, template, args):
+        return LogRecord(
+            Logger.LEVEL_NAMES[level], kind, emoji, template, args,
+            time.time(), threading.current_thread().name,
+        )
+
+    def _submit(self, item):
+        if not self.asynchronous or self._closed:
+            self._handle(item)
             return
-        
-        timestamp = self._get_timestamp()
-        log_message = f"{self.colors['TIMESTAMP']}[{timestamp}]{self.colors['RESET']} {emoji} {color}{message}{self.colors['RESET']}"
-        print(log_message)
-    
+        if self._thread is None:
+            self._start_thread()
+        self._queue.put(item)
+
+    def _start_thread(self):
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="logger", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._handle(item)
+            finally:
+                self._queue.task_done()
+
+    def _handle(self, item):
+        kind, payload = item
+        try:
+            if kind == "dump":
+                self._write_dump(payload)
+            elif kind == "flush":
+                for sink in self.sinks:
+                    sink.flush()
+            else:
+                for sink in self.sinks:
+                    sink.emit(payload)
+        except Exception:
+            # Un sink roto nunca debe tumbar la automatización
+            pass
+
+    def _write_dump(self, records):
+        if not records:
+            return
+        directory = os.path.dirname(self.dump_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.dump_file, "a", encoding="utf-8") as file:
+            file.write(f"===== DEBUG previo al error ({datetime.now():%Y-%m-%d %H:%M:%S}) =====\n")
+            for record in records:
+                file.write(RotatingFileSink.format(record) + "\n")
+
+    def flush(self):
+        """Espera a que el hilo de escritura vacíe la cola (antes de print/input directos)"""
+        self._submit(("flush", None))
+        if self._thread is not None and not self._closed:
+            self._queue.join()
+
+    def close(self):
+        """Vacía la cola y cierra los sinks (se registra con atexit)"""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception:
+                pass
+
     # ==================== MÉTODOS PRINCIPALES ====================
-    
-    def page_loaded(self, url):
+
+    def page_loaded(self, url, elapsed=None):
         """✅ PAGINA CARGO COMPLETAMENTE (DOMContentLoaded)"""
-        self._print_log('📄', self.colors['PAGE'], f"PAGINA CARGO COMPLETAMENTE (DOMContentLoaded)")
-    
+        if elapsed is None:
+            self._log(self.INFO, 'PAGE', '📄', "PAGINA CARGO COMPLETAMENTE (DOMContentLoaded)")
+        else:
+            self._log(self.INFO, 'PAGE', '📄', "PAGINA CARGO COMPLETAMENTE (DOMContentLoaded) en {:.2f}s", elapsed)
+
     def current_url(self, url):
         """✅ URL de la pagina"""
-        self._print_log('🔗', self.colors['URL'], f"URL: {url}")
-    
+        self._log(self.INFO, 'URL', '🔗', "URL: {}", url)
+
     def searching_element(self, selector, description=""):
-        """✅ BUSCANDO ELEMENTO"""
-        desc = f" - {description}" if description else ""
-        self._print_log('🔎', self.colors['SEARCHING'], f"BUSCANDO ELEMENTO: {selector}{desc}")
-    
+        """✅ BUSCANDO ELEMENTO (DEBUG)"""
+        self._log(self.DEBUG, 'SEARCHING', '🔎', "BUSCANDO ELEMENTO: {}{}", selector, self._suffix(description))
+
     def element_found(self, selector, description=""):
-        """✅ ELEMENTO ENCONTRADO"""
-        desc = f" - {description}" if description else ""
-        self._print_log('✓', self.colors['FOUND'], f"ELEMENTO ENCONTRADO: {selector}{desc}")
-    
+        """✅ ELEMENTO ENCONTRADO (DEBUG)"""
+        self._log(self.DEBUG, 'FOUND', '✓', "ELEMENTO ENCONTRADO: {}{}", selector, self._suffix(description))
+
     def element_not_found(self, selector, description=""):
-        """✅ ELEMENTO NO ENCONTRADO (nuevo método)"""
-        desc = f" - {description}" if description else ""
-        self._print_log('✗', self.colors['NOT_FOUND'], f"ELEMENTO NO ENCONTRADO: {selector}{desc}")
-    
+        """✅ ELEMENTO NO ENCONTRADO (DEBUG)"""
+        self._log(self.DEBUG, 'NOT_FOUND', '✗', "ELEMENTO NO ENCONTRADO: {}{}", selector, self._suffix(description))
+
+    @staticmethod
+    def _suffix(description):
+        return f" - {description}" if description else ""
+
     # ==================== ACCIONES DIFERENCIADAS ====================
-    
+
     def action_click(self, element_name):
         """✅ ACCIÓN: Click en elemento"""
-        self._print_log('👆', self.colors['ACTION_CLICK'], f"ACCIÓN → CLICK: {element_name}")
-    
+        self._log(self.INFO, 'ACTION_CLICK', '👆', "ACCIÓN → CLICK: {}", element_name)
+
     def action_send_keys(self, element_name, text):
         """✅ ACCIÓN: Escribir texto en elemento"""
+        if not self.is_enabled(self.INFO):
+            return
         # Ocultar passwords
         if "password" in element_name.lower() or "contraseña" in element_name.lower():
             display_text = "●" * len(text)
         else:
             # Mostrar primeros 30 caracteres del texto
             display_text = text[:30] + "..." if len(text) > 30 else text
-        
-        self._print_log('⌨️', self.colors['ACTION_SEND'], f"ACCIÓN → ESCRIBIR: {element_name} → '{display_text}'")
-    
+
+        self._log(self.INFO, 'ACTION_SEND', '⌨️', "ACCIÓN → ESCRIBIR: {} → '{}'", element_name, display_text)
+
     def action_clear(self, element_name):
         """✅ ACCIÓN: Limpiar campo"""
-        self._print_log('🧹', self.colors['ACTION_OTHER'], f"ACCIÓN → LIMPIAR: {element_name}")
-    
+        self._log(self.INFO, 'ACTION_OTHER', '🧹', "ACCIÓN → LIMPIAR: {}", element_name)
+
     def action_submit(self, element_name):
         """✅ ACCIÓN: Submit/Enter en formulario"""
-        self._print_log('📤', self.colors['ACTION_OTHER'], f"ACCIÓN → SUBMIT: {element_name}")
-    
+        self._log(self.INFO, 'ACTION_OTHER', '📤', "ACCIÓN → SUBMIT: {}", element_name)
+
     # ==================== LOGS DE ESTADO ====================
-    
+
     def success(self, message):
         """✅ Operación exitosa"""
-        if self._should_log('INFO'):
-            timestamp = self._get_timestamp()
-            print(f"{self.colors['TIMESTAMP']}[{timestamp}]{self.colors['RESET']} ✅ {self.colors['SUCCESS']}{message}{self.colors['RESET']}")
-    
+        self._log(self.INFO, 'SUCCESS', '✅', message)
+
     def error(self, message):
         """❌ Error en operación"""
-        if self._should_log('INFO'):
-            timestamp = self._get_timestamp()
-            print(f"{self.colors['TIMESTAMP']}[{timestamp}]{self.colors['RESET']} ❌ {self.colors['ERROR']}{message}{self.colors['RESET']}")
-    
+        self._log(self.ERROR, 'ERROR', '❌', message)
+
     def info(self, message):
         """ℹ️ Información general"""
-        if self._should_log('INFO'):
-            timestamp = self._get_timestamp()
-            print(f"{self.colors['TIMESTAMP']}[{timestamp}]{self.colors['RESET']} ℹ️  {Fore.LIGHTCYAN_EX}{message}{self.colors['RESET']}")
-    
+        self._log(self.INFO, 'INFO', 'ℹ️ ', message)
+
     def separator(self):
         """Separador visual"""
-        if self._should_log('INFO'):
-            print(f"{Fore.LIGHTBLACK_EX}{'─' * 80}{self.colors['RESET']}")
-    
+        self._log(self.INFO, 'SEPARATOR', '', "")
+
     def section(self, title):
         """Título de sección"""
-        if self._should_log('INFO'):
-            timestamp = self._get_timestamp()
-            print(f"\n{self.colors['TIMESTAMP']}[{timestamp}]{self.colors['RESET']} {Back.BLUE}{Fore.WHITE} {title} {self.colors['RESET']}")
-    
-    # ==================== MÉTODOS DEPRECADOS ====================
-    
+        self._log(self.INFO, 'SECTION', '', title)
+
+    def raw(self, text):
+        """Texto tal cual (banners), en orden con el resto de logs"""
+        self._log(self.INFO, 'RAW', '', text)
+
     def debug(self, message):
-        pass  # Silenciado
-    
+        """Detalle interno (message puede ser un callable: solo se evalúa si se escribe)"""
+        self._log(self.DEBUG, 'DEBUG', '·', message)
+
     def warning(self, message):
-        pass  # Silenciado
-    
+        self._log(self.WARNING, 'WARNING', '⚠️ ', message)
+
+    # ==================== MÉTODOS DEPRECADOS ====================
+
     def system(self, message):
         pass  # Silenciado
-    
+
     def element_action(self, element_name, action_name):
         """Método deprecado - usar action_click, action_send_keys, etc."""
         pass  # Redirigir a métodos específicos
 
 # Instancia global del logger
-logger = Logger()
\ No newline at end of file
+logger = Logger()
@@ -0,0 +1,221 @@
+from config.settings import settings
+from utils.cdp_events import CDPEventBus
+from utils.clock import system_clock
+
+
+class ReadinessReport:
+    """
+    Resultado de una espera de página lista.
+
+    - ready: True si la página se consideró usable antes del timeout
+    - reason: qué señal cerró la espera ("predicate", "quiet", "timeout", "error")
+    - elapsed: segundos que tardó la espera
+    - matched: selector de la condición de página que coincidió (si hubo)
+    """
+
+    def __init__(self, ready, reason, elapsed, ready_state="", quiet_ms=0.0,
+                 mutations=0, inflight=None, matched=None, polls=0):
+        self.ready = ready
+        self.reason = reason
+        self.elapsed = elapsed
+        self.ready_state = ready_state
+        self.quiet_ms = quiet_ms
+        self.mutations = mutations
+        self.inflight = inflight
+        self.matched = matched
+        self.polls = polls
+
+    def as_dict(self):
+        """Representación serializable (benchmarks, trazas)"""
+        return {
+            "ready": self.ready,
+            "reason": self.reason,
+            "elapsed": round(self.elapsed, 4),
+            "ready_state": self.ready_state,
+            "quiet_ms": round(self.quiet_ms, 1),
+            "mutations": self.mutations,
+            "inflight": self.inflight,
+            "matched": self.matched,
+            "polls": self.polls,
+        }
+
+    def __repr__(self):
+        return (f"ReadinessReport(ready={self.ready}, reason={self.reason!r}, "
+                f"elapsed={self.elapsed:.3f}s, matched={self.matched!r})")
+
+
+class NetworkIdleTracker:
+    """
+    Cuenta las peticiones en vuelo a partir de los eventos CDP Network.*.
+    La red se considera ociosa cuando quedan <= max_inflight peticiones
+    (LinkedIn mantiene conexiones largas abiertas) durante idle_ms.
+
+    Todos los ReadinessEngine de un driver ven los mismos eventos: usar
+    NetworkIdleTracker.for_driver(driver) para compartir un solo suscriptor
+    del bus (uno por página dejaría un listener más en cada BasePage).
+    """
+
+    _ATTRIBUTE = "_network_idle_tracker"
+
+    def __init__(self, bus, max_inflight=2, clock=system_clock):
+        self.bus = bus
+        self.max_inflight = max_inflight
+        self.clock = clock
+        self.inflight = set()
+        self.last_activity = clock.now()
+        self.listener = self.bus.subscribe(self._on_event, "Network.")
+
+    @classmethod
+    def for_driver(cls, driver, clock=system_clock):
+        """Obtiene (o crea) el contador asociado a un driver"""
+        tracker = getattr(driver, cls._ATTRIBUTE, None)
+        if tracker is None:
+            tracker = cls(CDPEventBus.for_driver(driver), clock=clock)
+            try:
+                setattr(driver, cls._ATTRIBUTE, tracker)
+            except Exception:
+                pass
+        return tracker
+
+    def close(self):
+        """Deja de escuchar el bus"""
+        self.bus.unsubscribe(self.listener)
+
+    def reset(self):
+        """Olvida las peticiones de la página anterior"""
+        self.bus.poll()
+        self.inflight.clear()
+        self.last_activity = self.clock.now()
+
+    def _on_event(self, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            url = params.get("request", {}).get("url", "")
+            if url.startswith("data:"):
+                return
+            self.inflight.add(request_id)
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            self.inflight.discard(request_id)
+        else:
+            return
+        self.last_activity = self.clock.now()
+
+    @property
+    def supported(self):
+        return self.bus.supported is not False
+
+    def idle_for_ms(self):
+        """Milisegundos que lleva la red ociosa (0 si hay demasiadas peticiones)"""
+        if len(self.inflight) > self.max_inflight:
+            return 0.0
+        return (self.clock.now() - self.last_activity) * 1000
+
+
+class ReadinessEngine:
+    """
+    Decide que una página está lista a partir de señales reales
+    en lugar de esperas fijas:
+
+    1. document.readyState == 'complete'
+    2. DOM en reposo: un MutationObserver inyectado no ve cambios durante quiet_ms
+    3. Red ociosa: eventos CDP Network.* sin actividad durante network_idle_ms
+    4. Condiciones de página (ready selectors): alguno de los selectores existe
+
+    Con condiciones de página, (1)+(2)+(4) bastan; sin ellas se exige (3)
+    cuando el driver expone el log de rendimiento.
+    Cada espera genera un ReadinessReport (queda en self.reports).
+    """
+
+    POLL_SCRIPT = """
+        var selectors = arguments[0] || [];
+        if (!window.__ajaReadiness && document.documentElement) {
+            var state = {last: performance.now(), mutations: 0};
+            try {
+                new MutationObserver(function(records) {
+                    state.last = performance.now();
+                    state.mutations += records.length;
+                }).observe(document.documentElement, {
+                    childList: true, subtree: true, attributes: true, characterData: true
+                });
+            } catch (e) {}
+            window.__ajaReadiness = state;
+        }
+        var s = window.__ajaReadiness || {last: performance.now(), mutations: 0};
+        var matched = null;
+        for (var i = 0; i < selectors.length; i++) {
+            try {
+                if (document.querySelector(selectors[i])) { matched = selectors[i]; break; }
+            } catch (e) {}
+        }
+        return {
+            state: document.readyState,
+            quiet: performance.now() - s.last,
+            mutations: s.mutations,
+            matched: matched
+        };
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.bus = CDPEventBus.for_driver(driver)
+        self.clock = settings.WAIT_POLICY.clock
+        self.network = NetworkIdleTracker.for_driver(driver, clock=self.clock)
+        self.reports = []
+
+    def begin_navigation(self):
+        """Llamar justo antes de driver.get() para medir solo la nueva página"""
+        self.network.reset()
+
+    def wait(self, ready_selectors=None, timeout=None, quiet_ms=None, network_idle_ms=None):
+        """
+        Espera a que la página esté usable y retorna un ReadinessReport.
+        Nunca lanza excepciones: un fallo del driver se reporta con reason="error".
+        """
+        ready_selectors = list(ready_selectors or [])
+        policy = settings.WAIT_POLICY
+        timeout = policy.budget(policy.ready_timeout if timeout is None else timeout)
+        quiet_ms = settings.READY_QUIET_MS if quiet_ms is None else quiet_ms
+        network_idle_ms = settings.NETWORK_IDLE_MS if network_idle_ms is None else network_idle_ms
+
+        start = self.clock.now()
+        deadline = start + timeout
+        snapshot = {}
+        polls = 0
+
+        while True:
+            polls += 1
+            try:
+                self.bus.poll()
+                snapshot = self.driver.execute_script(self.POLL_SCRIPT, ready_selectors) or {}
+            except Exception:
+                return self._report(False, "error", start, snapshot, polls)
+
+            dom_settled = (snapshot.get("state") == "complete"
+                           and snapshot.get("quiet", 0) >= quiet_ms)
+
+            if dom_settled and ready_selectors and snapshot.get("matched"):
+                return self._report(True, "predicate", start, snapshot, polls)
+
+            if dom_settled and not ready_selectors:
+                if not self.network.supported or self.network.idle_for_ms() >= network_idle_ms:
+                    return self._report(True, "quiet", start, snapshot, polls)
+
+            if self.clock.now() >= deadline:
+                return self._report(False, "timeout", start, snapshot, polls)
+
+            self.clock.sleep(policy.ready_poll_interval)
+
+    def _report(self, ready, reason, start, snapshot, polls):
+        report = ReadinessReport(
+            ready=ready,
+            reason=reason,
+            elapsed=self.clock.now() - start,
+            ready_state=snapshot.get("state", ""),
+            quiet_ms=snapshot.get("quiet", 0.0),
+            mutations=snapshot.get("mutations", 0),
+            inflight=len(self.network.inflight) if self.network.supported else None,
+            matched=snapshot.get("matched"),
+            polls=polls,
+        )
+        self.reports.append(report)
+        return report
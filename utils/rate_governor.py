@@ -0,0 +1,186 @@
+import heapq
+import itertools
+import random
+import threading
+from collections import deque
+from config.settings import settings
+from utils.clock import system_clock
+
+
+# Tolerancia de redondeo: sin ella, esperas de 1e-12 s nunca avanzan el reloj
+EPSILON = 1e-6
+
+
+class TokenBucket:
+    """
+    Cubeta de fichas: recarga continua de rate fichas por segundo y como
+    máximo capacity fichas acumuladas (ráfaga).
+    """
+
+    def __init__(self, capacity, rate, now):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated_at = now
+
+    def _refill(self, now):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def wait_time(self, now):
+        """Segundos hasta que haya una ficha disponible"""
+        self._refill(now)
+        if self.tokens >= 1 - EPSILON:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now):
+        self._refill(now)
+        self.tokens -= 1
+
+
+class WindowBudget:
+    """Límite estricto: como máximo limit acciones en cualquier ventana de period segundos"""
+
+    def __init__(self, limit, period):
+        self.limit = limit
+        self.period = period
+        self.history = deque()
+
+    def wait_time(self, now):
+        while self.history and self.history[0] <= now - self.period:
+            self.history.popleft()
+        if len(self.history) < self.limit:
+            return 0.0
+        # Un poco más allá del borde: la acción sale de la ventana de verdad
+        return self.history[0] + self.period - now + 2 * EPSILON
+
+    def take(self, now):
+        self.history.append(now)
+
+
+class RateGovernor:
+    """
+    Regulador central del ritmo de acciones (navegaciones, envíos de formularios).
+
+    - Presupuesto por hora: como máximo per_hour acciones en cualquier
+      ventana de 3600 s; una cubeta de fichas (ráfagas de hasta burst)
+      solo reparte ese ritmo, sin superar nunca el límite
+    - Presupuesto diario: como máximo per_day acciones en 24 h (0 = sin límite)
+    - Separación mínima entre acciones con jitter aleatorio
+    - Cola de prioridad: cuando varios hilos esperan, pasa primero la
+      acción de menor número de prioridad (PRIORITY_HIGH)
+    - Reloj inyectable: con un VirtualClock un día de acciones se simula
+      en milisegundos (ver benchmarks/bench_governor.py)
+
+    Una instancia compartida por proceso: rate_governor.
+    """
+
+    PRIORITY_HIGH = 0      # login, envíos de formularios, postulaciones
+    PRIORITY_NORMAL = 5    # búsquedas
+    PRIORITY_LOW = 9       # paginación, detalles
+
+    def __init__(self, per_hour=None, per_day=None, min_interval=None, jitter=None, burst=None,
+                 clock=None, rng=None):
+        self._condition = threading.Condition()
+        self._waiting = []
+        self._sequence = itertools.count()
+        self.configure(per_hour, per_day, min_interval, jitter, burst, clock, rng)
+
+    def configure(self, per_hour=None, per_day=None, min_interval=None, jitter=None, burst=None,
+                  clock=None, rng=None):
+        """
+        Reconfigura los presupuestos en caliente (None = valor de settings)
+        y reinicia contadores. La instancia compartida no se reemplaza:
+        quien ya importó rate_governor ve la nueva configuración.
+        """
+        with self._condition:
+            self.clock = clock or system_clock
+            self.rng = rng or random.Random()
+            self.per_hour = settings.RATE_PER_HOUR if per_hour is None else per_hour
+            self.per_day = settings.RATE_PER_DAY if per_day is None else per_day
+            self.min_interval = settings.RATE_MIN_INTERVAL if min_interval is None else min_interval
+            self.jitter = settings.RATE_JITTER if jitter is None else jitter
+            self.burst = settings.RATE_BURST if burst is None else burst
+
+            now = self.clock.now()
+            self.buckets = []
+            if self.per_hour:
+                # La cubeta suaviza; la ventana es el límite duro (cubeta llena + recarga > per_hour)
+                self.buckets.append(TokenBucket(max(1, self.burst), self.per_hour / 3600, now))
+                self.buckets.append(WindowBudget(self.per_hour, 3600))
+            if self.per_day:
+                self.buckets.append(WindowBudget(self.per_day, 86400))
+
+            self.next_allowed = now
+            self.acquired = {}
+            self.waited = 0.0
+            # Los hilos en espera recalculan su demora con los nuevos límites
+            self._condition.notify_all()
+
+    def disable(self, clock=None):
+        """Sin límites ni esperas (benchmarks); configure() los restablece"""
+        self.configure(per_hour=0, per_day=0, min_interval=0, jitter=0, clock=clock)
+
+    def acquire(self, action="navigate", priority=PRIORITY_NORMAL):
+        """
+        Bloquea hasta que la acción pueda ejecutarse según los presupuestos.
+        Retorna los segundos esperados.
+        """
+        with self._condition:
+            started_at = self.clock.now()
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if self._waiting[0] == ticket:
+                        now = self.clock.now()
+                        delay = self._delay(now)
+                        if delay <= EPSILON:
+                            self._take(now, action)
+                            waited = now - started_at
+                            self.waited += waited
+                            return waited
+                        self.clock.wait(self._condition, delay)
+                    else:
+                        self.clock.wait(self._condition)
+            finally:
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+
+    def try_acquire(self, action="navigate"):
+        """Toma una ficha solo si no hay que esperar (sin bloquear)"""
+        with self._condition:
+            now = self.clock.now()
+            if self._waiting or self._delay(now) > EPSILON:
+                return False
+            self._take(now, action)
+            return True
+
+    def stats(self):
+        return {
+            "acquired": dict(self.acquired),
+            "waited": round(self.waited, 3),
+            "queued": len(self._waiting),
+        }
+
+    # ==================== MÉTODOS AUXILIARES ====================
+
+    def _delay(self, now):
+        delay = self.next_allowed - now
+        for bucket in self.buckets:
+            delay = max(delay, bucket.wait_time(now))
+        return delay
+
+    def _take(self, now, action):
+        for bucket in self.buckets:
+            bucket.take(now)
+        spacing = self.min_interval + (self.rng.uniform(0, self.jitter) if self.jitter else 0)
+        self.next_allowed = now + spacing
+        self.acquired[action] = self.acquired.get(action, 0) + 1
+
+
+rate_governor = RateGovernor()
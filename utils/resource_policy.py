@@ -0,0 +1,96 @@
+from config.settings import settings
+
+
+class ResourcePolicy:
+    """
+    Perfil de carga de recursos del navegador:
+
+    - full: todo se carga (comportamiento original)
+    - lean: bloquea imágenes, media, fuentes y trackers de terceros
+    - minimal: lean + hojas de estilo, e imágenes bloqueadas también por
+      content settings de Chrome (no se pueden rehabilitar por página)
+
+    El bloqueo se hace con CDP Network.setBlockedURLs (los patrones terminan
+    en * para cubrir query strings), así que cada página puede pedir que se
+    permitan categorías concretas (allow=["images"]) antes de navegar.
+    Una instancia por driver: ResourcePolicy.for_driver().
+    """
+
+    CATEGORIES = {
+        "images": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*media.licdn.com/dms/image*"],
+        "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*.ogg*", "*dms.licdn.com/playlist*"],
+        "fonts": ["*.woff*", "*.ttf*", "*.otf*"],
+        "trackers": [
+            "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+            "*px.ads.linkedin.com*", "*snap.licdn.com*", "*bat.bing.com*",
+            "*connect.facebook.net*", "*demdex.net*", "*omtrdc.net*", "*adobedtm.com*",
+        ],
+        "stylesheets": ["*.css*"],
+    }
+
+    PROFILES = {
+        "full": [],
+        "lean": ["images", "media", "fonts", "trackers"],
+        "minimal": ["images", "media", "fonts", "trackers", "stylesheets"],
+    }
+
+    _ATTRIBUTE = "_resource_policy"
+
+    def __init__(self, profile=None):
+        profile = (profile or settings.RESOURCE_PROFILE).lower()
+        if profile not in self.PROFILES:
+            raise ValueError(f"Perfil de recursos desconocido: {profile} (usar full, lean o minimal)")
+        self.profile = profile
+        self._applied = None
+
+    @classmethod
+    def for_driver(cls, driver, profile=None):
+        """Obtiene (o crea) la política asociada a un driver"""
+        policy = getattr(driver, cls._ATTRIBUTE, None)
+        if policy is None:
+            policy = cls(profile).attach(driver)
+        return policy
+
+    def attach(self, driver):
+        """Asocia esta política al driver (la usarán las páginas al navegar)"""
+        try:
+            setattr(driver, self._ATTRIBUTE, self)
+        except Exception:
+            pass
+        return self
+
+    def chrome_prefs(self):
+        """Content settings de Chrome para este perfil (1 = PERMITIR, 2 = BLOQUEAR)"""
+        images = 2 if self.profile == "minimal" else 1
+        return {
+            'profile.managed_default_content_settings.images': images,
+            'profile.default_content_setting_values.images': images,
+            'profile.managed_default_content_settings.plugins': 1 if self.profile == "full" else 2,
+        }
+
+    def blocked_patterns(self, allow=None):
+        """Patrones de URL bloqueados, menos las categorías permitidas"""
+        allow = set(allow or [])
+        patterns = []
+        for category in self.PROFILES[self.profile]:
+            if category not in allow:
+                patterns.extend(self.CATEGORIES[category])
+        return patterns
+
+    def apply(self, driver, allow=None):
+        """
+        Aplica el bloqueo antes de una navegación.
+        Solo envía comandos CDP si la lista cambió respecto a la anterior.
+        Operación silenciosa - no genera logs.
+        """
+        patterns = self.blocked_patterns(allow)
+        if patterns == self._applied:
+            return True
+        try:
+            if self._applied is None:
+                driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            self._applied = patterns
+            return True
+        except Exception:
+            return False
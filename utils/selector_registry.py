@@ -0,0 +1,244 @@
+import atexit
+import json
+import os
+import threading
+import time
+from config.settings import settings
+
+
+class SelectorRegistry:
+    """
+    Registro de selectores con memoria de aciertos.
+
+    Cada elemento lógico (campo de email, buscador, botón de login,
+    tarjeta de empleo...) tiene una lista ordenada de selectores
+    candidatos. ElementFinder los prueba TODOS en un solo viaje al
+    navegador y el registro anota cuáles coincidieron y cuánto tardó la
+    búsqueda. Con esas estadísticas (guardadas en SELECTOR_STATS_FILE)
+    los candidatos se reordenan: primero el que más acierta y más rápido
+    responde; un selector muerto (LinkedIn cambió el marcado) baja al
+    final y ya no decide nada.
+
+    - candidates(nombre): candidatos en el orden preferido
+    - group(nombre): los candidatos como un único selector CSS ("a, b, c"),
+      para sondeos de presencia y querySelectorAll
+    - record(nombre, coincidencias, candidatos, segundos)
+
+    Operación silenciosa - no genera logs.
+    """
+
+    DEFAULT_CANDIDATES = {
+        "login_form": [
+            'form[data-id="sign-in-form"]',
+            'form.login__form',
+            'form[action*="login-submit"]',
+        ],
+        "email_field": [
+            '[name="session_key"]',
+            '#username',
+            'input[autocomplete="username"]',
+        ],
+        "password_field": [
+            '[name="session_password"]',
+            '#password',
+            'input[type="password"]',
+        ],
+        "login_button": [
+            '[data-id="sign-in-form__submit-btn"][type="submit"]',
+            'form[data-id="sign-in-form"] button[type="submit"]',
+            '.login__form_action_container button',
+            'form[action*="login-submit"] button[type="submit"]',
+        ],
+        # Sin depender del texto en inglés del placeholder
+        "search_input": [
+            '[placeholder="Title, skill or Company"]',
+            'input[id^="jobs-search-box-keyword-id"]',
+            'input.jobs-search-box__text-input[name="keywords"]',
+            '.jobs-search-box__text-input',
+        ],
+        "results_list": [
+            '.jobs-search-results-list',
+            '.scaffold-layout__list',
+        ],
+        "no_results": [
+            '.jobs-search-no-results-banner',
+            '.jobs-search-two-pane__no-results-banner--expand',
+        ],
+        "job_card": [
+            '[data-occludable-job-id]',
+            '.job-card-container[data-job-id]',
+        ],
+        # Vista de detalle de un empleo (/jobs/view/<id>/)
+        "detail_title": [
+            '.job-details-jobs-unified-top-card__job-title',
+            '.jobs-unified-top-card__job-title',
+            '.top-card-layout__title',
+        ],
+        "detail_company": [
+            '.job-details-jobs-unified-top-card__company-name',
+            '.jobs-unified-top-card__company-name',
+            '.topcard__org-name-link',
+        ],
+        "detail_location": [
+            '.job-details-jobs-unified-top-card__primary-description-container',
+            '.jobs-unified-top-card__bullet',
+            '.topcard__flavor--bullet',
+        ],
+        "detail_description": [
+            '#job-details',
+            '.jobs-description__content',
+            '.show-more-less-html__markup',
+        ],
+        "detail_insights": [
+            '.job-details-jobs-unified-top-card__job-insight',
+            '.jobs-unified-top-card__job-insight',
+            '.description__job-criteria-item',
+        ],
+        "detail_apply_button": [
+            '.jobs-apply-button',
+            '.jobs-s-apply button',
+        ],
+        # Modal de Easy Apply
+        "easy_apply_modal": [
+            '.jobs-easy-apply-modal',
+            'div[data-test-modal][role="dialog"]',
+            '.artdeco-modal[role="dialog"]',
+        ],
+        "easy_apply_field": [
+            '[data-test-form-element]',
+            '.fb-dash-form-element',
+            '.jobs-easy-apply-form-section__grouping',
+        ],
+        "easy_apply_error": [
+            '.artdeco-inline-feedback--error',
+            '[data-test-form-element-error-messages]',
+        ],
+        "easy_apply_done": [
+            '[data-test-modal-id="post-apply-modal"]',
+            '.jpac-modal-header',
+            '.artdeco-inline-feedback--success',
+        ],
+    }
+
+    # Peso de la última medición en el promedio móvil de milisegundos
+    SMOOTHING = 0.3
+    # Segundos mínimos entre escrituras a disco
+    SAVE_INTERVAL = 30
+
+    def __init__(self, stats_file=None, candidates=None):
+        self.stats_file = stats_file or settings.SELECTOR_STATS_FILE
+        self.defaults = {name: list(values) for name, values in (candidates or self.DEFAULT_CANDIDATES).items()}
+        self.stats = None
+        self.dirty = False
+        self.saved_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __contains__(self, name):
+        return name in self.defaults
+
+    def register(self, name, candidates):
+        """Define (o reemplaza) los candidatos de un elemento lógico"""
+        with self._lock:
+            self.defaults[name] = list(candidates)
+
+    # ==================== ORDEN DE CANDIDATOS ====================
+
+    def candidates(self, name):
+        """Candidatos de name: el más certero primero, luego el más rápido"""
+        with self._lock:
+            stats = self._load().get(name, {})
+            candidates = self.defaults[name]
+            return sorted(candidates, key=lambda selector: self._rank(
+                stats.get(selector), candidates.index(selector)))
+
+    def group(self, name):
+        """Todos los candidatos como un solo selector CSS (en el orden preferido)"""
+        return ", ".join(self.candidates(name))
+
+    @staticmethod
+    def _rank(entry, index):
+        if not entry:
+            # Sin historia: después de los que aciertan, antes de los muertos
+            return (-0.5, float("inf"), index)
+        hits, misses = entry.get("hits", 0), entry.get("misses", 0)
+        hit_rate = (hits + 1) / (hits + misses + 2)
+        average_ms = entry.get("avg_ms", float("inf")) if hits else float("inf")
+        return (-hit_rate, average_ms, index)
+
+    # ==================== ESTADÍSTICAS ====================
+
+    def record(self, name, matched, candidates, elapsed):
+        """
+        Anota una búsqueda: los candidatos en matched acertaron (en
+        elapsed segundos); el resto perdió contra ellos y cuenta un fallo.
+        Sin ningún acierto no hay nada que comparar y no se anota.
+        """
+        if not matched:
+            return
+        now = time.time()
+        elapsed_ms = elapsed * 1000
+        with self._lock:
+            stats = self._load().setdefault(name, {})
+            for selector in candidates:
+                entry = stats.setdefault(selector, {"hits": 0, "misses": 0})
+                if selector in matched:
+                    entry["hits"] += 1
+                    previous = entry.get("avg_ms")
+                    entry["avg_ms"] = round(elapsed_ms if previous is None
+                                            else previous + self.SMOOTHING * (elapsed_ms - previous), 2)
+                    entry["last_hit"] = round(now)
+                else:
+                    entry["misses"] += 1
+            self.dirty = True
+            due = time.monotonic() - self.saved_at >= self.SAVE_INTERVAL
+        if due:
+            self.save()
+
+    def snapshot(self, name):
+        """Estadísticas de un elemento: {selector: {hits, misses, avg_ms, last_hit}}"""
+        with self._lock:
+            return {selector: dict(entry) for selector, entry in self._load().get(name, {}).items()}
+
+    def reset(self):
+        with self._lock:
+            self.stats = {}
+            self.dirty = True
+
+    # ==================== PERSISTENCIA ====================
+
+    def _load(self):
+        if self.stats is None:
+            self.stats = {}
+            try:
+                with open(self.stats_file, encoding="utf-8") as file:
+                    data = json.load(file)
+                if isinstance(data, dict):
+                    self.stats = data
+            except (OSError, ValueError):
+                pass
+        return self.stats
+
+    def save(self):
+        """Escribe las estadísticas a disco (solo si cambiaron)"""
+        with self._lock:
+            if not self.dirty or self.stats is None:
+                return False
+            data = json.dumps(self.stats, indent=2, ensure_ascii=False)
+            self.dirty = False
+            self.saved_at = time.monotonic()
+        try:
+            directory = os.path.dirname(self.stats_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temporary = f"{self.stats_file}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.write(data)
+            os.replace(temporary, self.stats_file)
+            return True
+        except OSError:
+            return False
+
+
+# Instancia global del registro (las estadísticas se guardan al salir)
+selector_registry = SelectorRegistry()
+atexit.register(selector_registry.save)
@@ -0,0 +1,192 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from config.settings import settings
+
+
+class Span:
+    """Intervalo medido: nombre, categoría, duración, resultado y datos extra"""
+
+    __slots__ = ("name", "category", "start", "duration", "outcome", "args", "thread_id", "thread_name", "depth")
+
+    def __init__(self, name, category, start, args, depth):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = 0.0
+        self.outcome = "ok"
+        self.args = args
+        self.depth = depth
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+
+    def set(self, outcome=None, **args):
+        """Marca el resultado del span (ok, miss, timeout, error...) y agrega datos"""
+        if outcome is not None:
+            self.outcome = outcome
+        self.args.update(args)
+
+
+class _NullSpan:
+    """Span que no mide nada (trazado desactivado)"""
+
+    def set(self, outcome=None, **args):
+        pass
+
+
+class Tracer:
+    """
+    Trazado de spans anidados para ver en qué se va el tiempo de una ejecución.
+
+    - tracer.span(nombre, categoría, **datos): context manager
+    - @tracer.traced(nombre, categoría): decorador; un resultado falsy
+      (False/None, el fallo silencioso del proyecto) se marca como "miss"
+    - export(): formato Chrome Trace Event (chrome://tracing, Perfetto)
+    - summary(): tabla con los spans más lentos
+
+    Solo mide si está activo (TRACE_FILE definido o TRACE=true); si no,
+    cada span cuesta una comprobación de atributo.
+    """
+
+    NULL_SPAN = _NullSpan()
+
+    def __init__(self, enabled=None, max_spans=None):
+        self.enabled = settings.TRACE_ENABLED if enabled is None else enabled
+        self.max_spans = settings.TRACE_MAX_SPANS if max_spans is None else max_spans
+        self.spans = []
+        self.dropped = 0
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name, category="", **args):
+        if not self.enabled:
+            yield self.NULL_SPAN
+            return
+
+        stack = self._stack()
+        span = Span(name, category, time.perf_counter(), args, len(stack))
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set("error", error=type(e).__name__)
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start
+            stack.pop()
+            with self._lock:
+                if len(self.spans) < self.max_spans:
+                    self.spans.append(span)
+                else:
+                    self.dropped += 1
+
+    def traced(self, name=None, category=""):
+        """
+        Decorador de métodos: el primer argumento de texto (selector, URL)
+        queda como dato del span.
+        """
+        def decorator(function):
+            span_name = name or function.__name__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                target = next((arg for arg in args[1:2] if isinstance(arg, str)), None)
+                extra = {"target": target[:120]} if target else {}
+                with self.span(span_name, category, **extra) as span:
+                    result = function(*args, **kwargs)
+                    if not result:
+                        span.set("miss")
+                    return result
+            return wrapper
+        return decorator
+
+    def reset(self):
+        with self._lock:
+            self.spans = []
+            self.dropped = 0
+            self.origin = time.perf_counter()
+
+    # ==================== EXPORTACIÓN ====================
+
+    def to_chrome_trace(self):
+        """Eventos completos ("ph": "X") en microsegundos desde el inicio del trazado"""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+
+        events, threads = [], {}
+        for span in spans:
+            threads[span.thread_id] = span.thread_name
+            events.append({
+                "name": span.name,
+                "cat": span.category or "default",
+                "ph": "X",
+                "ts": round((span.start - self.origin) * 1_000_000, 1),
+                "dur": round(span.duration * 1_000_000, 1),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {"outcome": span.outcome, **span.args},
+            })
+        for thread_id, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path=None):
+        """Escribe la traza en JSON; retorna la ruta o None si no hay nada que escribir"""
+        path = path or settings.TRACE_FILE
+        if not path or not self.spans:
+            return None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome_trace(), file, ensure_ascii=False)
+        return path
+
+    def summary(self, limit=15):
+        """Tabla de los spans más lentos (texto listo para imprimir)"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.duration, reverse=True)[:limit]
+        if not spans:
+            return ""
+
+        lines = [
+            f"{'span':<34} {'categoría':<10} {'ms':>10} {'resultado':<10} detalle",
+            "─" * 90,
+        ]
+        for span in spans:
+            name = ("  " * span.depth + span.name)[:34]
+            detail = ", ".join(f"{key}={value}" for key, value in span.args.items())[:40]
+            lines.append(f"{name:<34} {span.category[:10]:<10} {span.duration * 1000:>10.1f} "
+                         f"{span.outcome:<10} {detail}")
+        if self.dropped:
+            lines.append(f"({self.dropped} spans descartados por TRACE_MAX_SPANS)")
+        return "\n".join(lines)
+
+    def finish(self, logger):
+        """Fin de ejecución: exporta la traza y muestra los spans más lentos"""
+        if not self.enabled or not self.spans:
+            return
+        path = self.export()
+        logger.raw("\n⏱️  SPANS MÁS LENTOS")
+        logger.raw(self.summary())
+        if path:
+            logger.info(f"🧵 Traza guardada en {path} (abrir en chrome://tracing o ui.perfetto.dev)")
+
+
+# Instancia global del trazador
+tracer = Tracer()
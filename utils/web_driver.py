@@ -1,27 +1,65 @@
+import os
+import time
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+from config.settings import settings
+from utils.driver_cache import DriverCache
+from utils.page_readiness import ReadinessEngine
+from utils.resource_policy import ResourcePolicy
 
 class WebDriverManager:
     """
     Gestor de WebDriver completamente funcional.
-    Configurado para cargar todos los recursos (imágenes, CSS, JS, etc.)
+    Por defecto carga todos los recursos (imágenes, CSS, JS, etc.);
+    RESOURCE_PROFILE=lean/minimal bloquea lo que no hace falta (ver ResourcePolicy).
     """
     
-    def __init__(self):
+    # Ocultar WebDriver, plugins e idiomas comunes
+    STEALTH_SCRIPT = """
+        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+        Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+        Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+    """
+    
+    def __init__(self, profile_dir=None, resource_profile=None, headless=None):
         self.driver = None
+        self.profile_dir = profile_dir
+        self.headless = settings.HEADLESS if headless is None else headless
+        self.resource_policy = ResourcePolicy(resource_profile)
+        self.driver_cache = DriverCache()
+        # Segundos por fase del último arranque (resolución, lanzamiento, cdp, stealth)
+        self.startup_report = {}
+        self._readiness = None
     
     def setup_driver(self):
         """
         Configura el navegador Chrome con opciones optimizadas para LinkedIn.
         Carga completa de recursos: imágenes, CSS, JS, fuentes, etc.
         """
+        self.startup_report = {}
+        phase_start = time.perf_counter()
         chrome_options = Options()
         
         # ==================== CONFIGURACIÓN DE VENTANA ====================
-        chrome_options.add_argument("--start-maximized")
+        if self.headless:
+            # Servidores sin pantalla: tamaño fijo y determinista
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument(f"--window-size={settings.WINDOW_WIDTH},{settings.WINDOW_HEIGHT}")
+            chrome_options.add_argument("--hide-scrollbars")
+            chrome_options.add_argument("--mute-audio")
+            # Sin ventana visible Chrome trata todas las pestañas como de fondo:
+            # evitar que retrase renderer, timers y pestañas ocultas
+            chrome_options.add_argument("--disable-renderer-backgrounding")
+            chrome_options.add_argument("--disable-background-timer-throttling")
+            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        else:
+            chrome_options.add_argument("--start-maximized")
+        
+        # ==================== PERFIL ====================
+        # Perfil propio por navegador (necesario para varios Chrome en paralelo)
+        if self.profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.profile_dir)}")
         
         # ==================== CONFIGURACIÓN ANTI-DETECCIÓN ====================
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
@@ -32,21 +70,16 @@ class WebDriverManager:
         chrome_options.add_argument("--lang=en-US")
         
         # ==================== CONFIGURACIÓN DE USER AGENT ====================
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
-        
-        # ==================== CONFIGURACIÓN DE CARGA COMPLETA ====================
-        # CRÍTICO: Habilitar TODAS las imágenes y recursos
+        chrome_options.add_argument(f"user-agent={settings.USER_AGENT}")
+        
+        # ==================== CONFIGURACIÓN DE CARGA DE RECURSOS ====================
+        # Perfil full: TODAS las imágenes y recursos. lean/minimal: ver ResourcePolicy
         chrome_options.add_experimental_option('prefs', {
             # Idioma y región
             'intl.accept_languages': 'en-US,en',
             
-            # CARGAR TODAS LAS IMÁGENES (foto de perfil, logos, etc.)
-            'profile.managed_default_content_settings.images': 1,  # 1 = PERMITIR, 2 = BLOQUEAR
-            'profile.default_content_setting_values.images': 1,
+            # Imágenes y plugins según el perfil de recursos (1 = PERMITIR, 2 = BLOQUEAR)
+            **self.resource_policy.chrome_prefs(),
             
             # Habilitar JavaScript
             'profile.managed_default_content_settings.javascript': 1,
@@ -57,9 +90,6 @@ class WebDriverManager:
             # Habilitar cookies
             'profile.managed_default_content_settings.cookies': 1,
             
-            # Habilitar plugins
-            'profile.managed_default_content_settings.plugins': 1,
-            
             # Habilitar notificaciones (opcional, puede deshabilitarse)
             'profile.default_content_setting_values.notifications': 2,  # 2 = BLOQUEAR
             
@@ -83,51 +113,71 @@ class WebDriverManager:
         chrome_options.add_argument("--disable-web-security")  # SOLO para testing, no usar en producción
         chrome_options.add_argument("--allow-running-insecure-content")
         
+        # Log de rendimiento: expone los eventos CDP Network.*/Page.* que usa
+        # la detección de página lista (red ociosa)
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        self._mark_phase("opciones", phase_start)
+        
         # ==================== CREAR DRIVER ====================
-        service = Service(ChromeDriverManager().install())
+        # Resolución de ChromeDriver cacheada: solo se vuelve a resolver
+        # (y descargar) cuando cambia la versión de Chrome
+        phase_start = time.perf_counter()
+        driver_path = self.driver_cache.resolve()
+        service = Service(driver_path) if driver_path else Service()
+        self._mark_phase("resolución", phase_start)
+        
+        phase_start = time.perf_counter()
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self._mark_phase("lanzamiento", phase_start)
         
-        # ==================== SCRIPTS ANTI-DETECCIÓN ====================
-        # Ocultar que estamos usando WebDriver
-        self.driver.execute_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        )
-        
+        # ==================== CDP Y TIMEOUTS ====================
+        phase_start = time.perf_counter()
         # Sobrescribir el objeto navigator para parecer más humano
         self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
+            "userAgent": settings.USER_AGENT
         })
         
-        # Agregar plugins comunes
-        self.driver.execute_script("""
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-        """)
+        # Política única: sin espera implícita (se multiplicaría con las
+        # explícitas de ElementFinder), timeouts de página y script
+        settings.WAIT_POLICY.apply_to_driver(self.driver)
         
-        # Agregar idiomas
-        self.driver.execute_script("""
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-        """)
+        # Viewport determinista en headless (independiente del entorno)
+        if self.headless:
+            self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+                "width": settings.WINDOW_WIDTH,
+                "height": settings.WINDOW_HEIGHT,
+                "deviceScaleFactor": 1,
+                "mobile": False
+            })
         
-        # ==================== TIMEOUTS ====================
-        # Timeout implícito más largo para permitir carga completa
-        self.driver.implicitly_wait(5)
+        # Perfil de recursos: bloqueo por CDP (las páginas pueden rehabilitar categorías)
+        self.resource_policy.attach(self.driver)
+        self.resource_policy.apply(self.driver)
+        self._mark_phase("cdp", phase_start)
         
-        # Timeout de página completo
-        self.driver.set_page_load_timeout(30)
-        
-        # Timeout de script
-        self.driver.set_script_timeout(30)
+        # ==================== SCRIPTS ANTI-DETECCIÓN ====================
+        # Un solo comando CDP que se ejecuta en CADA documento nuevo
+        # (antes se aplicaban con execute_script solo a la página en blanco)
+        phase_start = time.perf_counter()
+        self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+            "source": self.STEALTH_SCRIPT
+        })
+        self._mark_phase("stealth", phase_start)
         
         return self.driver
     
+    # ==================== TIEMPOS DE ARRANQUE ====================
+    
+    def _mark_phase(self, phase, started_at):
+        self.startup_report[phase] = time.perf_counter() - started_at
+    
+    def format_startup_report(self):
+        """Resumen de una línea: tiempo total y por fase del arranque"""
+        total = sum(self.startup_report.values())
+        phases = " · ".join(f"{phase} {seconds:.2f}s" for phase, seconds in self.startup_report.items())
+        source = f" [driver: {self.driver_cache.source}]" if self.driver_cache.source else ""
+        return f"Driver listo en {total:.2f}s ({phases}){source}"
+    
     def teardown_driver(self):
         """
         Cierra el navegador.
@@ -136,28 +186,16 @@ class WebDriverManager:
         if self.driver:
             self.driver.quit()
     
-    def wait_for_navigation(self, timeout=15):
+    def wait_for_navigation(self, timeout=None):
         """
-        Espera inteligente a que la navegación termine COMPLETAMENTE.
-        Espera a que se carguen todos los recursos.
+        Espera inteligente a que la navegación termine.
+        Usa señales reales (DOM en reposo y red ociosa) en lugar de esperas fijas.
+        Retorna el ReadinessReport de la espera.
         """
-        try:
-            # Esperar a que el documento esté completo
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            
-            # Esperar adicional para recursos asíncronos (imágenes, fuentes, etc.)
-            import time
-            time.sleep(1)
-            
-        except:
-            pass
+        return self._get_readiness().wait(timeout=timeout)
     
-    def navigate_and_wait(self, url):
-        """
-        Navega y espera de forma inteligente a carga completa.
-        Método interno - no genera logs.
-        """
-        self.driver.get(url)
-        self.wait_for_navigation(15)
\ No newline at end of file
+    def _get_readiness(self):
+        """Motor de página lista asociado al driver actual"""
+        if self._readiness is None or self._readiness.driver is not self.driver:
+            self._readiness = ReadinessEngine(self.driver)
+        return self._readiness
\ No newline at end of file